@@ -0,0 +1,84 @@
+"""
+Decoded-asset cache shared by the sticker and stand generators.
+
+load() decodes a source image (logo, QR, hero photo) once per process and
+mode; resized() memoizes resized variants by (path, size, mode, resample),
+so a run that needs the same (asset, size) several times resizes it once.
+Returned images are shared: treat them as read-only (crop / copy before
+modifying them in place).
+
+Set STICKER_ASSET_CACHE to a directory (e.g. .asset_cache, gitignored) to
+also persist resized variants on disk across runs and processes. Entries are
+keyed by the SHA-1 of the source file, so editing an asset invalidates them.
+"""
+from PIL import Image
+import hashlib
+import os
+
+DISK_CACHE_DIR = os.environ.get('STICKER_ASSET_CACHE') or None
+
+_decoded = {}
+_resized = {}
+_hashes = {}
+_stats = {'decodes': 0, 'resizes': 0, 'hits': 0, 'disk_hits': 0}
+
+def load(path, mode='RGBA'):
+    """Source image at path, converted to mode, decoded once per process."""
+    key = (os.path.abspath(path), mode)
+    img = _decoded.get(key)
+    if img is None:
+        with Image.open(path) as src:
+            img = src.convert(mode)
+        _decoded[key] = img
+        _stats['decodes'] += 1
+    return img
+
+def source_hash(path):
+    path = os.path.abspath(path)
+    digest = _hashes.get(path)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        _hashes[path] = digest
+    return digest
+
+def _disk_path(path, size, mode, resample):
+    name = f"{source_hash(path)[:16]}_{size[0]}x{size[1]}_{mode}_{int(resample)}.png"
+    return os.path.join(DISK_CACHE_DIR, name)
+
+def resized(path, size, mode='RGBA', resample=Image.LANCZOS):
+    """load(path, mode) resized to size = (w, h), memoized (and persisted if the disk cache is on)."""
+    size = (int(size[0]), int(size[1]))
+    key = (os.path.abspath(path), size, mode, resample)
+    img = _resized.get(key)
+    if img is not None:
+        _stats['hits'] += 1
+        return img
+
+    disk_path = _disk_path(path, size, mode, resample) if DISK_CACHE_DIR else None
+    if disk_path and os.path.exists(disk_path):
+        with Image.open(disk_path) as cached:
+            img = cached.convert(mode)
+        _stats['disk_hits'] += 1
+    else:
+        img = load(path, mode).resize(size, resample)
+        _stats['resizes'] += 1
+        if disk_path:
+            os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+            # Write then rename, so parallel workers never read a partial file
+            tmp_path = f"{disk_path}.{os.getpid()}.tmp"
+            img.save(tmp_path, 'PNG', compress_level=1)
+            os.replace(tmp_path, disk_path)
+    _resized[key] = img
+    return img
+
+def cache_info():
+    """Counters: decodes, resizes, hits (memory) and disk_hits, plus entry counts."""
+    return dict(_stats, decoded_entries=len(_decoded), resized_entries=len(_resized))
+
+def clear_cache():
+    _decoded.clear()
+    _resized.clear()
+    _hashes.clear()
+    for k in _stats:
+        _stats[k] = 0
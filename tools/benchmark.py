@@ -0,0 +1,348 @@
+"""
+Benchmark suite for the print generators: every catalog sticker, every sheet
+mode of generate_sticker_sheet.py, the stand designs v1 - v9_ar and the two
+photo optimizers.
+
+Everything runs in a throwaway sandbox (copy of tools/ + synthetic assets),
+so it works offline, needs none of the real photos and never touches the
+committed images. Each case runs in its own process; per case we record
+  wall   wall-clock seconds
+  cpu    user + system CPU seconds of the process
+  rss    peak resident memory (MB)
+  bytes  total size of the files the case writes
+(median of --repeat runs; cpu / rss are not available on Windows).
+
+Every run is appended to a JSON history file, and compared against a stored
+baseline: a case regresses when a metric exceeds the baseline by more than
+its threshold (and by more than a small absolute amount, so a 40 ms sticker
+does not fail on noise). Regressions make the script exit with status 1.
+
+Usage:
+  python tools/benchmark.py [group|case ...]          (groups: stickers sheets stands photos)
+      [--repeat N] [--save-baseline] [--baseline PATH] [--history PATH] [--no-compare]
+  e.g. python tools/benchmark.py stands --repeat 3
+       python tools/benchmark.py stand_v9 --save-baseline
+
+Machines without Arial or its open fallbacks can set STICKER_ALLOW_DEFAULT_FONT=1
+(see tools/fonts.py); timings are then not comparable with real-font runs.
+"""
+from PIL import Image, ImageDraw
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Paths
+tools_dir = os.path.dirname(os.path.abspath(__file__))
+root = os.path.dirname(tools_dir)
+BENCH_DIR = os.path.join(root, '.benchmarks')
+DEFAULT_HISTORY = os.path.join(BENCH_DIR, 'history.json')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+sys.path.append(tools_dir)
+from sticker_engine import load_catalog
+from qr_encoder import qr_image
+
+# Allowed growth over the baseline (ratio) and the minimum absolute change
+# that counts, per metric
+THRESHOLDS = {
+    'wall': (1.25, 0.10),
+    'cpu': (1.25, 0.10),
+    'rss': (1.15, 20.0),
+    'bytes': (1.05, 4096),
+}
+
+STAND_SCRIPTS = ['generate_stand.py'] + [f'generate_stand_v{v}.py' for v in range(2, 10)] + ['generate_stand_v9_ar.py']
+SHEET_MODES = ['mixed', 'en', 'ar', 'variations', 'mixed_sizes']
+SYNTHETIC_PHOTOS = 4
+PHOTO_SIZE = (5472, 3648)  # 20 MP camera frame, ~9-14 MB as a high quality JPEG
+
+# --- Synthetic assets ---
+def synthetic_logo(path, size=(810, 636)):
+    """Stand-in for logo_circular.png: RGBA, transparent corners, green disc with detail."""
+    w, h = size
+    img = Image.new('RGBA', size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    r = min(w, h) // 2 - 4
+    cx, cy = w // 2, h // 2
+    draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=(46, 125, 50, 255))
+    draw.ellipse((cx - r * 2 // 3, cy - r * 2 // 3, cx + r * 2 // 3, cy + r * 2 // 3), fill=(255, 255, 255, 255))
+    for i in range(12):
+        draw.pieslice((cx - r // 2, cy - r // 2, cx + r // 2, cy + r // 2), i * 30, i * 30 + 18,
+                      fill=(27, 94, 32, 255))
+    img.save(path, 'PNG')
+
+def synthetic_photo(path, size, seed, quality=95):
+    """Photo-like RGB JPEG: smooth gradients plus sensor-like noise (compresses like a real photo)."""
+    rng = np.random.default_rng(seed)
+    w, h = size
+    y = np.linspace(0, 1, h, dtype=np.float32)[:, None]
+    x = np.linspace(0, 1, w, dtype=np.float32)[None, :]
+    base = np.stack([120 + 80 * np.sin(3 * x + 2 * y + c) for c in (0.0, 1.0, 2.0)], axis=-1)
+    noise = rng.normal(0, 12, (h, w, 1)).astype(np.float32)
+    arr = np.clip(base + noise, 0, 255).astype(np.uint8)
+    Image.fromarray(arr, 'RGB').save(path, 'JPEG', quality=quality)
+
+def make_sandbox():
+    sandbox = tempfile.mkdtemp(prefix='tools_bench_')
+    shutil.copytree(tools_dir, os.path.join(sandbox, 'tools'), ignore=shutil.ignore_patterns('__pycache__'))
+    images = os.path.join(sandbox, 'images')
+    os.makedirs(images)
+    synthetic_logo(os.path.join(images, 'logo_circular.png'))
+    qr_image("https://tadweer-tech-sy.org", 600).save(os.path.join(images, 'qr_website.png'))
+    synthetic_photo(os.path.join(images, 'tadweer_image.jpeg'), (507, 425), seed=0, quality=90)
+
+    photos = os.path.join(sandbox, 'synthetic_photos')
+    os.makedirs(photos)
+    for i in range(SYNTHETIC_PHOTOS):
+        synthetic_photo(os.path.join(photos, f'2U7A{i + 17:04d}.jpg'), PHOTO_SIZE, seed=i + 1)
+    return sandbox
+
+# --- Cases ---
+class Case:
+    """One benchmarked process: argv run in the sandbox, writing outputs (sandbox-relative)."""
+    def __init__(self, name, group, argv, outputs, setup=None):
+        self.name = name
+        self.group = group
+        self.argv = argv
+        self.outputs = outputs
+        self.setup = setup
+
+def _code(*lines):
+    return [sys.executable, '-c', '\n'.join(lines)]
+
+def _copy_photos(sandbox, dest):
+    """Fresh synthetic originals in dest (the event optimizer overwrites in place)."""
+    dest = os.path.join(sandbox, dest)
+    shutil.rmtree(dest, ignore_errors=True)
+    shutil.copytree(os.path.join(sandbox, 'synthetic_photos'), dest)
+
+def _ensure_stickers(sandbox):
+    """Sheets paste rendered stickers; render them (untimed) if the sticker cases did not run."""
+    if not os.path.exists(os.path.join(sandbox, 'images', 'tadweer_sticker.png')):
+        subprocess.run([sys.executable, os.path.join('tools', 'sticker_engine.py'), 'render-all'],
+                       cwd=sandbox, check=True, stdout=subprocess.DEVNULL)
+
+def build_cases():
+    cases = []
+    for spec in load_catalog():
+        base = os.path.splitext(spec['output'])[0]
+        outputs = [f"images/{base}.{fmt}" for fmt in spec.get('formats', ['png'])]
+        cases.append(Case(f"sticker_{spec['name']}", 'stickers',
+                          [sys.executable, 'tools/sticker_engine.py', spec['name']], outputs))
+
+    for mode in SHEET_MODES:
+        out = f'images/sticker_sheet_a4_{mode}.png'
+        cases.append(Case(f'sheet_{mode}', 'sheets', _code(
+            "import sys; sys.path.insert(0, 'tools')",
+            "import generate_sticker_sheet as g",
+            "g.load_stickers()",
+            f"g.create_sheet({mode!r}).save({out!r}, 'PNG', dpi=(300, 300))"), [out], setup=_ensure_stickers))
+
+    for script in STAND_SCRIPTS:
+        version = script[len('generate_stand'):-3].lstrip('_') or 'v1'
+        suffix = '' if version == 'v1' else f'_{version}'
+        cases.append(Case(f'stand_{version}', 'stands', [sys.executable, f'tools/{script}'],
+                          [f'images/stand_design_80x200{suffix}.png']))
+
+    # optimize_real_photos.py reads from a hardcoded download folder: point it at the sandbox
+    cases.append(Case('photos_event', 'photos', [sys.executable, 'tools/optimize_event_images.py'],
+                      ['images/events_launch'], setup=lambda s: _copy_photos(s, 'images/events_launch')))
+    cases.append(Case('photos_real', 'photos', _code(
+        "import sys; from pathlib import Path; sys.path.insert(0, 'tools')",
+        "import optimize_real_photos as o",
+        "o.SOURCE_DIR = Path('launch_photos'); o.DEST_DIR = Path('images/events_real')",
+        "o.main()"), ['images/events_real'], setup=lambda s: _copy_photos(s, 'launch_photos')))
+    return cases
+
+def select_cases(cases, keys):
+    """Cases matching any key: a group name, or a substring of the case name."""
+    if not keys:
+        return cases
+    return [c for c in cases if any(k == c.group or k in c.name for k in keys)]
+
+# --- Measurement ---
+def output_bytes(sandbox, outputs):
+    total = 0
+    for rel in outputs:
+        path = os.path.join(sandbox, rel)
+        if os.path.isdir(path):
+            total += sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(path) for f in files)
+        elif os.path.exists(path):
+            total += os.path.getsize(path)
+    return total
+
+# Cases are started from a fresh, small launcher process: on Linux a child
+# inherits its parent's peak RSS across fork + exec, and this process holds
+# the synthetic photos. The launcher reports the case's rusage as JSON.
+LAUNCHER = """
+import json, os, subprocess, sys, time
+start = time.perf_counter()
+proc = subprocess.Popen(sys.argv[1:], stdout=subprocess.DEVNULL)
+_, status, usage = os.wait4(proc.pid, 0)
+print(json.dumps([os.waitstatus_to_exitcode(status), time.perf_counter() - start,
+                  usage.ru_utime + usage.ru_stime, usage.ru_maxrss]))
+"""
+
+def run_once(sandbox, case):
+    """Wall / CPU seconds, peak RSS (MB) and output bytes of one run of case."""
+    if case.setup:
+        case.setup(sandbox)
+    env = dict(os.environ)
+    env.pop('STICKER_ASSET_CACHE', None)  # measure cold renders
+    if hasattr(os, 'wait4'):
+        out = subprocess.run([sys.executable, '-c', LAUNCHER] + case.argv, cwd=sandbox, env=env,
+                             capture_output=True, text=True, check=True).stdout
+        returncode, wall, cpu, maxrss = json.loads(out.splitlines()[-1])
+        # ru_maxrss is in KB on Linux, bytes on macOS
+        rss = maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+    else:
+        start = time.perf_counter()
+        returncode = subprocess.run(case.argv, cwd=sandbox, env=env, stdout=subprocess.DEVNULL).returncode
+        wall = time.perf_counter() - start
+        cpu = rss = None
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, case.argv)
+    return {'wall': wall, 'cpu': cpu, 'rss': rss, 'bytes': output_bytes(sandbox, case.outputs)}
+
+def measure(sandbox, case, repeat):
+    runs = [run_once(sandbox, case) for _ in range(repeat)]
+    result = {}
+    for metric in THRESHOLDS:
+        values = [r[metric] for r in runs if r[metric] is not None]
+        result[metric] = statistics.median(values) if values else None
+    return result
+
+# --- History / baseline ---
+def _read_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1)
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_record(results, repeat):
+    from PIL import __version__ as pillow_version
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'host': platform.node(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'pillow': pillow_version,
+        'cpus': os.cpu_count(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+def compare(results, baseline):
+    """List of (case, metric, baseline, current) exceeding THRESHOLDS."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric, (ratio, min_delta) in THRESHOLDS.items():
+            old, new = base.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * ratio and new - old > min_delta:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+def _fmt(value, metric):
+    if value is None:
+        return '-'
+    if metric == 'bytes':
+        return f"{value / 1024:.0f}K"
+    if metric == 'rss':
+        return f"{value:.0f}M"
+    return f"{value:.2f}s"
+
+def print_table(results, baseline):
+    header = f"{'case':44s}" + ''.join(f"{m:>10s}" for m in THRESHOLDS) + f"{'vs base':>10s}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        base = baseline.get(name, {}).get('wall')
+        delta = f"{(r['wall'] / base - 1) * 100:+.0f}%" if base else ''
+        print(f"{name:44s}" + ''.join(f"{_fmt(r[m], m):>10s}" for m in THRESHOLDS) + f"{delta:>10s}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the print generators on synthetic assets.")
+    parser.add_argument('keys', nargs='*', help="groups (stickers, sheets, stands, photos) or case names")
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--history', default=DEFAULT_HISTORY)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the baseline")
+    parser.add_argument('--no-compare', action='store_true')
+    parser.add_argument('--list', action='store_true')
+    args = parser.parse_args()
+
+    cases = select_cases(build_cases(), args.keys)
+    if args.list or not cases:
+        for c in cases:
+            print(f"{c.group:10s} {c.name}")
+        if not cases:
+            sys.exit(f"No cases match: {' '.join(args.keys)}")
+        return
+
+    print("Preparing sandbox with synthetic assets...")
+    sandbox = make_sandbox()
+    try:
+        results = {}
+        for case in cases:
+            results[case.name] = measure(sandbox, case, args.repeat)
+            print(f"  {case.name}: {results[case.name]['wall']:.2f}s")
+    finally:
+        shutil.rmtree(sandbox, ignore_errors=True)
+
+    history = _read_json(args.history, [])
+    history.append(run_record(results, args.repeat))
+    _write_json(args.history, history)
+
+    baseline = _read_json(args.baseline, {}).get('results', {})
+    print()
+    print_table(results, baseline)
+    print(f"\nAppended to {args.history}")
+
+    if args.save_baseline:
+        # Merge, so a partial run only replaces the baseline of the cases it ran
+        stored = _read_json(args.baseline, {})
+        record = run_record(dict(stored.get('results', {}), **results), args.repeat)
+        _write_json(args.baseline, record)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if args.no_compare or not baseline:
+        return
+    regressions = compare(results, baseline)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+        for name, metric, old, new in regressions:
+            print(f"  {name} {metric}: {_fmt(old, metric)} -> {_fmt(new, metric)} ({(new / old - 1) * 100:+.0f}%)")
+        sys.exit(1)
+    print(f"No regressions against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark the sticker generators at different supersampling factors.
+Each generator runs in a throwaway copy of tools/ + the assets it needs,
+so the committed images in images/ are never touched.
+
+Usage: python tools/benchmark_supersample.py [k ...]   (default: 1 2 4)
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Paths
+tools_dir = os.path.dirname(os.path.abspath(__file__))
+root = os.path.dirname(tools_dir)
+images_dir = os.path.join(root, 'images')
+
+SCRIPTS = [
+    'generate_sticker.py',
+    'generate_sticker_ar.py',
+    'generate_small_stickers.py',
+    'generate_variations.py',
+    'generate_sticker_variations.py',
+    'generate_sticker_variations_square.py',
+]
+ASSETS = ['logo_circular.png', 'qr_website.png']
+
+def make_sandbox():
+    sandbox = tempfile.mkdtemp(prefix='sticker_bench_')
+    shutil.copytree(tools_dir, os.path.join(sandbox, 'tools'), ignore=shutil.ignore_patterns('__pycache__'))
+    os.makedirs(os.path.join(sandbox, 'images'))
+    for name in ASSETS:
+        shutil.copy(os.path.join(images_dir, name), os.path.join(sandbox, 'images', name))
+    return sandbox
+
+def run_script(sandbox, script, factor):
+    env = dict(os.environ, STICKER_SUPERSAMPLE=str(factor))
+    start = time.perf_counter()
+    subprocess.run([sys.executable, os.path.join(sandbox, 'tools', script)],
+                   env=env, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+def main(factors):
+    sandbox = make_sandbox()
+    try:
+        results = {script: {} for script in SCRIPTS}
+        for factor in factors:
+            for script in SCRIPTS:
+                results[script][factor] = run_script(sandbox, script, factor)
+
+        header = f"{'script':40s}" + ''.join(f"{'k=' + str(k):>10s}" for k in factors)
+        print(header)
+        print('-' * len(header))
+        for script in SCRIPTS:
+            print(f"{script:40s}" + ''.join(f"{results[script][k]:9.2f}s" for k in factors))
+        totals = [sum(results[s][k] for s in SCRIPTS) for k in factors]
+        print('-' * len(header))
+        print(f"{'total':40s}" + ''.join(f"{t:9.2f}s" for t in totals))
+    finally:
+        shutil.rmtree(sandbox, ignore_errors=True)
+
+if __name__ == "__main__":
+    factors = [int(a) for a in sys.argv[1:]] or [1, 2, 4]
+    main(factors)
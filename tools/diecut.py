@@ -0,0 +1,249 @@
+"""
+Die-cut contours: the cut path of a sticker, derived from its alpha channel.
+
+  1. marching squares over the alpha channel (vectorized with NumPy; edge
+     crossings are interpolated on the anti-aliased alpha, so the outline is
+     sub-pixel accurate)
+  2. outer outlines only (holes and specks below min_area are dropped)
+  3. Douglas-Peucker simplification to tolerance px
+  4. pushed outward by offset (mitered polygon offset: exact for convex
+     stickers such as circles and rounded squares)
+
+Contours are in image pixels. sheet_contours() places them on a sheet layout
+((image, x, y) placements, as produced by generate_sticker_sheet /
+imposition), computing each distinct sticker once. It is the supported route
+for sheets: tracing a whole A4 mask at 300 DPI takes 1-2 s and traces every
+copy of a sticker again, while a sheet of one design costs one ~709 px trace
+(generate_sticker_sheet.py --cut goes through it). The result goes into a
+"CutContour" spot-color layer: SvgDocument.cut_contour() for SVG, and
+PdfPage.cut_contour() for the streamed PDFs.
+
+Usage:
+  python tools/diecut.py IMAGE ... [--offset MM] [--tolerance PX] [--dpi 300]
+  (writes IMAGE_cut.svg next to each image; paths relative to images/ unless absolute)
+  For single sticker images; cut a sheet with generate_sticker_sheet.py --cut.
+"""
+from PIL import Image, ImageFilter
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add current directory to path to import sticker_vector
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from sticker_vector import SvgDocument
+
+# Paths
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+images_dir = os.path.join(root, 'images')
+
+CUT_SPOT_NAME = 'CutContour'
+
+# --- Marching squares ---
+# Cell corners: tl = 8, tr = 4, br = 2, bl = 1 (set when inside). Cell edges:
+# 0 = top, 1 = right, 2 = bottom, 3 = left. Saddles (5, 10) cut off the two
+# inside corners separately.
+_SEGMENTS = {
+    1: [(3, 2)], 2: [(2, 1)], 3: [(3, 1)], 4: [(1, 0)], 5: [(1, 0), (3, 2)], 6: [(2, 0)],
+    7: [(3, 0)], 8: [(0, 3)], 9: [(0, 2)], 10: [(0, 3), (2, 1)], 11: [(0, 1)], 12: [(1, 3)],
+    13: [(1, 2)], 14: [(2, 3)],
+}
+_EDGE_MID = {0: (0.5, 0), 1: (1, 0.5), 2: (0.5, 1), 3: (0, 0.5)}
+_CORNERS = {8: (0, 0), 4: (1, 0), 2: (1, 1), 1: (0, 1)}
+
+def _oriented_tables():
+    """Per case, up to two (from, to) edges, oriented so the inside is on the same side."""
+    src = np.full((16, 2), -1, dtype=np.int64)
+    dst = np.full((16, 2), -1, dtype=np.int64)
+    for case, segments in _SEGMENTS.items():
+        for k, (a, b) in enumerate(segments):
+            (ax, ay), (bx, by) = _EDGE_MID[a], _EDGE_MID[b]
+            score = 0
+            for bit, (cx, cy) in _CORNERS.items():
+                side = np.sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+                score += side * (1 if case & bit else -1)
+            if score < 0:
+                a, b = b, a
+            src[case, k], dst[case, k] = a, b
+    return src, dst
+
+_SRC, _DST = _oriented_tables()
+
+def trace(alpha, threshold=128):
+    """
+    Closed contours (N x 2 float arrays of x, y in image pixels) of the region
+    where alpha >= threshold. Outer outlines and holes have opposite orientation.
+    """
+    a = np.pad(np.asarray(alpha, dtype=np.float32), 1)
+    inside = a >= threshold
+    h, w = inside.shape
+    case = (inside[:-1, :-1] * 8 + inside[:-1, 1:] * 4 + inside[1:, 1:] * 2 + inside[1:, :-1] * 1)
+    ci, cj = np.nonzero((case > 0) & (case < 15))
+    if not len(ci):
+        return []
+    cases = case[ci, cj]
+
+    # Edge ids: horizontal edge (i, j) joins grid points (i, j)-(i, j+1), vertical (i, j)-(i+1, j)
+    def edge_ids(edge, i, j):
+        return np.select([edge == 0, edge == 1, edge == 2],
+                         [i * w + j, h * w + i * w + j + 1, (i + 1) * w + j],
+                         h * w + i * w + j)
+
+    starts, ends = [], []
+    for k in range(2):
+        e0, e1 = _SRC[cases, k], _DST[cases, k]
+        used = e0 >= 0
+        starts.append(edge_ids(e0[used], ci[used], cj[used]))
+        ends.append(edge_ids(e1[used], ci[used], cj[used]))
+    starts = np.concatenate(starts)
+    ends = np.concatenate(ends)
+
+    # Crossing point on each edge, interpolated on alpha
+    horizontal = starts < h * w
+    idx = np.where(horizontal, starts, starts - h * w)
+    i, j = idx // w, idx % w
+    i2 = np.where(horizontal, i, i + 1)
+    j2 = np.where(horizontal, j + 1, j)
+    a0, a1 = a[i, j], a[i2, j2]
+    t = np.clip((threshold - a0) / np.where(a1 == a0, 1, a1 - a0), 0, 1)
+    # Padded grid point (i, j) is the center of pixel (i - 1, j - 1)
+    xs = j + np.where(horizontal, t, 0) - 0.5
+    ys = i + np.where(horizontal, 0, t) - 0.5
+
+    following = dict(zip(starts.tolist(), ends.tolist()))
+    position = dict(zip(starts.tolist(), range(len(starts))))
+    contours = []
+    for start in starts.tolist():
+        if start not in following:
+            continue
+        chain = []
+        edge = start
+        while edge in following:
+            chain.append(position[edge])
+            edge = following.pop(edge)
+        contours.append(np.stack([xs[chain], ys[chain]], axis=1))
+    return contours
+
+# --- Geometry ---
+def signed_area(poly):
+    x, y = poly[:, 0], poly[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+def offset(poly, distance, miter_limit=2):
+    """
+    Polygon pushed distance px outward (mitered vertices, miters capped at
+    miter_limit x distance). Exact for convex outlines.
+    """
+    if not distance:
+        return poly
+    edges = np.roll(poly, -1, axis=0) - poly
+    normals = np.stack([edges[:, 1], -edges[:, 0]], axis=1)
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-9)
+    # Outward side depends on the orientation
+    if signed_area(poly) < 0:
+        normals = -normals
+    # Vertex i joins edge i - 1 and edge i
+    prev = np.roll(normals, 1, axis=0)
+    bisector = prev + normals
+    bisector /= np.maximum(np.linalg.norm(bisector, axis=1, keepdims=True), 1e-9)
+    cos_half = np.maximum(np.sum(bisector * normals, axis=1, keepdims=True), 1 / miter_limit)
+    return poly + bisector * (distance / cos_half)
+
+def simplify(poly, tolerance):
+    """Douglas-Peucker on a closed polygon (split at the vertex farthest from the first)."""
+    if len(poly) < 4 or tolerance <= 0:
+        return poly
+    far = int(np.argmax(np.linalg.norm(poly - poly[0], axis=1)))
+    first = _douglas_peucker(poly[:far + 1], tolerance)
+    second = _douglas_peucker(np.vstack([poly[far:], poly[:1]]), tolerance)
+    return np.vstack([first[:-1], second[:-1]])
+
+def _douglas_peucker(points, tolerance):
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
+        p, q = points[lo], points[hi]
+        seg = points[lo + 1:hi]
+        d = q - p
+        length = np.hypot(d[0], d[1])
+        if length == 0:
+            dist = np.linalg.norm(seg - p, axis=1)
+        else:
+            dist = np.abs(d[0] * (seg[:, 1] - p[1]) - d[1] * (seg[:, 0] - p[0])) / length
+        k = int(np.argmax(dist))
+        if dist[k] > tolerance:
+            mid = lo + 1 + k
+            keep[mid] = True
+            stack.append((lo, mid))
+            stack.append((mid, hi))
+    return points[keep]
+
+# --- Stickers and sheets ---
+def sticker_contours(img, offset_px=0, tolerance=0.5, threshold=128, min_area=64, smooth=1):
+    """
+    Cut outlines of an RGBA sticker image (list of N x 2 arrays, image px).
+    One sticker at a time: for a sheet, use sheet_contours with its layout.
+    smooth: box blur radius applied to alpha first, so hard-edged (aliased)
+    artwork traces as a smooth curve rather than a pixel staircase.
+    """
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    alpha = img.getchannel('A')
+    if smooth:
+        alpha = alpha.filter(ImageFilter.BoxBlur(smooth))
+    contours = trace(alpha, threshold)
+    outer_sign = np.sign(signed_area(max(contours, key=lambda c: abs(signed_area(c))))) if contours else 0
+    result = []
+    for c in contours:
+        area = signed_area(c)
+        if np.sign(area) != outer_sign or abs(area) < min_area:
+            continue
+        result.append(offset(simplify(c, tolerance), offset_px))
+    return result
+
+def sheet_contours(placements, offset_px=0, tolerance=0.5):
+    """Cut outlines for (image, x, y) placements in sheet px; each distinct image is traced once."""
+    traced = {}
+    result = []
+    for img, x, y in placements:
+        contours = traced.get(id(img))
+        if contours is None:
+            contours = traced[id(img)] = sticker_contours(img, offset_px, tolerance)
+        result.extend(c + (x, y) for c in contours)
+    return result
+
+def cut_svg(contours, size, dpi=300):
+    """SvgDocument of size px with contours on the CutContour layer."""
+    doc = SvgDocument(size[0], size[1], dpi)
+    doc.cut_contour(contours, CUT_SPOT_NAME)
+    return doc
+
+def main():
+    parser = argparse.ArgumentParser(description="Die-cut contour (SVG) from sticker alpha.",
+                                     epilog="For sheets, use generate_sticker_sheet.py --cut (traces each sticker once).")
+    parser.add_argument('images', nargs='+')
+    parser.add_argument('--offset', type=float, default=0, help="mm outward from the artwork edge")
+    parser.add_argument('--tolerance', type=float, default=0.5, help="simplification tolerance in px")
+    parser.add_argument('--dpi', type=int, default=300)
+    args = parser.parse_args()
+
+    for name in args.images:
+        path = name if os.path.isabs(name) else os.path.join(images_dir, name)
+        with Image.open(path) as img:
+            img.load()
+        start = time.perf_counter()
+        contours = sticker_contours(img, args.offset * args.dpi / 25.4, args.tolerance)
+        elapsed = time.perf_counter() - start
+        out = os.path.splitext(path)[0] + '_cut.svg'
+        cut_svg(contours, img.size, args.dpi).save(out)
+        points = sum(len(c) for c in contours)
+        print(f"{out}: {len(contours)} contour(s), {points} points, {elapsed * 1000:.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Font registry for the print generators.
+
+Each family lists its font files in order of preference; the first one
+found wins. A file name is looked up in (in order):
+  1. tools/fonts/ (open fonts bundled with the repo, see tools/fonts/README.md)
+  2. STICKER_FONT_PATH (directories, os.pathsep separated)
+  3. the platform font directories (Windows, macOS, Linux)
+Latin text uses Arial where installed and otherwise a metric-compatible
+clone (Liberation Sans, or the bundled Arimo it is built from), so every
+machine lays out the same lines at the same widths. Arabic text and symbols
+Arimo lacks (the check mark) fall back to the bundled DejaVu Sans.
+FreeTypeFont objects are cached per (family, weight, size).
+
+A missing family raises FontNotFoundError instead of silently falling back
+to Pillow's tiny bitmap font. STICKER_ALLOW_DEFAULT_FONT=1 opts into Pillow's
+scalable default font (Latin only) for previews on machines without fonts.
+"""
+from PIL import ImageFont
+from functools import lru_cache
+import os
+import sys
+import warnings
+
+tools_dir = os.path.dirname(os.path.abspath(__file__))
+BUNDLED_FONTS_DIR = os.path.join(tools_dir, 'fonts')
+
+FAMILIES = {
+    # Latin text; Liberation Sans and Arimo (bundled) are metric-compatible with Arial
+    'arial': {
+        'regular': ['arial.ttf', 'Arial.ttf', 'LiberationSans-Regular.ttf', 'Arimo-Regular.ttf'],
+        'bold': ['arialbd.ttf', 'Arial Bold.ttf', 'LiberationSans-Bold.ttf', 'Arimo-Bold.ttf'],
+    },
+    # Arabic text (Arial has Arabic glyphs on Windows; Liberation Sans does not)
+    'arabic': {
+        'regular': ['arial.ttf', 'Arial.ttf', 'NotoNaskhArabic-Regular.ttf', 'NotoSansArabic-Regular.ttf',
+                    'DejaVuSans.ttf'],
+        'bold': ['arialbd.ttf', 'Arial Bold.ttf', 'NotoNaskhArabic-Bold.ttf', 'NotoSansArabic-Bold.ttf',
+                 'DejaVuSans-Bold.ttf'],
+    },
+    # Dingbats such as the check mark (not in Arial / Arimo)
+    'symbols': {
+        'regular': ['DejaVuSans.ttf'],
+        'bold': ['DejaVuSans-Bold.ttf'],
+    },
+}
+
+class FontNotFoundError(LookupError):
+    pass
+
+def font_dirs():
+    dirs = [BUNDLED_FONTS_DIR]
+    dirs += [d for d in os.environ.get('STICKER_FONT_PATH', '').split(os.pathsep) if d]
+    if sys.platform == 'win32':
+        dirs.append(os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'))
+        dirs.append(os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts'))
+    elif sys.platform == 'darwin':
+        dirs += ['/Library/Fonts', '/System/Library/Fonts', '/System/Library/Fonts/Supplemental',
+                 os.path.expanduser('~/Library/Fonts')]
+    else:
+        dirs += ['/usr/share/fonts', '/usr/local/share/fonts', os.path.expanduser('~/.fonts'),
+                 os.path.expanduser('~/.local/share/fonts')]
+    return dirs
+
+@lru_cache(maxsize=None)
+def _index():
+    """Font file name (lower case) -> path, first match in search order wins."""
+    index = {}
+    for d in font_dirs():
+        for dirpath, _, files in os.walk(d):
+            for name in files:
+                if name.lower().endswith(('.ttf', '.otf', '.ttc')):
+                    index.setdefault(name.lower(), os.path.join(dirpath, name))
+    return index
+
+@lru_cache(maxsize=None)
+def resolve(family='arial', bold=False):
+    """Path of the font file used for family / weight."""
+    weight = 'bold' if bold else 'regular'
+    try:
+        candidates = FAMILIES[family][weight]
+    except KeyError:
+        raise FontNotFoundError(f"Unknown font family {family!r} (known: {', '.join(FAMILIES)})")
+    index = _index()
+    for name in candidates:
+        path = index.get(name.lower())
+        if path:
+            return path
+    raise FontNotFoundError(
+        f"No font found for {family} {weight}. Tried {', '.join(candidates)} in {os.pathsep.join(font_dirs())}. "
+        "Install one (e.g. apt install fonts-liberation fonts-noto-core fonts-dejavu-core), "
+        "copy it to tools/fonts/ or point STICKER_FONT_PATH at it. "
+        "STICKER_ALLOW_DEFAULT_FONT=1 renders with Pillow's default font instead.")
+
+@lru_cache(maxsize=None)
+def get_font(size, bold=False, family='arial'):
+    """Cached FreeTypeFont for family / weight at size px."""
+    try:
+        return ImageFont.truetype(resolve(family, bold), size)
+    except FontNotFoundError:
+        if os.environ.get('STICKER_ALLOW_DEFAULT_FONT') != '1':
+            raise
+        warnings.warn(f"Font family {family!r} not found, using Pillow's default font", stacklevel=2)
+        return ImageFont.load_default(size)
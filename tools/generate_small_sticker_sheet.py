@@ -1,5 +1,10 @@
 from PIL import Image
 import os
+import sys
+
+# Add current directory to path to import imposition
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from imposition import paste_placements
 
 # Paths
 root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -39,7 +44,8 @@ total_sticker_height = ROWS * STICKER_SIZE
 remaining_height = A4_HEIGHT - total_sticker_height
 v_gap = remaining_height // (ROWS + 1)
 
-# Draw Grid
+# Draw Grid (each row is one sticker repeated: built once per sticker, then copied)
+placements = []
 for row in range(ROWS):
     for col in range(COLS):
         x = h_gap + col * (STICKER_SIZE + h_gap)
@@ -54,8 +60,10 @@ for row in range(ROWS):
             sticker = sticker_cg
         else:
             sticker = sticker_sw
-            
-        sheet.paste(sticker, (x, y), sticker)
+
+        placements.append((sticker, x, y))
+
+paste_placements(sheet, placements, BG_COLOR)
 
 # Save Sheet
 sheet.save(output_path, 'PNG', dpi=(300, 300))
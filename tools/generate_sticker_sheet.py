@@ -1,5 +1,12 @@
 from PIL import Image, ImageDraw
 import os
+import sys
+
+# Add current directory to path to import imposition, pdf_writer and diecut
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from imposition import impose, paste_placements
+from pdf_writer import PdfWriter
+from diecut import CUT_SPOT_NAME, cut_svg, sheet_contours
 
 # Paths
 root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -10,6 +17,9 @@ output_path_mixed = os.path.join(images_dir, 'sticker_sheet_a4_mixed.png')
 output_path_en = os.path.join(images_dir, 'sticker_sheet_a4_en.png')
 output_path_ar = os.path.join(images_dir, 'sticker_sheet_a4_ar.png')
 output_path_variations = os.path.join(images_dir, 'sticker_sheet_a4_variations.png')
+# Print-shop files (PDF, cut contours) go with print_output.py's, out of images/
+print_dir = os.path.join(root, 'print_output')
+output_path_pdf = os.path.join(print_dir, 'sticker_sheets_a4.pdf')
 
 # A4 Dimensions at 300 DPI
 A4_WIDTH = 2480
@@ -23,147 +33,149 @@ STICKER_SIZE = 709 # 6cm @ 300 DPI
 COLS = 3
 ROWS = 4
 
-# Load Stickers
-sticker_en = Image.open(sticker_en_path)
-sticker_ar = Image.open(sticker_ar_path)
-
-# Load Variations
-try:
-    sticker_sq_green = Image.open(os.path.join(images_dir, 'sticker_en_square_green.png'))
-    sticker_sq_white = Image.open(os.path.join(images_dir, 'sticker_en_square_white.png'))
-    sticker_ci_white = Image.open(os.path.join(images_dir, 'sticker_en_circle_white.png'))
-except FileNotFoundError:
-    print("Warning: Variation stickers not found. Run tools/generate_variations.py first.")
-    sticker_sq_green = sticker_en
-    sticker_sq_white = sticker_en
-    sticker_ci_white = sticker_en
-
-# Load Small Stickers
-try:
-    sticker_small_cw = Image.open(os.path.join(images_dir, 'sticker_small_circle_white.png'))
-    sticker_small_cg = Image.open(os.path.join(images_dir, 'sticker_small_circle_green.png'))
-    sticker_small_sw = Image.open(os.path.join(images_dir, 'sticker_small_square_white.png'))
-    small_stickers = [sticker_small_cw, sticker_small_cg, sticker_small_sw]
-except FileNotFoundError:
-    print("Warning: Small stickers not found. Run tools/generate_small_stickers.py first.")
-    small_stickers = []
+# Die-cut line, mm outside the sticker edge (--cut)
+CUT_OFFSET = 0
 
-def create_sheet(mode='mixed'):
-    # Create Canvas
-    sheet = Image.new('RGB', (A4_WIDTH, A4_HEIGHT), BG_COLOR)
-    
-    if mode == 'mixed_sizes':
-        # Custom layout for Mixed Sizes (Small English + Large Arabic)
-        # Rows: Small, Small, Large(Ar), Small, Small, Large(Ar)
-        row_types = ['small', 'small', 'large_ar', 'small', 'small', 'large_ar']
-        
-        # Calculate Gaps
-        # Heights: Small=354, Large=709
-        # Total Content Height = (4 * 354) + (2 * 709) = 1416 + 1418 = 2834
-        # Remaining = 3508 - 2834 = 674
-        # Gaps = 7 (Top, Bottom, and 5 between rows)
-        v_gap = 674 // 7
-        
-        current_y = v_gap
-        
-        small_idx = 0
-        
-        for r_type in row_types:
-            if r_type == 'small':
-                # 6 Columns
-                # Width = 6 * 354 = 2124
-                # Remaining = 2480 - 2124 = 356
-                # Gaps = 7
-                h_gap = 356 // 7
-                
-                for c in range(6):
-                    x = h_gap + c * (354 + h_gap)
-                    sticker = small_stickers[small_idx % 3]
-                    sheet.paste(sticker, (x, current_y), sticker)
-                    small_idx += 1
-                
-                current_y += 354 + v_gap
-                
-            elif r_type == 'large_ar':
-                # 3 Columns
-                # Width = 3 * 709 = 2127
-                # Remaining = 2480 - 2127 = 353
-                # Gaps = 4
-                h_gap = 353 // 4
-                
-                for c in range(3):
-                    x = h_gap + c * (709 + h_gap)
-                    sheet.paste(sticker_ar, (x, current_y), sticker_ar)
-                    
-                current_y += 709 + v_gap
-                
-        return sheet
-
-    # Calculate Spacing
-    total_sticker_width = COLS * STICKER_SIZE
+# Mixed sizes sheet (mm)
+MIXED_SIZES_MARGIN = 4
+MIXED_SIZES_GUTTER = 3
+
+def grid_positions(cols=COLS, rows=ROWS, size=STICKER_SIZE):
+    """Top-left corners of the evenly spaced cols x rows sticker grid on A4, row by row."""
+    total_sticker_width = cols * size
     remaining_width = A4_WIDTH - total_sticker_width
-    h_gap = remaining_width // (COLS + 1)
+    h_gap = remaining_width // (cols + 1)
 
-    total_sticker_height = ROWS * STICKER_SIZE
+    total_sticker_height = rows * size
     remaining_height = A4_HEIGHT - total_sticker_height
-    v_gap = remaining_height // (ROWS + 1)
-
-    for row in range(ROWS):
-        for col in range(COLS):
-            x = h_gap + col * (STICKER_SIZE + h_gap)
-            y = v_gap + row * (STICKER_SIZE + v_gap)
-            
-            if mode == 'mixed':
-                # Alternate rows
-                if row % 2 == 0:
-                    sticker = sticker_en
-                else:
-                    sticker = sticker_ar
-            elif mode == 'en':
+    v_gap = remaining_height // (rows + 1)
+
+    return [(h_gap + col * (size + h_gap), v_gap + row * (size + v_gap))
+            for row in range(rows) for col in range(cols)]
+
+def load_stickers():
+    global sticker_en, sticker_ar, sticker_sq_green, sticker_sq_white, sticker_ci_white, small_stickers
+
+    # Load Stickers
+    sticker_en = Image.open(sticker_en_path)
+    sticker_ar = Image.open(sticker_ar_path)
+
+    # Load Variations
+    try:
+        sticker_sq_green = Image.open(os.path.join(images_dir, 'sticker_en_square_green.png'))
+        sticker_sq_white = Image.open(os.path.join(images_dir, 'sticker_en_square_white.png'))
+        sticker_ci_white = Image.open(os.path.join(images_dir, 'sticker_en_circle_white.png'))
+    except FileNotFoundError:
+        print("Warning: Variation stickers not found. Run tools/generate_variations.py first.")
+        sticker_sq_green = sticker_en
+        sticker_sq_white = sticker_en
+        sticker_ci_white = sticker_en
+
+    # Load Small Stickers
+    try:
+        sticker_small_cw = Image.open(os.path.join(images_dir, 'sticker_small_circle_white.png'))
+        sticker_small_cg = Image.open(os.path.join(images_dir, 'sticker_small_circle_green.png'))
+        sticker_small_sw = Image.open(os.path.join(images_dir, 'sticker_small_square_white.png'))
+        small_stickers = [sticker_small_cw, sticker_small_cg, sticker_small_sw]
+    except FileNotFoundError:
+        print("Warning: Small stickers not found. Run tools/generate_small_stickers.py first.")
+        small_stickers = []
+
+def sheet_layout(mode='mixed'):
+    """(sticker, x, y) placements of a sheet mode."""
+    if mode == 'mixed_sizes':
+        # Large Arabic stickers + small English ones, packed by the imposition engine
+        # (interleaved round-robin, then largest first: the small ones stay mixed)
+        stickers = [(sticker_ar, 6)] + [(small, 8) for small in small_stickers]
+        pages = impose(stickers, margin=MIXED_SIZES_MARGIN, gutter=MIXED_SIZES_GUTTER)
+        if len(pages) > 1:
+            spilled = sum(len(page) for page in pages[1:])
+            raise ValueError(f"The mixed sizes sheet does not fit on one A4 page ({spilled} stickers "
+                             f"spill onto {len(pages) - 1} more); lower the quantities")
+        return [(stickers[i][0], x, y) for x, y, i in pages[0]]
+
+    layout = []
+    for i, (x, y) in enumerate(grid_positions()):
+        row = i // COLS
+
+        if mode == 'mixed':
+            # Alternate rows
+            if row % 2 == 0:
                 sticker = sticker_en
-            elif mode == 'ar':
+            else:
                 sticker = sticker_ar
-            elif mode == 'variations':
-                # Row 0: Original Circle Green
-                # Row 1: Circle White
-                # Row 2: Square Green
-                # Row 3: Square White
-                if row == 0:
-                    sticker = sticker_en
-                elif row == 1:
-                    sticker = sticker_ci_white
-                elif row == 2:
-                    sticker = sticker_sq_green
-                else:
-                    sticker = sticker_sq_white
-                
-            sheet.paste(sticker, (x, y), sticker)
-            
-    return sheet
-
-# Generate Mixed Sizes
-if small_stickers:
-    output_path_mixed_sizes = os.path.join(images_dir, 'sticker_sheet_a4_mixed_sizes.png')
-    sheet_mixed_sizes = create_sheet('mixed_sizes')
-    sheet_mixed_sizes.save(output_path_mixed_sizes, 'PNG', dpi=(300, 300))
-    print(f'Sticker sheet created: {output_path_mixed_sizes}')
-
-# Generate Mixed
-sheet_mixed = create_sheet('mixed')
-sheet_mixed.save(output_path_mixed, 'PNG', dpi=(300, 300))
-print(f'Sticker sheet created: {output_path_mixed}')
-
-# Generate English
-sheet_en = create_sheet('en')
-sheet_en.save(output_path_en, 'PNG', dpi=(300, 300))
-print(f'Sticker sheet created: {output_path_en}')
-
-# Generate Arabic
-sheet_ar = create_sheet('ar')
-sheet_ar.save(output_path_ar, 'PNG', dpi=(300, 300))
-print(f'Sticker sheet created: {output_path_ar}')
-
-# Generate Variations
-sheet_vars = create_sheet('variations')
-sheet_vars.save(output_path_variations, 'PNG', dpi=(300, 300))
-print(f'Sticker sheet created: {output_path_variations}')
+        elif mode == 'en':
+            sticker = sticker_en
+        elif mode == 'ar':
+            sticker = sticker_ar
+        elif mode == 'variations':
+            # Row 0: Original Circle Green
+            # Row 1: Circle White
+            # Row 2: Square Green
+            # Row 3: Square White
+            if row == 0:
+                sticker = sticker_en
+            elif row == 1:
+                sticker = sticker_ci_white
+            elif row == 2:
+                sticker = sticker_sq_green
+            else:
+                sticker = sticker_sq_white
+
+        layout.append((sticker, x, y))
+    return layout
+
+def create_sheet(mode='mixed'):
+    # Create Canvas
+    sheet = Image.new('RGB', (A4_WIDTH, A4_HEIGHT), BG_COLOR)
+    return paste_placements(sheet, sheet_layout(mode), BG_COLOR)
+
+def cut_contours(mode):
+    """Die-cut outlines of a sheet mode, in sheet px."""
+    return sheet_contours(sheet_layout(mode), CUT_OFFSET * 300 / 25.4)
+
+def write_pdf(modes, path, cut=False):
+    """
+    One PDF page per mode. Each sticker image is embedded once and referenced by
+    every placement, and pages are streamed to the file one at a time.
+    With cut, the die-cut outlines go on a CutContour spot-color layer.
+    """
+    embedded = {}
+    with PdfWriter(path, (A4_WIDTH, A4_HEIGHT), dpi=300) as pdf:
+        if cut:
+            spot = pdf.spot_color(CUT_SPOT_NAME)
+            layer = pdf.layer(CUT_SPOT_NAME)
+        for mode in modes:
+            page = pdf.page()
+            for sticker, x, y in sheet_layout(mode):
+                ref = embedded.get(id(sticker))
+                if ref is None:
+                    ref = embedded[id(sticker)] = pdf.image(sticker)
+                page.draw(ref, x, y, sticker.width, sticker.height)
+            if cut:
+                page.cut_contour(cut_contours(mode), spot, layer)
+            pdf.add_page(page)
+
+if __name__ == "__main__":
+    load_stickers()
+
+    sheets = [('mixed', output_path_mixed), ('en', output_path_en), ('ar', output_path_ar),
+              ('variations', output_path_variations)]
+    if small_stickers:
+        sheets.insert(0, ('mixed_sizes', os.path.join(images_dir, 'sticker_sheet_a4_mixed_sizes.png')))
+
+    cut = '--cut' in sys.argv
+    if cut or '--pdf' in sys.argv:
+        os.makedirs(print_dir, exist_ok=True)
+    if '--pdf' in sys.argv:
+        write_pdf([mode for mode, _ in sheets], output_path_pdf, cut)
+        print(f'Sticker sheets PDF created: {output_path_pdf}')
+    else:
+        # One sheet in memory at a time
+        for mode, output_path in sheets:
+            create_sheet(mode).save(output_path, 'PNG', dpi=(300, 300))
+            print(f'Sticker sheet created: {output_path}')
+            if cut:
+                cut_path = os.path.join(print_dir, os.path.splitext(os.path.basename(output_path))[0] + '_cut.svg')
+                cut_svg(cut_contours(mode), (A4_WIDTH, A4_HEIGHT)).save(cut_path)
+                print(f'Cut contour created: {cut_path}')
@@ -0,0 +1,235 @@
+"""
+Golden-image check: renders the stickers, sheets and stands and compares each
+PNG against its checked-in golden image (by default the committed images/),
+so a rendering speedup can prove it did not change the output.
+
+Comparison is two-stage:
+  1. pixel hash: sha1 of the decoded pixels. Only identical pixels pass
+     here; the hash of a golden is cached (with its signature) by file hash,
+     so a passing image never decodes its golden.
+  2. on hash mismatch, a full-resolution diff: the signatures (the images
+     box-downsampled 8x, one mean per 8 x 8 block) locate the blocks that
+     differ and the diff is restricted to them (the whole image if the
+     change is too small to move a block mean). Reports the changed pixel
+     count, max difference, and a heatmap of the changed region (golden
+     dimmed, differences in red) in the diff directory.
+For a stand (4724 x 11811) hashing takes ~0.2 s, the signatures ~0.15 s and
+a localized diff ~0.02 s, on top of PNG decoding (~0.6 s per image).
+
+Generator scripts are rendered with random.seed(0), so anything they place
+at random is reproducible (the stand patterns draw from their own seeded
+generator, which starts at the same sequence); run --update once if the
+goldens predate seeding.
+
+Usage:
+  python tools/golden.py [group|name ...]        (groups: stickers sheets stands)
+      [--golden DIR] [--candidate DIR] [--update] [--tolerance N] [--max-changed FRACTION]
+  --candidate DIR   compare PNGs already rendered in DIR instead of rendering
+  --update          copy the rendered images over the goldens
+"""
+from PIL import Image, ImageChops, ImageDraw
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Paths
+tools_dir = os.path.dirname(os.path.abspath(__file__))
+root = os.path.dirname(tools_dir)
+images_dir = os.path.join(root, 'images')
+SIGNATURE_CACHE_DIR = os.path.join(root, '.golden_cache')
+DEFAULT_DIFF_DIR = os.path.join(root, '.golden_diff')
+
+sys.path.append(tools_dir)
+from benchmark import build_cases, select_cases
+
+GROUPS = ('stickers', 'sheets', 'stands')
+SOURCE_ASSETS = ['logo_circular.png', 'qr_website.png', 'tadweer_image.jpeg']
+SIGNATURE_FACTOR = 8
+
+# --- Comparison ---
+def _normalize(img):
+    return img if img.mode in ('RGB', 'RGBA') else img.convert('RGBA')
+
+def pixel_hash(img):
+    """sha1 of the decoded pixels (mode and size included): equal only for identical images."""
+    img = _normalize(img)
+    return hashlib.sha1(f'{img.mode} {img.size}'.encode() + img.tobytes()).hexdigest()
+
+def signature(img):
+    """8x box-downsampled pixels: cheap, and locates the blocks where two images differ."""
+    return np.asarray(_normalize(img).reduce(SIGNATURE_FACTOR))
+
+def golden_fingerprint(path):
+    """(pixel hash, signature) of a golden image, cached on disk by its file hash."""
+    with open(path, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    cached = os.path.join(SIGNATURE_CACHE_DIR, f'{digest}_{SIGNATURE_FACTOR}.npz')
+    if os.path.exists(cached):
+        with np.load(cached) as data:
+            return str(data['pixels']), data['signature']
+    with Image.open(path) as img:
+        pixels, sig = pixel_hash(img), signature(img)
+    os.makedirs(SIGNATURE_CACHE_DIR, exist_ok=True)
+    np.savez(cached, pixels=np.array(pixels), signature=sig)
+    return pixels, sig
+
+def changed_region(sig, golden_sig, size):
+    """Pixel box covering the signature blocks that differ."""
+    ys, xs = np.nonzero(np.any(sig != golden_sig, axis=-1))
+    f = SIGNATURE_FACTOR
+    return (int(xs.min()) * f, int(ys.min()) * f,
+            min(size[0], (int(xs.max()) + 1) * f), min(size[1], (int(ys.max()) + 1) * f))
+
+def pixel_diff(golden, candidate, tolerance=0, region=None):
+    """
+    Full-resolution difference of two equally sized images (within region, if
+    given): per-pixel max channel difference over the changed bounding box,
+    and pixels above tolerance.
+    """
+    if golden.mode != candidate.mode:
+        golden, candidate = golden.convert('RGBA'), candidate.convert('RGBA')
+    if region and region != (0, 0) + golden.size:
+        golden_part, candidate_part = golden.crop(region), candidate.crop(region)
+    else:
+        region = (0, 0) + golden.size
+        golden_part, candidate_part = golden, candidate
+    bbox = ImageChops.difference(golden_part, candidate_part).getbbox(alpha_only=False)
+    if bbox is None:
+        return {'changed': 0, 'max': 0, 'bbox': None, 'diff': None}
+    bbox = (bbox[0] + region[0], bbox[1] + region[1], bbox[2] + region[0], bbox[3] + region[1])
+    a = np.asarray(golden.crop(bbox))
+    b = np.asarray(candidate.crop(bbox))
+    diff = np.maximum(a, b) - np.minimum(a, b)
+    if diff.ndim == 3:
+        diff = diff.max(axis=2)
+    return {'changed': int(np.count_nonzero(diff > tolerance)), 'max': int(diff.max()), 'bbox': bbox, 'diff': diff}
+
+def heatmap(golden, result, tolerance=0, margin=40):
+    """Changed region of golden (dimmed grayscale) with differences overlaid in red."""
+    x0, y0, x1, y1 = result['bbox']
+    box = (max(0, x0 - margin), max(0, y0 - margin),
+           min(golden.width, x1 + margin), min(golden.height, y1 + margin))
+    base = golden.convert('L').crop(box).point(lambda v: 160 + v * 95 // 255).convert('RGB')
+
+    strength = np.zeros((box[3] - box[1], box[2] - box[0]), dtype=np.uint8)
+    d = result['diff']
+    heat = np.where(d > tolerance, np.clip(d.astype(np.uint16) * 4 + 64, 0, 255), 0).astype(np.uint8)
+    strength[y0 - box[1]:y1 - box[1], x0 - box[0]:x1 - box[0]] = heat
+    base.paste((220, 0, 0), mask=Image.fromarray(strength, 'L'))
+    ImageDraw.Draw(base).rectangle((x0 - box[0], y0 - box[1], x1 - box[0] - 1, y1 - box[1] - 1),
+                                   outline=(0, 90, 200), width=2)
+    return base
+
+def compare(golden_path, candidate_path, tolerance=0, max_changed=0.0, diff_dir=DEFAULT_DIFF_DIR):
+    """(ok, message) for one image; writes a heatmap to diff_dir on failure."""
+    with Image.open(candidate_path) as candidate:
+        candidate.load()
+    if not os.path.exists(golden_path):
+        return False, "no golden image"
+
+    golden_pixels, golden_sig = golden_fingerprint(golden_path)
+    if pixel_hash(candidate) == golden_pixels:
+        return True, "identical pixels"
+
+    with Image.open(golden_path) as golden:
+        golden.load()
+    if golden.size != candidate.size:
+        return False, f"size {candidate.size} != golden {golden.size}"
+    sig = signature(candidate)
+    # Equal signatures: the change is too small to move a block mean, diff everything
+    region = None if np.array_equal(sig, golden_sig) else changed_region(sig, golden_sig, golden.size)
+    result = pixel_diff(_normalize(golden), _normalize(candidate), tolerance, region)
+    fraction = result['changed'] / (golden.width * golden.height)
+    if fraction <= max_changed:
+        return True, f"{result['changed']} px changed (max diff {result['max']}), within tolerance"
+
+    os.makedirs(diff_dir, exist_ok=True)
+    heat_path = os.path.join(diff_dir, f"diff_{os.path.basename(candidate_path)}")
+    heatmap(_normalize(golden), result, tolerance).save(heat_path)
+    return False, (f"{result['changed']} px ({fraction:.4%}) changed, max diff {result['max']}, "
+                   f"bbox {result['bbox']} -> {heat_path}")
+
+# --- Rendering ---
+def make_sandbox():
+    """Copy of tools/ plus the real source assets, so renders never touch images/."""
+    sandbox = tempfile.mkdtemp(prefix='golden_')
+    shutil.copytree(tools_dir, os.path.join(sandbox, 'tools'), ignore=shutil.ignore_patterns('__pycache__'))
+    os.makedirs(os.path.join(sandbox, 'images'))
+    for name in SOURCE_ASSETS:
+        shutil.copy(os.path.join(images_dir, name), os.path.join(sandbox, 'images', name))
+    return sandbox
+
+def seeded(argv):
+    """Run a generator script with random seeded, so randomized layouts are reproducible."""
+    if len(argv) == 2 and argv[1].endswith('.py'):
+        return [argv[0], '-c', f"import random, runpy; random.seed(0); runpy.run_path({argv[1]!r}, run_name='__main__')"]
+    return argv
+
+def render(cases, sandbox, jobs=None):
+    """Render cases in the sandbox (sheets last: they paste the rendered stickers)."""
+    def run(case):
+        if case.setup:
+            case.setup(sandbox)
+        subprocess.run(seeded(case.argv), cwd=sandbox, check=True, stdout=subprocess.DEVNULL)
+
+    with ThreadPoolExecutor(jobs or os.cpu_count()) as pool:
+        list(pool.map(run, [c for c in cases if c.group != 'sheets']))
+        list(pool.map(run, [c for c in cases if c.group == 'sheets']))
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare rendered PNGs against golden images.")
+    parser.add_argument('keys', nargs='*', help="groups (stickers, sheets, stands) or names")
+    parser.add_argument('--golden', default=images_dir, help="directory of golden images")
+    parser.add_argument('--candidate', help="directory of already rendered PNGs (skip rendering)")
+    parser.add_argument('--update', action='store_true', help="overwrite the goldens with the renders")
+    parser.add_argument('--tolerance', type=int, default=0, help="per-channel difference ignored (0-255)")
+    parser.add_argument('--max-changed', type=float, default=0.0, help="fraction of pixels allowed to change")
+    parser.add_argument('--diff-dir', default=DEFAULT_DIFF_DIR)
+    parser.add_argument('--jobs', type=int)
+    args = parser.parse_args()
+
+    cases = [c for c in select_cases(build_cases(), args.keys) if c.group in GROUPS]
+    sandbox = None
+    if args.candidate:
+        candidate_dir = args.candidate
+        names = [os.path.basename(o) for c in cases for o in c.outputs if o.endswith('.png')]
+        names = [n for n in names if os.path.exists(os.path.join(candidate_dir, n))]
+    else:
+        sandbox = make_sandbox()
+        candidate_dir = os.path.join(sandbox, 'images')
+        print(f"Rendering {len(cases)} cases...")
+        render(cases, sandbox, args.jobs)
+        names = [os.path.basename(o) for c in cases for o in c.outputs if o.endswith('.png')]
+
+    try:
+        if args.update:
+            for name in names:
+                shutil.copy(os.path.join(candidate_dir, name), os.path.join(args.golden, name))
+            print(f"Updated {len(names)} golden images in {args.golden}")
+            return
+
+        failures = 0
+        for name in names:
+            start = time.perf_counter()
+            ok, message = compare(os.path.join(args.golden, name), os.path.join(candidate_dir, name),
+                                  args.tolerance, args.max_changed, args.diff_dir)
+            failures += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {name:40s} {time.perf_counter() - start:6.2f}s  {message}")
+    finally:
+        if sandbox:
+            shutil.rmtree(sandbox, ignore_errors=True)
+
+    print(f"\n{len(names) - failures}/{len(names)} match the golden images")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Imposition: packs any mix of sticker images and quantities onto as few
+sheets as possible.
+
+Stickers are placed with a bottom-left skyline packer (largest first, so
+small stickers fill the space left next to and below the large ones), and a
+new sheet is started whenever nothing else fits. Each sticker occupies its
+image plus bleed on every side; neighbours are separated by the gutter and
+kept inside the margins. The packed block is centered on each sheet.
+
+Lengths are in mm (like the sticker catalog) and converted at dpi.
+
+Usage:
+  python tools/imposition.py IMAGE[:QTY] ... [--paper A4|A3|Letter] [--margin 5]
+      [--gutter 3] [--bleed 0] [--out-dir DIR] [--prefix sticker_sheet_imposed]
+  e.g. python tools/imposition.py tadweer_sticker_ar.png:6 sticker_small_circle_white.png:40
+  (image paths are relative to images/ unless absolute)
+"""
+from PIL import Image
+import argparse
+import os
+import sys
+import time
+
+# Add current directory to path to import sticker_engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from sticker_engine import px
+
+# Paths
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+images_dir = os.path.join(root, 'images')
+
+PAPER_SIZES = {
+    'A4': (210, 297),
+    'A3': (297, 420),
+    'Letter': (215.9, 279.4),
+}
+BG_COLOR = (255, 255, 255)  # White paper
+
+# --- Packing ---
+class Skyline:
+    """Bottom-left skyline packer for one width x height area."""
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.segments = [[0, 0, width]]  # [x, y, w], left to right
+
+    def find(self, w, h):
+        """(x, y) of the lowest (then leftmost) spot where w x h fits, or None."""
+        best = None
+        for i, (x, _, _) in enumerate(self.segments):
+            if x + w > self.width:
+                break
+            # Resting height over the segments the rectangle spans
+            y, j, covered = 0, i, 0
+            while covered < w:
+                y = max(y, self.segments[j][1])
+                covered += self.segments[j][2] - (x - self.segments[j][0] if j == i else 0)
+                j += 1
+            if y + h <= self.height and (best is None or (y, x) < best):
+                best = (y, x)
+        return None if best is None else (best[1], best[0])
+
+    def place(self, x, y, w, h):
+        """Raise the skyline over [x, x + w) to y + h."""
+        new = []
+        for sx, sy, sw in self.segments:
+            if sx + sw <= x or sx >= x + w:
+                new.append([sx, sy, sw])
+                continue
+            if sx < x:
+                new.append([sx, sy, x - sx])
+            if sx + sw > x + w:
+                new.append([x + w, sy, sx + sw - x - w])
+        new.append([x, y + h, w])
+        new.sort()
+        # Merge neighbours at the same height
+        merged = [new[0]]
+        for seg in new[1:]:
+            if seg[1] == merged[-1][1]:
+                merged[-1][2] += seg[2]
+            else:
+                merged.append(seg)
+        self.segments = merged
+
+def pack(sizes, quantities, area, gutter=0):
+    """
+    Pages of (x, y, index) placements (top-left of each footprint inside area)
+    for quantities[i] rectangles of sizes[i] = (w, h), separated by gutter.
+    """
+    # One entry per sticker: items interleaved round-robin, then largest first
+    # (stable, so equal sizes keep alternating like the hand-made sheets)
+    order = []
+    remaining = list(quantities)
+    while any(remaining):
+        for i, left in enumerate(remaining):
+            if left:
+                order.append(i)
+                remaining[i] -= 1
+    order.sort(key=lambda i: (-sizes[i][1], -sizes[i][0]))
+
+    width, height = area
+    for (w, h), quantity in zip(sizes, quantities):
+        # Sizes nobody asked for (quantity 0) are never placed, so they need not fit
+        if quantity and (w > width or h > height):
+            raise ValueError(f"Sticker of {w}x{h} px does not fit the printable area {width}x{height} px")
+
+    # The gutter is added to every footprint, and to the area (no gutter after the last one)
+    pages = []
+    while order:
+        sky = Skyline(width + gutter, height + gutter)
+        placed, left = [], []
+        for i in order:
+            w, h = sizes[i]
+            spot = sky.find(w + gutter, h + gutter)
+            if spot is None:
+                left.append(i)
+                continue
+            sky.place(spot[0], spot[1], w + gutter, h + gutter)
+            placed.append((spot[0], spot[1], i))
+        pages.append(placed)
+        order = left
+    return pages
+
+# --- Sheets ---
+def impose(stickers, paper='A4', margin=5, gutter=3, bleed=0, dpi=300):
+    """
+    Pages of (x, y, index) sticker positions on the sheet (top-left of the image,
+    in px) for stickers = [(image, quantity), ...]; lengths in mm.
+    """
+    sheet_w, sheet_h = (px(v, dpi) for v in PAPER_SIZES[paper])
+    m, g, b = px(margin, dpi), px(gutter, dpi), px(bleed, dpi)
+    area = (sheet_w - 2 * m, sheet_h - 2 * m)
+    sizes = [(img.width + 2 * b, img.height + 2 * b) for img, _ in stickers]
+    pages = pack(sizes, [q for _, q in stickers], area, g)
+
+    result = []
+    for placed in pages:
+        # Center the packed block in the printable area
+        used_w = max(x + sizes[i][0] for x, _, i in placed)
+        used_h = max(y + sizes[i][1] for _, y, i in placed)
+        dx = m + (area[0] - used_w) // 2 + b
+        dy = m + (area[1] - used_h) // 2 + b
+        result.append([(x + dx, y + dy, i) for x, y, i in placed])
+    return result
+
+def paste_placements(sheet, placements, background=BG_COLOR):
+    """
+    Pastes (image, x, y) placements onto a blank sheet filled with background.
+
+    Grids take a fast path: each image is alpha-composited onto the background
+    once, each distinct row is built once as a full-width strip with plain
+    pastes, and repeated rows are copied (12 alpha pastes on an A4 grid of one
+    sticker become 1). The result is identical to alpha-pasting every
+    placement. Layouts where stickers overlap are pasted one by one.
+    """
+    rows = {}
+    for img, x, y in placements:
+        rows.setdefault(y, []).append((img, x))
+    for row in rows.values():
+        row.sort(key=lambda p: p[1])
+    bands = sorted((y, max(img.height for img, _ in row)) for y, row in rows.items())
+    overlapping = (any(y + h > next_y for (y, h), (next_y, _) in zip(bands, bands[1:])) or
+                   any(x + img.width > next_x for row in rows.values()
+                       for (img, x), (_, next_x) in zip(row, row[1:])))
+    if overlapping:
+        for img, x, y in placements:
+            sheet.paste(img, (x, y), img if img.mode == 'RGBA' else None)
+        return sheet
+
+    opaque = {}
+    strips = {}
+    for y, height in bands:
+        row = rows[y]
+        key = tuple((id(img), x) for img, x in row)
+        strip = strips.get(key)
+        if strip is None:
+            strip = Image.new(sheet.mode, (sheet.width, height), background)
+            for img, x in row:
+                tile = opaque.get(id(img))
+                if tile is None:
+                    tile = Image.new(sheet.mode, img.size, background)
+                    tile.paste(img, (0, 0), img if img.mode == 'RGBA' else None)
+                    opaque[id(img)] = tile
+                strip.paste(tile, (x, 0))
+            strips[key] = strip
+        sheet.paste(strip, (0, y))
+    return sheet
+
+def render_sheets(stickers, pages, paper='A4', dpi=300):
+    """Sheet images for the pages from impose(), one at a time."""
+    size = tuple(px(v, dpi) for v in PAPER_SIZES[paper])
+    for placed in pages:
+        sheet = Image.new('RGB', size, BG_COLOR)
+        yield paste_placements(sheet, [(stickers[i][0], x, y) for x, y, i in placed])
+
+def parse_sticker_arg(arg):
+    path, _, qty = arg.rpartition(':') if ':' in os.path.basename(arg) else (arg, '', '1')
+    path = path if os.path.isabs(path) else os.path.join(images_dir, path)
+    return Image.open(path).convert('RGBA'), int(qty)
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack stickers onto as few sheets as possible.")
+    parser.add_argument('stickers', nargs='+', help="IMAGE[:QTY], relative to images/")
+    parser.add_argument('--paper', default='A4', choices=PAPER_SIZES)
+    parser.add_argument('--margin', type=float, default=5, help="mm")
+    parser.add_argument('--gutter', type=float, default=3, help="mm")
+    parser.add_argument('--bleed', type=float, default=0, help="mm")
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--out-dir', default=images_dir)
+    parser.add_argument('--prefix', default='sticker_sheet_imposed')
+    args = parser.parse_args()
+
+    stickers = [parse_sticker_arg(a) for a in args.stickers]
+    start = time.perf_counter()
+    pages = impose(stickers, args.paper, args.margin, args.gutter, args.bleed, args.dpi)
+    elapsed = time.perf_counter() - start
+    total = sum(q for _, q in stickers)
+    print(f"{total} stickers on {len(pages)} {args.paper} sheet(s) "
+          f"({', '.join(str(len(p)) for p in pages)}), packed in {elapsed * 1000:.1f} ms")
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for n, sheet in enumerate(render_sheets(stickers, pages, args.paper, args.dpi), 1):
+        path = os.path.join(args.out_dir, f'{args.prefix}_{n:02d}.png')
+        sheet.save(path, 'PNG', dpi=(args.dpi, args.dpi))
+        print(f'Sticker sheet created: {path}')
+
+if __name__ == "__main__":
+    main()
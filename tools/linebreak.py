@@ -0,0 +1,126 @@
+"""
+Line breaking with cached word widths.
+
+Wrapping by measuring the whole growing line for every word is quadratic per
+paragraph (and, for Arabic, reshapes every candidate line). Here each word is
+measured once per font (advance, plus the left / right ink edges of its
+bounding box) and so is the space, so the width of any run of words is a
+difference of prefix sums:
+
+  ink width = advances + spaces - advance(right word) + right ink - left ink
+
+which matches textbbox to a fraction of a pixel. Only a line that lands
+within BORDERLINE px of the limit is measured for real, so the breaks are
+exactly the ones a full textbbox wrap gives.
+
+Two methods:
+  greedy   fill each line as far as it goes (one pass, linear in the words)
+  optimal  Knuth-Plass style: minimize the sum of squared slack over all
+           lines but the last (lines that fit are considered, so it is linear
+           in the words times the words per line)
+
+Usage:
+  lines = break_lines(text, font, width)                        # logical order
+  lines = break_lines(text_ar, font, width, rtl=True, method='optimal')
+"""
+from sticker_utils import _font_key, shape_rtl
+
+METHODS = ('greedy', 'optimal')
+BORDERLINE = 1 # px; closer to the limit than this, a line is measured with getbbox
+
+_word_cache = {}
+
+def _shaped(text, font, rtl):
+    return ''.join(shape_rtl(text, font)) if rtl else text
+
+def word_metrics(font, word, rtl=False):
+    """(advance, left ink, right ink) of word as drawn, memoized per font."""
+    table = _word_cache.setdefault((_font_key(font), rtl), {})
+    metrics = table.get(word)
+    if metrics is None:
+        shown = _shaped(word, font, rtl)
+        left, _, right, _ = font.getbbox(shown)
+        metrics = table[word] = (font.getlength(shown), left, right)
+    return metrics
+
+class Paragraph:
+    """The words of one paragraph with prefix sums of their advances."""
+    def __init__(self, words, font, rtl=False):
+        self.words = words
+        self.font = font
+        self.rtl = rtl
+        self.metrics = [word_metrics(font, word, rtl) for word in words]
+        self.space = word_metrics(font, ' ', rtl)[0]
+        self.prefix = [0]
+        for advance, _, _ in self.metrics:
+            self.prefix.append(self.prefix[-1] + advance)
+
+    def text(self, i, j):
+        return ' '.join(self.words[i:j])
+
+    def estimate(self, i, j):
+        """Ink width of words[i:j] on one line, from the cached metrics."""
+        # RTL lines run right to left: the first logical word is the rightmost
+        left, right = (j - 1, i) if self.rtl else (i, j - 1)
+        total = self.prefix[j] - self.prefix[i] + self.space * (j - i - 1)
+        return total - self.metrics[right][0] + self.metrics[right][2] - self.metrics[left][1]
+
+    def width(self, i, j, limit):
+        """Ink width of words[i:j], exact whenever it matters against limit."""
+        w = self.estimate(i, j)
+        if abs(w - limit) < BORDERLINE:
+            left, _, right, _ = self.font.getbbox(_shaped(self.text(i, j), self.font, self.rtl))
+            w = right - left
+        return w
+
+    def fits(self, i, j, limit):
+        return j - i == 1 or self.width(i, j, limit) <= limit
+
+def greedy(par, limit):
+    """Line ends (word indices) filling each line as far as it goes."""
+    ends = []
+    start = 0
+    for j in range(2, len(par.words) + 1):
+        if not par.fits(start, j, limit):
+            ends.append(j - 1)
+            start = j - 1
+    ends.append(len(par.words))
+    return ends
+
+def optimal(par, limit):
+    """Line ends minimizing the sum of squared slack of every line but the last."""
+    n = len(par.words)
+    cost = [0] + [float('inf')] * n
+    prev = [0] * (n + 1)
+    for j in range(1, n + 1):
+        for i in range(j - 1, -1, -1):
+            w = par.width(i, j, limit)
+            if w > limit and j - i > 1:
+                break
+            slack = 0 if j == n else max(limit - w, 0)
+            c = cost[i] + slack * slack
+            if c < cost[j]:
+                cost[j], prev[j] = c, i
+    ends = []
+    j = n
+    while j:
+        ends.append(j)
+        j = prev[j]
+    return ends[::-1]
+
+def break_lines(text, font, width, rtl=False, method='greedy'):
+    """Wraps text (logical order, '\\n' starts a paragraph) into lines at most width px wide."""
+    if method not in METHODS:
+        raise ValueError(f"Unknown line breaking method {method!r} (expected one of {', '.join(METHODS)})")
+    breaker = greedy if method == 'greedy' else optimal
+    lines = []
+    for text_paragraph in text.split('\n'):
+        words = text_paragraph.split()
+        if not words:
+            continue
+        par = Paragraph(words, font, rtl)
+        start = 0
+        for end in breaker(par, width):
+            lines.append(par.text(start, end))
+            start = end
+    return lines
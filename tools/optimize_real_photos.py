@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""
+r"""
 Optimize real photos from Google Drive for web use.
 Place downloaded photos in: C:\Users\kasmaj\Downloads\launch_photos\
 Then run this script.
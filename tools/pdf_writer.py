@@ -0,0 +1,227 @@
+"""
+Streaming multi-page PDF writer for sticker sheets.
+
+Pages are written to the file as soon as they are added, so memory does not
+grow with the page count (only object offsets are kept until close). Images
+are embedded once as XObjects and can be placed any number of times on any
+page, so a sheet of 12 identical stickers stores the sticker pixels once,
+not 12 times:
+  image(img)          RGB / RGBA / L / CMYK image (alpha becomes a soft mask), Flate-compressed
+  image_strips(...)   image streamed strip by strip (never held whole in memory)
+  icc_colorspace(icc) ICC-based color space for image_strips (e.g. the CMYK press profile)
+  stencil(matrix)     1-bit mask painted in a fill color (QR modules: crisp at any zoom)
+  spot_color(name)    Separation color space (e.g. the cutter's "CutContour")
+  layer(name)         optional content group, shown as a layer in PDF viewers
+
+Coordinates are pixels at dpi with the origin at the top-left, like PIL.
+
+Usage:
+  with PdfWriter('sheets.pdf', (2480, 3508), dpi=300) as pdf:
+      sticker = pdf.image(img)
+      page = pdf.page()
+      page.draw(sticker, x, y, w, h)
+      pdf.add_page(page)
+"""
+import zlib
+
+import numpy as np
+
+class PdfPage:
+    """Content of one page: drawing operations in px, top-left origin."""
+    def __init__(self, size, dpi):
+        self.size = size
+        self.scale = 72 / dpi
+        self.ops = []
+        self.xobjects = {}
+        self.colorspaces = {}
+        self.properties = {}
+
+    def _box(self, x, y, w, h):
+        s = self.scale
+        return w * s, h * s, x * s, (self.size[1] - y - h) * s
+
+    def draw(self, ref, x, y, w, h):
+        """Place the image XObject ref (from PdfWriter.image) in the box."""
+        name, obj = ref
+        self.xobjects[name] = obj
+        self.ops.append("q %.4f 0 0 %.4f %.4f %.4f cm /%s Do Q" % (*self._box(x, y, w, h), name))
+
+    def stencil(self, ref, x, y, w, h, color=(0, 0, 0)):
+        """Paint the stencil ref (from PdfWriter.stencil) in color."""
+        name, obj = ref
+        self.xobjects[name] = obj
+        r, g, b = (c / 255 for c in color[:3])
+        self.ops.append("q %.4f %.4f %.4f rg %.4f 0 0 %.4f %.4f %.4f cm /%s Do Q"
+                        % (r, g, b, *self._box(x, y, w, h), name))
+
+    def cut_contour(self, contours, spot, layer=None, width=0.25):
+        """Stroke closed paths (N x 2 arrays, px) in the spot color ref, on layer; width in pt."""
+        s, height = self.scale, self.size[1]
+        path = []
+        for c in contours:
+            pts = [f"{x * s:.3f} {(height - y) * s:.3f}" for x, y in c]
+            path.append(pts[0] + " m " + " l ".join(pts[1:]) + " l h")
+        name, obj = spot
+        self.colorspaces[name] = obj
+        ops = f"q /{name} CS 1 SCN {width} w\n" + "\n".join(path) + "\nS Q"
+        if layer:
+            self.properties[layer[0]] = layer[1]
+            ops = f"/OC /{layer[0]} BDC\n{ops}\nEMC"
+        self.ops.append(ops)
+
+    def rect(self, x, y, w, h, color):
+        w, h, x, y = self._box(x, y, w, h)
+        r, g, b = (c / 255 for c in color[:3])
+        self.ops.append("q %.4f %.4f %.4f rg %.4f %.4f %.4f %.4f re f Q" % (r, g, b, x, y, w, h))
+
+class PdfWriter:
+    """Writes a PDF incrementally; use as a context manager or call close()."""
+    def __init__(self, path, page_size, dpi=300, compress_level=6):
+        self.page_size = page_size
+        self.dpi = dpi
+        self.compress_level = compress_level
+        self.f = open(path, 'wb')
+        self.offsets = {}
+        self.pages = []
+        self.images = 0
+        self.layers = []
+        # 1 = catalog, 2 = page tree; both written at close
+        self.next_id = 3
+        self.f.write(b"%PDF-1.5\n%\xe2\xe3\xcf\xd3\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _alloc(self):
+        obj = self.next_id
+        self.next_id += 1
+        return obj
+
+    def _write_object(self, obj, body, stream=None):
+        self.offsets[obj] = self.f.tell()
+        self.f.write(b"%d 0 obj\n" % obj)
+        if stream is None:
+            self.f.write(body.encode('latin-1'))
+        else:
+            self.f.write(body[:-2].encode('latin-1') + b" /Length %d >>\nstream\n" % len(stream))
+            self.f.write(stream)
+            self.f.write(b"\nendstream")
+        self.f.write(b"\nendobj\n")
+
+    def _image_object(self, data, width, height, extra):
+        obj = self._alloc()
+        stream = zlib.compress(data, self.compress_level)
+        self._write_object(obj, f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+                                f"{extra} /Filter /FlateDecode >>", stream)
+        return obj
+
+    def _ref(self, obj):
+        self.images += 1
+        return f"Im{self.images}", obj
+
+    def image(self, img):
+        """Embed a PIL image once; returns a reference for PdfPage.draw()."""
+        if img.mode not in ('RGB', 'RGBA', 'L', 'CMYK'):
+            img = img.convert('RGBA' if 'A' in img.getbands() or 'transparency' in img.info else 'RGB')
+        smask = ''
+        if img.mode == 'RGBA':
+            alpha = img.getchannel('A')
+            if alpha.getextrema() != (255, 255):
+                mask = self._image_object(alpha.tobytes(), img.width, img.height,
+                                          "/ColorSpace /DeviceGray /BitsPerComponent 8")
+                smask = f" /SMask {mask} 0 R"
+            img = img.convert('RGB')
+        colorspace = {'L': '/DeviceGray', 'CMYK': '/DeviceCMYK'}.get(img.mode, '/DeviceRGB')
+        obj = self._image_object(img.tobytes(), img.width, img.height,
+                                 f"/ColorSpace {colorspace} /BitsPerComponent 8{smask}")
+        return self._ref(obj)
+
+    def image_strips(self, size, strips, colorspace='/DeviceCMYK'):
+        """
+        Embed a size = (w, h) image from an iterable of raw 8-bit strips (top to
+        bottom), compressing each as it arrives; returns a reference for draw().
+        """
+        obj, length = self._alloc(), self._alloc()
+        self.offsets[obj] = self.f.tell()
+        self.f.write(b"%d 0 obj\n<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace %s "
+                     b"/BitsPerComponent 8 /Filter /FlateDecode /Length %d 0 R >>\nstream\n"
+                     % (obj, size[0], size[1], colorspace.encode('latin-1'), length))
+        z = zlib.compressobj(self.compress_level)
+        written = 0
+        for data in strips:
+            chunk = z.compress(data)
+            self.f.write(chunk)
+            written += len(chunk)
+        chunk = z.flush()
+        self.f.write(chunk)
+        written += len(chunk)
+        self.f.write(b"\nendstream\nendobj\n")
+        self._write_object(length, str(written))
+        return self._ref(obj)
+
+    def icc_colorspace(self, icc, components=4):
+        """ICCBased color space from ICC profile bytes (components: 1, 3 or 4)."""
+        obj = self._alloc()
+        self._write_object(obj, f"<< /N {components} /Filter /FlateDecode >>", zlib.compress(icc, self.compress_level))
+        return f"[/ICCBased {obj} 0 R]"
+
+    def stencil(self, matrix):
+        """Embed a 2D bool array (True = painted) as a 1-bit stencil mask."""
+        matrix = np.asarray(matrix, dtype=bool)
+        height, width = matrix.shape
+        data = np.packbits(matrix, axis=1).tobytes()
+        obj = self._image_object(data, width, height,
+                                 "/ImageMask true /BitsPerComponent 1 /Decode [1 0] /Interpolate false")
+        return self._ref(obj)
+
+    def spot_color(self, name, cmyk=(0, 1, 0, 0)):
+        """Separation color space name, previewed as cmyk (magenta by default)."""
+        obj = self._alloc()
+        c, m, y, k = cmyk
+        self._write_object(obj, f"[/Separation /{name} /DeviceCMYK << /FunctionType 2 /Domain [0 1] "
+                                f"/C0 [0 0 0 0] /C1 [{c} {m} {y} {k}] /N 1 >>]")
+        return f"CS{obj}", obj
+
+    def layer(self, name):
+        """Optional content group (layer) called name."""
+        obj = self._alloc()
+        self._write_object(obj, f"<< /Type /OCG /Name ({name}) >>")
+        self.layers.append(obj)
+        return f"OC{obj}", obj
+
+    def page(self):
+        return PdfPage(self.page_size, self.dpi)
+
+    def add_page(self, page):
+        """Write page (content + page object) and forget it."""
+        content = self._alloc()
+        self._write_object(content, "<< /Filter /FlateDecode >>",
+                           zlib.compress("\n".join(page.ops).encode('latin-1'), self.compress_level))
+        resources = ''
+        for key, entries in (('XObject', page.xobjects), ('ColorSpace', page.colorspaces),
+                             ('Properties', page.properties)):
+            if entries:
+                resources += f" /{key} << " + ' '.join(f"/{n} {o} 0 R" for n, o in entries.items()) + " >>"
+        w, h = (v * 72 / self.dpi for v in self.page_size)
+        obj = self._alloc()
+        self._write_object(obj, f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {w:.2f} {h:.2f}] "
+                                f"/Resources <<{resources} >> /Contents {content} 0 R >>")
+        self.pages.append(obj)
+
+    def close(self):
+        if self.f.closed:
+            return
+        layers = ' '.join(f"{obj} 0 R" for obj in self.layers)
+        oc = f" /OCProperties << /OCGs [{layers}] /D << /Order [{layers}] >> >>" if self.layers else ''
+        self._write_object(1, f"<< /Type /Catalog /Pages 2 0 R{oc} >>")
+        kids = ' '.join(f"{p} 0 R" for p in self.pages)
+        self._write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.pages)} >>")
+        xref = self.f.tell()
+        self.f.write(b"xref\n0 %d\n0000000000 65535 f \n" % self.next_id)
+        for obj in range(1, self.next_id):
+            self.f.write(b"%010d 00000 n \n" % self.offsets[obj])
+        self.f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (self.next_id, xref))
+        self.f.close()
@@ -0,0 +1,120 @@
+"""
+Streaming PNG writer: the image is written band by band (top to bottom), so
+an 80 x 200 cm stand never has to exist as one 167 MB canvas.
+
+Rows are filtered like Pillow / libpng do (per row, the filter among None,
+Sub, Up, Average and Paeth with the smallest sum of absolute values), a few
+rows at a time with NumPy, and deflated as they arrive.
+
+Usage:
+  with PngWriter('stand.png', (4724, 11811), dpi=150) as png:
+      for band in bands:          # PIL images of the full width, any height
+          png.write(band)
+"""
+import os
+import struct
+import zlib
+
+import numpy as np
+
+COLOR_TYPES = {'L': (0, 1), 'RGB': (2, 3), 'RGBA': (6, 4)}
+
+def _chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+class PngWriter:
+    """Writes a PNG incrementally; use as a context manager or call close().
+    Leaving the context on an exception deletes the partial file."""
+    def __init__(self, path, size, mode='RGB', dpi=None, compress_level=6, filter_rows=64, idat_size=1 << 16):
+        self.size = size
+        self.mode = mode
+        color_type, self.bpp = COLOR_TYPES[mode]
+        self.filter_rows = filter_rows
+        self.idat_size = idat_size
+        self.rows = 0
+        self.prev = np.zeros(size[0] * self.bpp, dtype=np.uint8)
+        self.z = zlib.compressobj(compress_level)
+        self.pending = []
+        self.pending_size = 0
+        self.f = open(path, 'wb')
+        self.f.write(b'\x89PNG\r\n\x1a\n')
+        self.f.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', size[0], size[1], 8, color_type, 0, 0, 0)))
+        if dpi:
+            ppm = int(dpi / 0.0254 + 0.5)
+            self.f.write(_chunk(b'pHYs', struct.pack('>IIB', ppm, ppm, 1)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, band):
+        """Append the rows of band (PIL image of the full width, in the writer's mode)."""
+        if band.width != self.size[0]:
+            raise ValueError(f"PNG is {self.size[0]} px wide, got a band of {band.width} px")
+        if band.mode != self.mode:
+            band = band.convert(self.mode)
+        rows = np.asarray(band).reshape(band.height, -1)
+        for start in range(0, len(rows), self.filter_rows):
+            self._deflate(self._filter(rows[start:start + self.filter_rows]))
+        self.rows += band.height
+
+    def _filter(self, rows):
+        """Filtered scanlines (filter type byte + data) of rows, adaptively per row."""
+        # uint8 arithmetic wraps modulo 256, as the PNG filters do
+        x = rows
+        b = np.vstack([self.prev[None], x[:-1]])
+        a = np.zeros_like(x)
+        a[:, self.bpp:] = x[:, :-self.bpp]
+        c = np.zeros_like(x)
+        c[:, self.bpp:] = b[:, :-self.bpp]
+        self.prev = x[-1]
+
+        a16, b16, c16 = a.astype(np.int16), b.astype(np.int16), c.astype(np.int16)
+        pa, pb, pc = np.abs(b16 - c16), np.abs(a16 - c16), np.abs(a16 + b16 - 2 * c16)
+        paeth = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+        candidates = [x, x - a, x - b, x - ((a >> 1) + (b >> 1) + (a & b & 1)), x - paeth]
+        # Sum of absolute values with the bytes read as signed (libpng's heuristic)
+        cost = np.stack([np.minimum(f, -f).sum(axis=1, dtype=np.uint32) for f in candidates])
+        best = cost.argmin(axis=0)
+        out = np.empty((len(rows), x.shape[1] + 1), dtype=np.uint8)
+        out[:, 0] = best
+        for kind, f in enumerate(candidates):
+            chosen = best == kind
+            out[chosen, 1:] = f[chosen]
+        return out.tobytes()
+
+    def _deflate(self, data):
+        chunk = self.z.compress(data)
+        if chunk:
+            self.pending.append(chunk)
+            self.pending_size += len(chunk)
+            if self.pending_size >= self.idat_size:
+                self._flush_idat()
+
+    def _flush_idat(self):
+        if self.pending:
+            self.f.write(_chunk(b'IDAT', b''.join(self.pending)))
+            self.pending = []
+            self.pending_size = 0
+
+    def abort(self):
+        """Closes and deletes the unfinished file (after an error mid-render)."""
+        if not self.f.closed:
+            self.f.close()
+            os.remove(self.f.name)
+
+    def close(self):
+        if self.f.closed:
+            return
+        if self.rows != self.size[1]:
+            self.abort()
+            raise ValueError(f"PNG expects {self.size[1]} rows, got {self.rows}")
+        self.pending.append(self.z.flush())
+        self._flush_idat()
+        self.f.write(_chunk(b'IEND', b''))
+        self.f.close()
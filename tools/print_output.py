@@ -0,0 +1,365 @@
+"""
+Print output stage: converts finished sRGB artifacts (stickers, sheets,
+stands) to CMYK TIFF or PDF for the print shop, with an ink-coverage
+preflight report per artifact.
+
+Color management goes through ImageCms (LittleCMS) with a CMYK press profile,
+searched (in order) in:
+  1. --profile PATH / STICKER_CMYK_PROFILE
+  2. the platform color directories (Windows, macOS, Linux), by the usual
+     names of the coated press profiles (FOGRA39 / ISO Coated v2 / SWOP)
+The sRGB -> CMYK transform is built once per process (per profile and
+intent) and reused for every artifact. Without a profile, or without
+LittleCMS, a warning is issued and Pillow's uncalibrated RGB -> CMYK
+conversion is used instead (fine for proofs, not for press).
+
+Images are converted in strips of STRIP_ROWS rows that go straight to the
+file. 8-bit non-interlaced PNGs (every artifact in images/) are also read
+strip by strip: the IDAT stream is inflated incrementally and each strip is
+unfiltered by Pillow from a small PNG that starts with the row above it, so
+only one strip is ever decoded (a 4724 x 11811 stand never holds its full
+RGBA source or a full CMYK copy). Other files are decoded whole and cropped.
+Transparent areas become paper white.
+
+Preflight: total area coverage (TAC, C + M + Y + K in %, up to 400%) is
+accumulated per strip as a histogram; the report gives the max, the 99.9th
+percentile, the share of the area over the limit (300% by default; coated
+stock usually takes 300-330%), and the mean coverage per ink.
+
+Usage:
+  python tools/print_output.py [group|name|IMAGE ...]   (groups: stickers sheets stands)
+      [--format tiff|pdf] [--profile ICC] [--intent perceptual|relative|saturation|absolute]
+      [--tac-limit 300] [--out-dir print_output] [--report preflight.json]
+  (with no arguments, every sticker, sheet and stand in images/)
+"""
+from PIL import Image
+from functools import lru_cache
+import argparse
+import io
+import json
+import os
+import struct
+import sys
+import time
+import warnings
+import zlib
+
+import numpy as np
+
+try:
+    from PIL import ImageCms
+except ImportError:  # Pillow built without LittleCMS
+    ImageCms = None
+
+# Add current directory to path to import the pdf writer and the case list
+tools_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(tools_dir)
+from pdf_writer import PdfWriter
+from benchmark import build_cases, select_cases
+
+# Paths
+root = os.path.dirname(tools_dir)
+images_dir = os.path.join(root, 'images')
+DEFAULT_OUT_DIR = os.path.join(root, 'print_output')
+
+GROUPS = ('stickers', 'sheets', 'stands')
+PROFILE_NAMES = ['CoatedFOGRA39.icc', 'ISOcoated_v2_300_eci.icc', 'ISOcoated_v2_eci.icc',
+                 'PSOcoated_v3.icc', 'USWebCoatedSWOP.icc', 'Coated_Fogra39L_VIGC_300.icc']
+INTENTS = {
+    'perceptual': 0,
+    'relative': 1,
+    'saturation': 2,
+    'absolute': 3,
+}
+STRIP_ROWS = 256
+TAC_LIMIT = 300  # %
+PAPER_COLOR = (255, 255, 255)
+
+# --- Color transform ---
+def profile_dirs():
+    if sys.platform == 'win32':
+        return [os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'System32', 'spool', 'drivers', 'color')]
+    if sys.platform == 'darwin':
+        return ['/Library/ColorSync/Profiles', os.path.expanduser('~/Library/ColorSync/Profiles')]
+    return ['/usr/share/color/icc', '/usr/local/share/color/icc', os.path.expanduser('~/.local/share/icc'),
+            os.path.expanduser('~/.color/icc')]
+
+@lru_cache(maxsize=None)
+def resolve_profile(path=None):
+    """Path of the CMYK profile to use, or None when there is none."""
+    path = path or os.environ.get('STICKER_CMYK_PROFILE')
+    if path:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"CMYK profile not found: {path}")
+        return path
+    wanted = {name.lower(): n for n, name in enumerate(PROFILE_NAMES)}
+    found = {}
+    for d in profile_dirs():
+        for dirpath, _, files in os.walk(d):
+            for name in files:
+                if name.lower() in wanted:
+                    found.setdefault(wanted[name.lower()], os.path.join(dirpath, name))
+    return found[min(found)] if found else None
+
+@lru_cache(maxsize=None)
+def cmyk_transform(profile=None, intent='perceptual'):
+    """
+    (transform, icc bytes) for sRGB -> the CMYK profile, built once per
+    (profile, intent); (None, None) when color management is unavailable.
+    """
+    path = resolve_profile(profile)
+    if ImageCms is None or path is None:
+        reason = "Pillow has no LittleCMS support" if ImageCms is None else "no CMYK ICC profile found"
+        warnings.warn(f"{reason} (set STICKER_CMYK_PROFILE); using Pillow's uncalibrated CMYK conversion",
+                      stacklevel=2)
+        return None, None
+    cmyk = ImageCms.getOpenProfile(path)
+    transform = ImageCms.buildTransform(ImageCms.createProfile('sRGB'), cmyk, 'RGB', 'CMYK',
+                                        renderingIntent=INTENTS[intent])
+    return transform, cmyk.tobytes()
+
+def to_cmyk(img, transform=None):
+    """CMYK copy of img (alpha composited onto paper white first)."""
+    if img.mode in ('RGBA', 'LA', 'P', 'PA'):
+        img = img.convert('RGBA')
+        flat = Image.new('RGB', img.size, PAPER_COLOR)
+        flat.paste(img, (0, 0), img)
+        img = flat
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+    return transform.apply(img) if transform else img.convert('CMYK')
+
+def cmyk_strips(strips, transform=None):
+    """CMYK copies of strips, converted one at a time."""
+    for strip in strips:
+        yield to_cmyk(strip, transform)
+
+# --- Source strips ---
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}  # color type -> samples per pixel
+INFLATE_CHUNK = 1 << 20  # max bytes inflated per call, so a run of white stays small
+
+def png_chunks(f):
+    """(type, data) of every chunk of the PNG file f, up to IEND."""
+    if f.read(8) != PNG_SIGNATURE:
+        raise ValueError("not a PNG file")
+    while True:
+        length, kind = struct.unpack('>I4s', f.read(8))
+        data = f.read(length)
+        f.read(4)  # CRC, checked by Pillow on the strips it decodes
+        yield kind, data
+        if kind == b'IEND':
+            return
+
+def png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+def png_strips(path, rows=STRIP_ROWS):
+    """
+    Strips of rows rows of the 8-bit non-interlaced PNG at path, top to
+    bottom, decoded one at a time. The filtered rows are inflated from the
+    IDAT stream as they are needed; each strip is handed to Pillow as a PNG of
+    its own whose first row is the previous unfiltered row (filter None), so
+    the Up / Average / Paeth filters of its top row resolve as in the file.
+    """
+    with open(path, 'rb') as f:
+        header, inflate, pending, previous = [], zlib.decompressobj(), bytearray(), None
+        for kind, data in png_chunks(f):
+            if kind == b'IHDR':
+                width = struct.unpack('>I', data[:4])[0]
+                stride = 1 + width * PNG_CHANNELS[data[9]]
+            if kind not in (b'IDAT', b'IEND'):
+                header.append((kind, data))
+                continue
+            while data or (kind == b'IEND' and pending):
+                if kind == b'IDAT':
+                    pending += inflate.decompress(data, INFLATE_CHUNK)
+                    data = inflate.unconsumed_tail
+                while len(pending) >= rows * stride or (kind == b'IEND' and pending):
+                    n = min(rows, len(pending) // stride)
+                    body = bytes(pending[:n * stride])
+                    del pending[:n * stride]
+                    if previous is not None:
+                        body = b"\x00" + previous + body
+                    chunks = [png_chunk(k, struct.pack('>II', width, len(body) // stride) + d[8:] if k == b'IHDR' else d)
+                              for k, d in header]
+                    png = PNG_SIGNATURE + b''.join(chunks) + png_chunk(b'IDAT', zlib.compress(body, 1)) + png_chunk(b'IEND', b'')
+                    with Image.open(io.BytesIO(png)) as strip:
+                        strip.load()
+                    if previous is not None:
+                        strip = strip.crop((0, 1, width, strip.height))
+                    previous = strip.crop((0, strip.height - 1, width, strip.height)).tobytes()
+                    yield strip
+
+def source_strips(img, rows=STRIP_ROWS):
+    """Strips of the opened image img, read strip by strip from the file when it is a plain PNG."""
+    # The raw mode is the image mode only for 8 bits per sample (1/2/4/16-bit
+    # rows are unpacked by Pillow, so a row of the strip is not a row of the file)
+    if img.format == 'PNG' and len(img.tile) == 1 and img.tile[0][3] == img.mode \
+            and not img.info.get('interlace') and getattr(img, 'filename', None):
+        return png_strips(img.filename, rows)
+    img.load()
+    return (img.crop((0, y, img.width, min(img.height, y + rows))) for y in range(0, img.height, rows))
+
+# --- Preflight ---
+class Preflight:
+    """Ink coverage of CMYK strips, accumulated as a TAC histogram."""
+    def __init__(self, limit=TAC_LIMIT):
+        self.limit = limit
+        self.histogram = np.zeros(4 * 255 + 1, dtype=np.int64)
+        self.ink = np.zeros(4, dtype=np.float64)
+
+    def add(self, strip):
+        a = np.asarray(strip)
+        self.ink += a.reshape(-1, 4).sum(axis=0, dtype=np.float64)
+        self.histogram += np.bincount(a.sum(axis=2, dtype=np.uint16).ravel(), minlength=len(self.histogram))
+        return strip
+
+    def report(self):
+        pixels = int(self.histogram.sum())
+        levels = np.nonzero(self.histogram)[0]
+        cumulative = np.cumsum(self.histogram)
+        p999 = int(np.searchsorted(cumulative, pixels * 0.999))
+        over = int(self.histogram[int(np.floor(self.limit * 255 / 100)) + 1:].sum())
+        ink = self.ink / max(pixels, 1) / 255 * 100
+        return {
+            'tac_max': round(int(levels[-1]) / 255 * 100, 1) if len(levels) else 0.0,
+            'tac_p99_9': round(p999 / 255 * 100, 1),
+            'tac_limit': self.limit,
+            'over_limit': round(over / max(pixels, 1) * 100, 4),
+            'ink_mean': dict(zip('CMYK', (round(float(v), 2) for v in ink))),
+        }
+
+# --- Writers ---
+def write_tiff(path, size, strips, dpi=300, icc=None):
+    """
+    Baseline CMYK TIFF (Deflate-compressed strips, one per item of strips),
+    written as the strips arrive; the directory goes at the end.
+    """
+    with open(path, 'wb') as f:
+        f.write(b"II*\x00\x00\x00\x00\x00")  # IFD offset patched below
+        offsets, counts, rows = [], [], 0
+        for strip in strips:
+            data = zlib.compress(strip.tobytes(), 6)
+            offsets.append(f.tell())
+            counts.append(len(data))
+            rows = rows or strip.height
+            f.write(data)
+
+        # Out-of-line values (arrays, rationals, profile), then the directory
+        extra = {}
+        def put(key, data):
+            if f.tell() % 2:
+                f.write(b"\x00")
+            extra[key] = f.tell()
+            f.write(data)
+        put('bits', struct.pack('<4H', 8, 8, 8, 8))
+        put('offsets', struct.pack(f'<{len(offsets)}I', *offsets))
+        put('counts', struct.pack(f'<{len(counts)}I', *counts))
+        put('res', struct.pack('<2I', int(dpi), 1))
+        if icc:
+            put('icc', icc)
+
+        SHORT, LONG, RATIONAL, UNDEFINED = 3, 4, 5, 7
+        def strip_tag(tag, key, values):
+            # A single value is stored inline, not at an offset
+            return (tag, LONG, len(values), values[0] if len(values) == 1 else extra[key])
+        tags = [
+            (256, LONG, 1, size[0]),
+            (257, LONG, 1, size[1]),
+            (258, SHORT, 4, extra['bits']),
+            (259, SHORT, 1, 8),                 # Deflate
+            (262, SHORT, 1, 5),                 # separated (CMYK)
+            strip_tag(273, 'offsets', offsets),
+            (277, SHORT, 1, 4),
+            (278, LONG, 1, rows or size[1]),
+            strip_tag(279, 'counts', counts),
+            (282, RATIONAL, 1, extra['res']),
+            (283, RATIONAL, 1, extra['res']),
+            (284, SHORT, 1, 1),                 # chunky
+            (296, SHORT, 1, 2),                 # inch
+            (332, SHORT, 1, 1),                 # CMYK ink set
+        ]
+        if icc:
+            tags.append((34675, UNDEFINED, len(icc), extra['icc']))
+
+        if f.tell() % 2:
+            f.write(b"\x00")
+        ifd = f.tell()
+        f.write(struct.pack('<H', len(tags)))
+        for tag, kind, count, value in tags:
+            packed = struct.pack('<H', value) + b"\x00\x00" if kind == SHORT and count == 1 else struct.pack('<I', value)
+            f.write(struct.pack('<HHI', tag, kind, count) + packed)
+        f.write(struct.pack('<I', 0))
+        f.seek(4)
+        f.write(struct.pack('<I', ifd))
+
+def write_pdf(path, size, strips, dpi=300, icc=None):
+    """One-page PDF at the image's physical size, the CMYK image streamed into it."""
+    with PdfWriter(path, size, dpi) as pdf:
+        colorspace = pdf.icc_colorspace(icc) if icc else '/DeviceCMYK'
+        ref = pdf.image_strips(size, (s.tobytes() for s in strips), colorspace)
+        page = pdf.page()
+        page.draw(ref, 0, 0, *size)
+        pdf.add_page(page)
+
+WRITERS = {'tiff': (write_tiff, '.tif'), 'pdf': (write_pdf, '.pdf')}
+
+def convert(src, out_path, fmt='tiff', profile=None, intent='perceptual', tac_limit=TAC_LIMIT):
+    """Convert the image file src to a CMYK fmt file; returns the preflight report."""
+    transform, icc = cmyk_transform(profile, intent)
+    with Image.open(src) as img:
+        dpi = round(img.info.get('dpi', (300, 300))[0]) or 300
+        preflight = Preflight(tac_limit)
+        writer, _ = WRITERS[fmt]
+        writer(out_path, img.size, (preflight.add(s) for s in cmyk_strips(source_strips(img), transform)), dpi, icc)
+    return preflight.report()
+
+def artifact_paths(keys):
+    """Image paths for keys: existing files, or case groups / names (all of them when empty)."""
+    files = [k for k in keys if os.path.isfile(k) or os.path.isfile(os.path.join(images_dir, k))]
+    paths = [k if os.path.isfile(k) else os.path.join(images_dir, k) for k in files]
+    rest = [k for k in keys if k not in files]
+    if rest or not keys:
+        cases = [c for c in select_cases(build_cases(), rest) if c.group in GROUPS]
+        for c in cases:
+            paths += [os.path.join(root, o) for o in c.outputs if o.endswith('.png')]
+    return [p for p in paths if os.path.exists(p)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert finished artifacts to CMYK TIFF / PDF with preflight.")
+    parser.add_argument('keys', nargs='*', help="groups (stickers, sheets, stands), case names or image files")
+    parser.add_argument('--format', default='tiff', choices=WRITERS)
+    parser.add_argument('--profile', help="CMYK ICC profile (default: STICKER_CMYK_PROFILE or system search)")
+    parser.add_argument('--intent', default='perceptual', choices=INTENTS)
+    parser.add_argument('--tac-limit', type=float, default=TAC_LIMIT, help="total area coverage limit in %%")
+    parser.add_argument('--out-dir', default=DEFAULT_OUT_DIR)
+    parser.add_argument('--report', help="write the preflight reports to this JSON file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    transform, _ = cmyk_transform(args.profile, args.intent)
+    if transform:
+        print(f"Profile: {resolve_profile(args.profile)} ({args.intent}), "
+              f"transform built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    reports = {}
+    over = 0
+    for src in artifact_paths(args.keys):
+        start = time.perf_counter()
+        name = os.path.splitext(os.path.basename(src))[0]
+        out = os.path.join(args.out_dir, name + WRITERS[args.format][1])
+        report = reports[name] = convert(src, out, args.format, args.profile, args.intent, args.tac_limit)
+        flag = 'OVER' if report['over_limit'] else 'ok  '
+        over += bool(report['over_limit'])
+        print(f"{flag} {name:36s} {time.perf_counter() - start:5.2f}s  TAC max {report['tac_max']:5.1f}% "
+              f"p99.9 {report['tac_p99_9']:5.1f}%  over {report['over_limit']:.3f}%  -> {out}")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2)
+    print(f"\n{len(reports) - over}/{len(reports)} artifacts within {args.tac_limit:g}% total ink coverage")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Pure-Python QR code encoder (byte mode, versions 1-40, EC levels L/M/Q/H).
+
+encode() builds the module matrix (NumPy bool array, True = dark) with
+Reed-Solomon error correction and the lowest-penalty mask. qr_image()
+renders it straight onto a size x size pixel grid with integer module
+scaling (no resampling, module edges stay sharp); any remainder goes into
+the light margin around the symbol. For vector output, pass the matrix
+and qr_box() to SvgDocument.qr().
+
+Like images/qr_website.png, the rendered box holds the modules only
+(border=0); the layouts put their own light pad around it.
+"""
+from functools import lru_cache
+from PIL import Image
+import numpy as np
+
+# Error correction levels: index into the tables below and format-info bits
+EC_LEVELS = {'L': (0, 1), 'M': (1, 0), 'Q': (2, 3), 'H': (3, 2)}
+
+# Per level, per version (index 0 unused)
+ECC_CODEWORDS_PER_BLOCK = (
+    (-1, 7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28, 30, 28, 28, 28, 28, 30, 30, 26, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (-1, 10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28, 26, 26, 26, 26, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28),
+    (-1, 13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28, 28, 26, 30, 28, 30, 30, 30, 30, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (-1, 17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28, 28, 26, 28, 30, 24, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+)
+NUM_ERROR_CORRECTION_BLOCKS = (
+    (-1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8, 8, 9, 9, 10, 12, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19, 20, 21, 22, 24, 25),
+    (-1, 1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16, 17, 17, 18, 20, 21, 23, 25, 26, 28, 29, 31, 33, 35, 37, 38, 40, 43, 45, 47, 49),
+    (-1, 1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20, 23, 23, 25, 27, 29, 34, 34, 35, 38, 40, 43, 45, 48, 51, 53, 56, 59, 62, 65, 68),
+    (-1, 1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25, 25, 34, 30, 32, 35, 37, 40, 42, 45, 48, 51, 54, 57, 60, 63, 66, 70, 74, 77, 81),
+)
+
+MASKS = (
+    lambda y, x: (x + y) % 2 == 0,
+    lambda y, x: y % 2 == 0,
+    lambda y, x: x % 3 == 0,
+    lambda y, x: (x + y) % 3 == 0,
+    lambda y, x: (x // 3 + y // 2) % 2 == 0,
+    lambda y, x: x * y % 2 + x * y % 3 == 0,
+    lambda y, x: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda y, x: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+
+# --- Reed-Solomon over GF(256), polynomial 0x11D ---
+_EXP = [0] * 512
+_LOG = [0] * 256
+_v = 1
+for _i in range(255):
+    _EXP[_i] = _v
+    _LOG[_v] = _i
+    _v <<= 1
+    if _v & 0x100:
+        _v ^= 0x11D
+for _i in range(255, 512):
+    _EXP[_i] = _EXP[_i - 255]
+
+def _gf_mul(a, b):
+    return 0 if a == 0 or b == 0 else _EXP[_LOG[a] + _LOG[b]]
+
+@lru_cache(maxsize=None)
+def _rs_divisor(degree):
+    """Generator polynomial coefficients (highest term dropped) for degree ECC codewords."""
+    result = [0] * (degree - 1) + [1]
+    root = 1
+    for _ in range(degree):
+        for j in range(degree):
+            result[j] = _gf_mul(result[j], root)
+            if j + 1 < degree:
+                result[j] ^= result[j + 1]
+        root = _gf_mul(root, 0x02)
+    return tuple(result)
+
+def _rs_remainder(data, divisor):
+    result = [0] * len(divisor)
+    for b in data:
+        factor = b ^ result.pop(0)
+        result.append(0)
+        for i, coef in enumerate(divisor):
+            result[i] ^= _gf_mul(coef, factor)
+    return result
+
+# --- Capacity ---
+def _raw_data_modules(version):
+    result = (16 * version + 128) * version + 64
+    if version >= 2:
+        num_align = version // 7 + 2
+        result -= (25 * num_align - 10) * num_align - 55
+        if version >= 7:
+            result -= 36
+    return result
+
+def _data_codewords(version, ec):
+    e = EC_LEVELS[ec][0]
+    return (_raw_data_modules(version) // 8
+            - ECC_CODEWORDS_PER_BLOCK[e][version] * NUM_ERROR_CORRECTION_BLOCKS[e][version])
+
+def _alignment_positions(version):
+    if version == 1:
+        return []
+    num_align = version // 7 + 2
+    step = (version * 8 + num_align * 3 + 5) // (num_align * 4 - 4) * 2
+    size = version * 4 + 17
+    return [6] + [size - 7 - i * step for i in reversed(range(num_align - 1))]
+
+# --- Matrix construction ---
+def _function_patterns(version):
+    """(modules, is_function) with finders, timing, alignment and version info drawn."""
+    size = version * 4 + 17
+    modules = np.zeros((size, size), dtype=bool)
+    is_function = np.zeros((size, size), dtype=bool)
+
+    def set_module(x, y, dark):
+        modules[y, x] = dark
+        is_function[y, x] = True
+
+    for i in range(size):
+        set_module(6, i, i % 2 == 0)
+        set_module(i, 6, i % 2 == 0)
+    for cx, cy in ((3, 3), (size - 4, 3), (3, size - 4)):
+        for dy in range(-4, 5):
+            for dx in range(-4, 5):
+                x, y = cx + dx, cy + dy
+                if 0 <= x < size and 0 <= y < size:
+                    set_module(x, y, max(abs(dx), abs(dy)) not in (2, 4))
+    positions = _alignment_positions(version)
+    last = len(positions) - 1
+    for i, cx in enumerate(positions):
+        for j, cy in enumerate(positions):
+            if (i, j) in ((0, 0), (0, last), (last, 0)):
+                continue
+            for dy in range(-2, 3):
+                for dx in range(-2, 3):
+                    set_module(cx + dx, cy + dy, max(abs(dx), abs(dy)) != 1)
+    # Reserve the format areas (real bits are drawn per mask)
+    _draw_format(modules, is_function, 0, 0)
+    if version >= 7:
+        rem = version
+        for _ in range(12):
+            rem = (rem << 1) ^ ((rem >> 11) * 0x1F25)
+        bits = version << 12 | rem
+        for i in range(18):
+            bit = (bits >> i) & 1 != 0
+            a, b = size - 11 + i % 3, i // 3
+            set_module(a, b, bit)
+            set_module(b, a, bit)
+    return modules, is_function
+
+def _draw_format(modules, is_function, format_bits, mask):
+    size = modules.shape[0]
+    data = format_bits << 3 | mask
+    rem = data
+    for _ in range(10):
+        rem = (rem << 1) ^ ((rem >> 9) * 0x537)
+    bits = (data << 10 | rem) ^ 0x5412
+
+    def set_module(x, y, i):
+        modules[y, x] = (bits >> i) & 1 != 0
+        is_function[y, x] = True
+
+    for i in range(6):
+        set_module(8, i, i)
+    set_module(8, 7, 6)
+    set_module(8, 8, 7)
+    set_module(7, 8, 8)
+    for i in range(9, 15):
+        set_module(14 - i, 8, i)
+    for i in range(8):
+        set_module(size - 1 - i, 8, i)
+    for i in range(8, 15):
+        set_module(8, size - 15 + i, i)
+    modules[size - 8, 8] = True  # Dark module
+    is_function[size - 8, 8] = True
+
+def _place_codewords(modules, is_function, codewords):
+    size = modules.shape[0]
+    bits = np.unpackbits(np.array(codewords, dtype=np.uint8))
+    i = 0
+    right = size - 1
+    while right >= 1:
+        if right == 6:
+            right = 5
+        upward = ((right + 1) & 2) == 0
+        for vert in range(size):
+            y = size - 1 - vert if upward else vert
+            for x in (right, right - 1):
+                if not is_function[y, x] and i < len(bits):
+                    modules[y, x] = bits[i]
+                    i += 1
+        right -= 2
+
+def _codewords(data, version, ec):
+    """Data bit stream (byte mode) plus interleaved ECC codewords."""
+    e = EC_LEVELS[ec][0]
+    capacity = _data_codewords(version, ec)
+    count_bits = 8 if version <= 9 else 16
+    bits = '0100' + format(len(data), f'0{count_bits}b') + ''.join(format(b, '08b') for b in data)
+    bits += '0' * min(4, capacity * 8 - len(bits))
+    bits += '0' * (-len(bits) % 8)
+    payload = [int(bits[i:i + 8], 2) for i in range(0, len(bits), 8)]
+    payload += [0xEC, 0x11] * ((capacity - len(payload)) // 2) + [0xEC] * ((capacity - len(payload)) % 2)
+
+    num_blocks = NUM_ERROR_CORRECTION_BLOCKS[e][version]
+    block_ecc_len = ECC_CODEWORDS_PER_BLOCK[e][version]
+    raw_codewords = _raw_data_modules(version) // 8
+    num_short_blocks = num_blocks - raw_codewords % num_blocks
+    short_block_len = raw_codewords // num_blocks
+    divisor = _rs_divisor(block_ecc_len)
+
+    blocks = []
+    k = 0
+    for i in range(num_blocks):
+        length = short_block_len - block_ecc_len + (0 if i < num_short_blocks else 1)
+        block = payload[k:k + length]
+        k += length
+        ecc = _rs_remainder(block, divisor)
+        if i < num_short_blocks:
+            block.append(0)  # Placeholder so all blocks have the same length
+        blocks.append(block + ecc)
+
+    result = []
+    for i in range(len(blocks[0])):
+        for j, block in enumerate(blocks):
+            if i != short_block_len - block_ecc_len or j >= num_short_blocks:
+                result.append(block[i])
+    return result
+
+# --- Mask penalty (ISO/IEC 18004 rules, vectorized) ---
+_FINDER_LIKE = (np.array([1, 0, 1, 1, 1, 0, 1, 0, 0, 0, 0], dtype=bool),
+                np.array([0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1], dtype=bool))
+
+def _penalty(modules):
+    size = modules.shape[0]
+    penalty = 0
+    for grid in (modules, modules.T):
+        # Rule 1: runs of 5+ same-colored modules
+        changes = np.diff(grid.astype(np.int8), axis=1) != 0
+        for row in changes:
+            edges = np.flatnonzero(row)
+            runs = np.diff(np.concatenate(([-1], edges, [size - 1])))
+            penalty += int(np.sum(runs[runs >= 5] - 2))
+        # Rule 3: 1:1:3:1:1 finder-like patterns with 4 light modules on one side
+        padded = np.pad(grid, ((0, 0), (4, 4)))
+        windows = np.lib.stride_tricks.sliding_window_view(padded, 11, axis=1)
+        for pattern in _FINDER_LIKE:
+            penalty += 40 * int(np.sum(np.all(windows == pattern, axis=2)))
+    # Rule 2: 2x2 blocks of one color
+    block = (modules[:-1, :-1] == modules[1:, :-1]) & (modules[:-1, :-1] == modules[:-1, 1:]) & \
+            (modules[:-1, :-1] == modules[1:, 1:])
+    penalty += 3 * int(np.sum(block))
+    # Rule 4: dark/light balance
+    total = size * size
+    dark = int(np.sum(modules))
+    penalty += 10 * (abs(dark * 20 - total * 10) // total)
+    return penalty
+
+@lru_cache(maxsize=256)
+def encode(data, ec='L', boost_ec=True, mask=None):
+    """
+    Module matrix for data (str, UTF-8 encoded, or bytes) as a read-only NumPy bool array.
+    Uses the smallest version that fits at level ec; with boost_ec the level is raised as
+    far as that version allows. mask: 0-7, or None for the lowest-penalty mask.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if ec not in EC_LEVELS:
+        raise ValueError(f"Unknown error correction level: {ec!r}")
+    for version in range(1, 41):
+        header_bits = 4 + (8 if version <= 9 else 16)
+        if header_bits + len(data) * 8 <= _data_codewords(version, ec) * 8:
+            break
+    else:
+        raise ValueError(f"Data too long for a QR code: {len(data)} bytes")
+    if boost_ec:
+        for level in ('M', 'Q', 'H'):
+            if EC_LEVELS[level][0] > EC_LEVELS[ec][0] and \
+                    header_bits + len(data) * 8 <= _data_codewords(version, level) * 8:
+                ec = level
+
+    base, is_function = _function_patterns(version)
+    _place_codewords(base, is_function, _codewords(data, version, ec))
+    size = base.shape[0]
+    ys, xs = np.indices((size, size))
+
+    best = None
+    for m in (range(8) if mask is None else (mask,)):
+        modules = base ^ (MASKS[m](ys, xs) & ~is_function)
+        _draw_format(modules, is_function.copy(), EC_LEVELS[ec][1], m)
+        score = _penalty(modules)
+        if best is None or score < best[0]:
+            best = (score, modules)
+    modules = best[1]
+    modules.setflags(write=False)
+    return modules
+
+# --- Rendering ---
+def qr_box(n, size, border=0):
+    """(offset, module) of an n-module symbol on a size px grid: integer module size, centered."""
+    module = size // (n + 2 * border)
+    if module < 1:
+        raise ValueError(f"{size}px is too small for a {n}-module QR code")
+    return (size - module * n) // 2, module
+
+def render_matrix(matrix, size, border=0, fill=(0, 0, 0, 255), background=(255, 255, 255, 255)):
+    """
+    Module matrix drawn on a size x size image, each module an integer block of pixels.
+    RGBA for 4-tuple colors, RGB for 3-tuples.
+    """
+    n = matrix.shape[0]
+    offset, module = qr_box(n, size, border)
+    canvas = np.empty((size, size, len(background)), dtype=np.uint8)
+    canvas[:] = background
+    scaled = np.repeat(np.repeat(matrix, module, axis=0), module, axis=1)
+    canvas[offset:offset + n * module, offset:offset + n * module][scaled] = fill
+    return Image.fromarray(canvas, 'RGBA' if len(background) == 4 else 'RGB')
+
+def qr_image(data, size, border=0, ec='L', fill=(0, 0, 0, 255), background=(255, 255, 255, 255)):
+    """QR code for data rendered pixel-exact at size x size."""
+    return render_matrix(encode(data, ec), size, border, fill, background)
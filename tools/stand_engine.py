@@ -0,0 +1,764 @@
+"""
+Declarative stand engine.
+
+Every roll-up stand (80 x 200 cm) is a spec (see stand_catalog.json) instead
+of a script: size, DPI, theme colors, font family and a list of sections
+drawn top to bottom. A cursor (y) runs down the stand; each section draws at
+the cursor and moves it. Fonts, decoded assets and QR codes are shared
+between stands, so a whole catalog renders in one process. Sections do not
+draw directly: they record into a DisplayList, which is replayed in bands of
+BAND_ROWS rows and streamed to the PNG (png_writer.py), so the full 167 MB
+canvas is never allocated.
+
+Sections (every section also takes "after": space added below it):
+  header      height, logo {height, top, square}, align center|split, title, fill (curved band)
+  text        text, font, color, x (default: centered), advance (default: text height)
+  paragraph   text, font, color, width, x, align center|left|right, line_spacing
+  hero        height, slant (diagonal bottom edge), bars {color, size}, slogan {text, font, inset, top, shadow}
+  background  fill, bottom (from the cursor down, including the triangle under a slanted hero)
+  pattern     circles / leaves {count, radius | width + height, x, y, color, alpha}, placed at random from seed
+  bullets     items, font, color, bullet {x, radius, dy, color}, text_x, width (wraps), step | gap
+  points      items [[title, desc]], layout row|list, icon, title, desc, card (list only)
+  cards       items [[title, desc]] in a grid of cards: columns, row_height, margin, icon, title, desc
+  values      items, layout strip|grid, height, fill, title, font, color, ...
+  footer      layout side (QR left, lines right) | center (curved band, QR and lines centered)
+Lengths are layout pixels at the spec's DPI (physical lengths: 1 px is
+1/dpi inch), or expressions over W and H (stand size), side and bottom
+(safety margins), y (the cursor) and the units cm and mm, e.g. "H * 0.15",
+"W - 2 * side" or "3 * cm" (numbers, names, + - * / // and parentheses
+only; expressions are evaluated, never executed); results are truncated to
+whole pixels. A proxy preview (--preview) lays the stand out exactly the
+same and scales the output, fonts and images included, to a low DPI.
+Colors are theme names ("dark", "accent", ...) or '#rrggbb'. Fonts are
+{"size": px, "bold": true} in the spec's font family, or in "family" (e.g.
+"symbols" for the check marks). RTL specs ("rtl": true) shape the text and
+mirror the header, slogan, bullets and value grid. Text wraps greedily, or
+with "line_breaking": "optimal" (Knuth-Plass style, see linebreak.py).
+
+Usage: python tools/stand_engine.py [name|tag ...] [--list] [--out-dir DIR] [--band-rows N]
+       python tools/stand_engine.py [name|tag ...] --preview [DPI]   (previews/, default 15 DPI)
+"""
+from PIL import Image, ImageDraw
+import argparse
+import ast
+import json
+import math
+import operator
+import os
+import random
+import sys
+
+# Add current directory to path to import the shared helpers
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from sticker_engine import parse_color
+from sticker_utils import shape_rtl
+from qr_encoder import qr_image
+from png_writer import PngWriter
+from linebreak import break_lines
+import assets
+import fonts
+
+# Paths
+tools_dir = os.path.dirname(os.path.abspath(__file__))
+root = os.path.dirname(tools_dir)
+images_dir = os.path.join(root, 'images')
+previews_dir = os.path.join(root, 'previews')
+CATALOG_PATH = os.path.join(tools_dir, 'stand_catalog.json')
+
+# Rows per band when streaming a stand to PNG (4724 x 256 RGB = 3.6 MB)
+BAND_ROWS = 256
+# Proxy preview resolution (80 x 200 cm -> 472 x 1181 px)
+PREVIEW_DPI = 15
+
+def cm(value, dpi):
+    """Centimetres to pixels at dpi (truncated, like the original stand layouts)."""
+    return int(value / 2.54 * dpi)
+
+# Operators allowed in length expressions
+BINARY_OPS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+              ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv}
+UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+def eval_length(expr, names):
+    """Value of a length expression: numbers, the given names, + - * / // and parentheses."""
+    def value(node):
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return node.value
+        if isinstance(node, ast.Name) and node.id in names:
+            return names[node.id]
+        if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPS:
+            return BINARY_OPS[type(node.op)](value(node.left), value(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPS:
+            return UNARY_OPS[type(node.op)](value(node.operand))
+        what = f"name {node.id!r}" if isinstance(node, ast.Name) else type(node).__name__
+        raise ValueError(f"Unsupported length expression {expr!r}: {what} (allowed: numbers, "
+                         f"{', '.join(names)}, + - * / //)")
+    return value(ast.parse(expr, mode='eval').body)
+
+def blend(base, color, alpha):
+    """Pillow's 8-bit blend of color over base at alpha (what a masked paste computes)."""
+    t = base * (255 - alpha) + color * alpha + 128
+    return ((t >> 8) + t) >> 8
+
+def composite_shapes(img, shapes, dy=0):
+    """
+    Composites translucent ellipses [(box, rgba)] over img, whose first row is
+    canvas row dy, as if they were drawn into one RGBA layer (a later shape
+    replaces an earlier one where they overlap) and that layer was pasted.
+    Only the covered bounding box is touched: the shapes are drawn as color
+    indices into one L coverage buffer. The color and alpha of an index are
+    constant, so its blend is a per-channel lookup table over the region,
+    copied through a 1-bit mask; no per-pixel blending.
+    """
+    shapes = [(box, rgba) for box, rgba in shapes if box[3] >= dy and box[1] < dy + img.height]
+    if not shapes:
+        return
+    left = max(0, math.floor(min(box[0] for box, _ in shapes)))
+    right = min(img.width, math.floor(max(box[2] for box, _ in shapes)) + 1)
+    top = max(0, math.floor(min(box[1] for box, _ in shapes)) - dy)
+    bottom = min(img.height, math.floor(max(box[3] for box, _ in shapes)) - dy + 1)
+    if left >= right or top >= bottom:
+        return
+    colors = list(dict.fromkeys(rgba for _, rgba in shapes))
+    coverage = Image.new('L', (right - left, bottom - top), 0)
+    draw = ImageDraw.Draw(coverage)
+    for (x0, y0, x1, y1), rgba in shapes:
+        draw.ellipse([x0 - left, y0 - dy - top, x1 - left, y1 - dy - top], fill=colors.index(rgba) + 1)
+    covered = coverage.getbbox()
+    if not covered:
+        return
+    coverage = coverage.crop(covered)
+    left, top = left + covered[0], top + covered[1]
+    region = img.crop((left, top, left + coverage.width, top + coverage.height))
+    for index, rgba in enumerate(colors, 1):
+        *color, alpha = rgba
+        lut = [blend(v, c, alpha) for c in color for v in range(256)]
+        mask = coverage.point([255 if v == index else 0 for v in range(256)], '1')
+        img.paste(region.point(lut), (left, top), mask)
+
+class DisplayList:
+    """
+    Drawing operations of one stand, recorded with the rows they touch instead
+    of being drawn, and replayed into horizontal bands: a band only runs the
+    operations that reach it, so memory is bounded by the band rather than the
+    4724 x 11811 canvas (the full canvas is simply one tall band). Offers the
+    subset of the Image / ImageDraw API the sections use.
+
+    Sections work in layout pixels (the spec's DPI); scale maps them to the
+    output, so a proxy preview is the same layout with every coordinate, font
+    size and image scaled. Text is measured at the layout size, so line breaks
+    do not depend on the output resolution.
+    """
+    def __init__(self, size, background, scale=1):
+        self.scale = scale
+        self.size = tuple(self._s(v) for v in size)
+        self.background = background
+        self.ops = []
+        self._measure = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+        self._fonts = {}
+
+    def _s(self, v):
+        """Layout px to output px (untouched at scale 1)."""
+        return v if self.scale == 1 else int(round(v * self.scale))
+
+    def _font(self, font):
+        if self.scale == 1:
+            return font
+        size = max(1, self._s(font.size))
+        key = (font.path, font.index, size)
+        if key not in self._fonts:
+            self._fonts[key] = font.font_variant(size=size)
+        return self._fonts[key]
+
+    def _add(self, top, bottom, op):
+        # op(band, draw, dy) draws into a band whose first row is output row dy
+        self.ops.append((math.floor(top) - 1, math.ceil(bottom) + 1, op))
+
+    def textbbox(self, xy, text, font):
+        return self._measure.textbbox(xy, text, font=font)
+
+    def text(self, xy, text, font, fill):
+        x, y = self._s(xy[0]), self._s(xy[1])
+        font = self._font(font)
+        bbox = self.textbbox((x, y), text, font)
+        self._add(bbox[1], bbox[3], lambda band, draw, dy: draw.text((x, y - dy), text, font=font, fill=fill))
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        x0, y0, x1, y1 = (self._s(v) for v in xy)
+        width = max(1, self._s(width))
+        self._add(y0, y1, lambda band, draw, dy: draw.rectangle([x0, y0 - dy, x1, y1 - dy], fill=fill,
+                                                                outline=outline, width=width))
+
+    def ellipse(self, xy, fill):
+        x0, y0, x1, y1 = (self._s(v) for v in xy)
+        self._add(y0, y1, lambda band, draw, dy: draw.ellipse([x0, y0 - dy, x1, y1 - dy], fill=fill))
+
+    def polygon(self, points, fill):
+        points = [(self._s(x), self._s(y)) for x, y in points]
+        ys = [y for _, y in points]
+        self._add(min(ys), max(ys),
+                  lambda band, draw, dy: draw.polygon([(x, y - dy) for x, y in points], fill=fill))
+
+    def paste(self, im, xy, mask=None):
+        """Pastes im at xy (mask: im itself, or an L image of its size)."""
+        if self.scale != 1:
+            size = (max(1, self._s(im.width)), max(1, self._s(im.height)))
+            resized = im.resize(size, Image.LANCZOS)
+            if mask is not None:
+                mask = resized if mask is im else mask.resize(size, Image.LANCZOS)
+            im = resized
+        self._paste(im, (self._s(xy[0]), self._s(xy[1])), mask)
+
+    def asset(self, path, size, xy, mode='RGBA', box=None, clip=None):
+        """
+        Pastes the asset at path, resized to size, at xy: only its region box if
+        given, clipped to the polygon clip (points relative to the region). RGBA
+        assets are pasted through their alpha. A whole asset is resized once, at
+        the output scale (assets.resized caches it); a region (a hero photo
+        cropped to cover) is resampled band by band from the decoded source,
+        so the resized image never exists in full.
+        """
+        w, h = size
+        x0, y0, x1, y1 = box or (0, 0, w, h)
+        x, y = self._s(xy[0]), self._s(xy[1])
+        if self.scale != 1:
+            w, h = self._s(w), self._s(h)
+            x0, y0, x1, y1 = (self._s(v) for v in (x0, y0, x1, y1))
+            clip = clip and [(self._s(px), self._s(py)) for px, py in clip]
+        if box is None:
+            im = assets.resized(path, (w, h), mode)
+            self._paste(im, (x, y), im if mode == 'RGBA' else None)
+            return
+
+        src = assets.load(path, mode)
+        fx, fy = src.width / w, src.height / h
+        def op(band, draw, dy):
+            first, last = max(y, dy), min(y + y1 - y0, dy + band.height)
+            if first >= last:
+                return
+            top, bottom = y0 + first - y, y0 + last - y
+            region = src.resize((x1 - x0, last - first), Image.LANCZOS,
+                                box=(x0 * fx, top * fy, x1 * fx, bottom * fy))
+            mask = None
+            if clip:
+                mask = Image.new('L', region.size, 0)
+                ImageDraw.Draw(mask).polygon([(px, py - (first - y)) for px, py in clip], fill=255)
+            elif mode == 'RGBA':
+                mask = region
+            band.paste(region, (x, first - dy), mask)
+        self._add(y, y + y1 - y0, op)
+
+    def _paste(self, im, xy, mask=None):
+        # Each band crops out just the rows of im (and mask, the same size) it covers
+        x, y = xy
+        def op(band, draw, dy):
+            first, last = max(y, dy), min(y + im.height, dy + band.height)
+            if first >= last:
+                return
+            rows = (0, first - y, im.width, last - y)
+            band.paste(im.crop(rows), (x, first - dy), mask.crop(rows) if mask else None)
+        self._add(y, y + im.height, op)
+
+    def overlay(self, shapes):
+        """Translucent ellipses [(box, rgba)] composited over the stand (see composite_shapes)."""
+        if not shapes:
+            return
+        shapes = [([self._s(v) for v in box], rgba) for box, rgba in shapes]
+        self._add(min(box[1] for box, _ in shapes), max(box[3] for box, _ in shapes),
+                  lambda band, draw, dy: composite_shapes(band, shapes, dy))
+
+    def band(self, top, height):
+        """Output rows [top, top + height) of the stand."""
+        img = Image.new('RGB', (self.size[0], height), self.background)
+        draw = ImageDraw.Draw(img)
+        for first, last, op in self.ops:
+            if last >= top and first < top + height:
+                op(img, draw, top)
+        return img
+
+    def bands(self, rows):
+        """The stand, top to bottom, as bands of at most rows rows."""
+        for top in range(0, self.size[1], rows):
+            yield self.band(top, min(rows, self.size[1] - top))
+
+    def render(self):
+        return self.band(0, self.size[1])
+
+class Stand:
+    """
+    Canvas (display list), cursor and theme of one stand being laid out, in
+    layout px at the spec's DPI; the canvas renders at dpi (default: the same).
+    """
+    def __init__(self, spec, themes, dpi=None):
+        self.spec = spec
+        self.dpi = spec.get('dpi', 150)
+        self.W, self.H = (cm(v, self.dpi) for v in spec['size_cm'])
+        self.side = cm(spec.get('side_margin_cm', 5), self.dpi)
+        self.bottom = cm(spec.get('bottom_margin_cm', 15), self.dpi)
+        self.family = spec.get('font_family', 'arial')
+        self.rtl = spec.get('rtl', False)
+        self.breaking = spec.get('line_breaking', 'greedy')
+        palette = dict(themes.get(spec.get('theme'), {}))
+        palette.update(spec.get('palette', {}))
+        self.palette = {name: parse_color(c) for name, c in palette.items()}
+        scale = dpi / self.dpi if dpi else 1
+        self.canvas = DisplayList((self.W, self.H), self.color(spec.get('background', 'white')), scale)
+        self.y = 0
+        self.slant = 0
+
+    def length(self, value, **names):
+        if isinstance(value, str):
+            scope = {'W': self.W, 'H': self.H, 'side': self.side, 'bottom': self.bottom, 'y': self.y,
+                     'cm': self.dpi / 2.54, 'mm': self.dpi / 25.4}
+            scope.update(names)
+            value = eval_length(value, scope)
+        return int(value)
+
+    def color(self, value):
+        if isinstance(value, str) and value in self.palette:
+            return self.palette[value]
+        return parse_color(value)
+
+    def font(self, font_spec):
+        return fonts.get_font(font_spec['size'], font_spec.get('bold', False), font_spec.get('family', self.family))
+
+    def shape(self, text, font):
+        """Text as drawn (RTL text is shaped and reordered)."""
+        return ''.join(shape_rtl(text, font)) if self.rtl else text
+
+    def text_size(self, text, font):
+        bbox = self.canvas.textbbox((0, 0), text, font)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+    def wrap(self, text, font, width):
+        """Word wrap of text (logical order) into lines at most width px wide (see linebreak.py)."""
+        return break_lines(text, font, width, rtl=self.rtl, method=self.breaking)
+
+    def draw_lines(self, lines, font, fill, x, width, y, align='left', line_spacing=1.2, step=None):
+        """Draws lines aligned in the box [x, x + width]; returns the y below the last line."""
+        for line in lines:
+            shown = self.shape(line, font)
+            w, h = self.text_size(shown, font)
+            if align == 'center':
+                dx = x + (width - w) // 2
+            elif align == 'right':
+                dx = x + width - w
+            else:
+                dx = x
+            self.canvas.text((dx, y), shown, font=font, fill=fill)
+            y += step if step else int(h * line_spacing)
+        return y
+
+    def centered_text(self, text, font, y, fill):
+        """One line centered on the stand; returns its height."""
+        shown = self.shape(text, font)
+        w, h = self.text_size(shown, font)
+        self.canvas.text(((self.W - w) // 2, y), shown, font=font, fill=fill)
+        return h
+
+    def icon(self, box, letter, font_spec, nudge, color, centered=False):
+        """Filled circle in box (x0, y0, size) with a white initial."""
+        x, y, size = box
+        self.canvas.ellipse([x, y, x + size, y + size], fill=self.color(color))
+        font = self.font(font_spec)
+        lw, lh = self.text_size(letter, font)
+        lx = x + size // 2 - lw // 2 if centered else x + (size - lw) // 2
+        self.canvas.text((lx, y + (size - lh) // 2 + nudge), letter, font=font, fill=self.color('white'))
+
+def qr_tile(url, size, pad):
+    """QR code on a white square with pad px of quiet zone."""
+    qr = qr_image(url, size)
+    tile = Image.new('RGBA', (size + 2 * pad, size + 2 * pad), (255, 255, 255))
+    tile.paste(qr, (pad, pad), qr)
+    return tile
+
+# --- Sections ---
+def draw_header(s, el):
+    height = s.length(el['height'])
+    if 'fill' in el:
+        k = el.get('overhang', 0.2)
+        s.canvas.ellipse([-s.W * k, -height, s.W * (1 + k), height], fill=s.color(el['fill']))
+    logo = el.get('logo')
+    if logo:
+        path = os.path.join(images_dir, logo.get('src', 'logo_circular.png'))
+        src = assets.load(path)
+        lh = int(height * logo['height'])
+        lw = lh if logo.get('square') else int(lh * (src.width / src.height))
+        top = int(height * logo['top']) if 'top' in logo else (height - lh) // 2
+        if el.get('align', 'center') == 'center':
+            x = (s.W - lw) // 2
+        else:
+            x = s.W - s.side - lw if s.rtl else s.side
+        s.canvas.asset(path, (lw, lh), (x, top))
+    title = el.get('title')
+    if title:
+        font = s.font(title['font'])
+        shown = s.shape(title['text'], font)
+        tw, th = s.text_size(shown, font)
+        x = s.side if s.rtl else s.W - s.side - tw
+        s.canvas.text((x, (height - th) // 2), shown, font=font, fill=s.color(title['color']))
+    s.y = height
+
+def draw_text(s, el):
+    font = s.font(el['font'])
+    if 'x' in el:
+        shown = s.shape(el['text'], font)
+        s.canvas.text((s.length(el['x']), s.y), shown, font=font, fill=s.color(el['color']))
+        h = s.text_size(shown, font)[1]
+    else:
+        h = s.centered_text(el['text'], font, s.y, s.color(el['color']))
+    s.y += s.length(el['advance']) if 'advance' in el else h
+
+def draw_paragraph(s, el):
+    font = s.font(el['font'])
+    width = s.length(el.get('width', 'W - 2 * side'))
+    align = el.get('align', 'center')
+    # Centered text is centered on the stand unless a box is given
+    x, box = (s.length(el['x']), width) if 'x' in el else (0, s.W)
+    s.y = s.draw_lines(s.wrap(el['text'], font, width), font, s.color(el.get('color', 'text')),
+                       x, box, s.y, align, el.get('line_spacing', 1.2))
+
+def draw_hero(s, el):
+    height = s.length(el['height'])
+    slant = s.length(el.get('slant', 0))
+    path = os.path.join(images_dir, el.get('src', 'tadweer_image.jpeg'))
+    src = assets.load(path, 'RGB')
+    # Cover the full width x height, center crop
+    ratio = max(s.W / src.width, height / src.height)
+    new_w, new_h = int(src.width * ratio), int(src.height * ratio)
+    crop_x, crop_y = (new_w - s.W) // 2, (new_h - height) // 2
+    clip = [(0, 0), (s.W, 0), (s.W, height - slant), (0, height)] if slant else None
+    s.canvas.asset(path, (new_w, new_h), (0, s.y), 'RGB', box=(crop_x, crop_y, crop_x + s.W, crop_y + height), clip=clip)
+
+    bars = el.get('bars')
+    if bars:
+        size, fill = bars['size'], s.color(bars['color'])
+        s.canvas.rectangle([0, s.y, s.W, s.y + size], fill=fill)
+        s.canvas.rectangle([0, s.y + height - size, s.W, s.y + height], fill=fill)
+
+    slogan = el.get('slogan')
+    if slogan:
+        font = s.font(slogan['font'])
+        shown = s.shape(slogan['text'], font)
+        inset = slogan.get('inset', 50)
+        if s.rtl:
+            x = s.W - s.side - s.text_size(shown, font)[0] - inset
+        else:
+            x = s.side + inset
+        y = s.y + slogan['top']
+        shadow = slogan.get('shadow', 5)
+        s.canvas.text((x + shadow, y + shadow), shown, font=font, fill=s.color(slogan.get('shadow_color', 'black')))
+        s.canvas.text((x, y), shown, font=font, fill=s.color(slogan.get('color', 'white')))
+
+    s.y += height
+    s.slant = slant
+
+def draw_background(s, el):
+    fill = s.color(el['fill'])
+    s.canvas.rectangle([0, s.y, s.W, s.length(el.get('bottom', 'H'))], fill=fill)
+    if s.slant:
+        s.canvas.polygon([(0, s.y), (s.W, s.y - s.slant), (s.W, s.y), (0, s.y)], fill=fill)
+
+def draw_pattern(s, el):
+    # Own generator: the same seed always places the same shapes
+    rng = random.Random(el.get('seed', 0))
+    shapes = []
+    circles = el.get('circles')
+    if circles:
+        color = s.color(circles['color']) + (circles['alpha'],)
+        for _ in range(circles['count']):
+            r = rng.randint(*circles['radius'])
+            x = rng.randint(*(s.length(v) for v in circles['x']))
+            y = rng.randint(*(s.length(v) for v in circles['y']))
+            shapes.append(([x - r, y - r, x + r, y + r], color))
+    leaves = el.get('leaves')
+    if leaves:
+        color = s.color(leaves['color']) + (leaves['alpha'],)
+        for _ in range(leaves['count']):
+            w = rng.randint(*leaves['width'])
+            h = rng.randint(*leaves['height'])
+            x = rng.randint(*(s.length(v) for v in leaves['x']))
+            y = rng.randint(*(s.length(v) for v in leaves['y']))
+            shapes.append(([x, y, x + w, y + h], color))
+    s.canvas.overlay(shapes)
+
+def draw_bullets(s, el):
+    font = s.font(el['font'])
+    fill = s.color(el.get('color', 'text'))
+    bullet = el['bullet']
+    r = bullet['radius']
+    bx = s.length(bullet['x'])
+    text_x = s.length(el['text_x'])
+    width = s.length(el['width']) if 'width' in el else None
+    for item in el['items']:
+        x = s.W - bx - 2 * r if s.rtl else bx
+        by = s.y + bullet['dy']
+        s.canvas.ellipse([x, by, x + 2 * r, by + 2 * r], fill=s.color(bullet.get('color', 'accent')))
+        if width is None:
+            end = s.draw_lines([item], font, fill, text_x, 0, s.y)
+        elif s.rtl:
+            end = s.draw_lines(s.wrap(item, font, width), font, fill, s.W - text_x - width, width, s.y,
+                               'right', el.get('line_spacing', 1.2))
+        else:
+            end = s.draw_lines(s.wrap(item, font, width), font, fill, text_x, width, s.y,
+                               'left', el.get('line_spacing', 1.2))
+        s.y = s.y + el['step'] if 'step' in el else end + el.get('gap', 0)
+
+def draw_points(s, el):
+    icon, title, desc = el['icon'], el['title'], el['desc']
+    size = icon['size']
+    title_font, desc_font = s.font(title['font']), s.font(desc['font'])
+    title_color, desc_color = s.color(title.get('color', 'dark')), s.color(desc.get('color', 'text'))
+
+    if el.get('layout', 'list') == 'row':
+        # Side by side: icon above a centered title and a two-line description
+        spacing = (s.W - 2 * s.side) // len(el['items'])
+        y = s.y
+        for i, (name, text) in enumerate(el['items']):
+            cx = s.side + spacing * i + spacing // 2
+            s.icon((cx - size // 2, y, size), name[0], icon['font'], icon.get('nudge', 0),
+                   icon.get('color', 'accent'), centered=True)
+            ty = y + size + title['dy']
+            w = s.text_size(name, title_font)[0]
+            s.canvas.text((cx - w // 2, ty), name, font=title_font, fill=title_color)
+            # Split the description at its middle word
+            ty += desc['dy']
+            words = text.split()
+            half = len(words) // 2 + 1
+            for k, line in enumerate(l for l in (" ".join(words[:half]), " ".join(words[half:])) if l):
+                w = s.text_size(line, desc_font)[0]
+                s.canvas.text((cx - w // 2, ty + k * desc['step']), line, font=desc_font, fill=desc_color)
+        s.y = y + size + title['dy'] + desc['dy'] + 2 * desc['step']
+        return
+
+    # Stacked: icon on the left, title and wrapped description on the right
+    card = el.get('card')
+    for name, text in el['items']:
+        y = s.y
+        icon_x = s.length(icon['x'])
+        if card:
+            s.canvas.rectangle([s.side, y, s.W - s.side, y + card['height']], fill=s.color(card.get('fill', 'white')),
+                             outline=s.color(card.get('outline', 'accent')), width=card.get('width', 5))
+            icon_y = y + (card['height'] - size) // 2
+        else:
+            icon_y = y
+        s.icon((icon_x, icon_y, size), name[0], icon['font'], icon.get('nudge', 0), icon.get('color', 'accent'))
+
+        text_x = icon_x + size + el['text_gap']
+        s.canvas.text((text_x, y + title['dy']), name, font=title_font, fill=title_color)
+        lines = s.wrap(text, desc_font, s.W - s.side - 50 - text_x)
+        end = s.draw_lines(lines, desc_font, desc_color, text_x, 0, y + desc['dy'], step=desc['step'])
+        if card:
+            s.y += card['height'] + card['margin']
+        else:
+            s.y += max(el.get('min_height', 0), end - y + 50)
+
+def draw_cards(s, el):
+    cols = el.get('columns', 2)
+    col_w = s.W // cols
+    row_h, margin = el['row_height'], el['margin']
+    icon, title, desc = el['icon'], el['title'], el['desc']
+    title_font, desc_font = s.font(title['font']), s.font(desc['font'])
+    start = s.y
+    for i, (name, text) in enumerate(el['items']):
+        row, col = divmod(i, cols)
+        card_x, card_y = col * col_w + margin, start + row * row_h + margin
+        card_w, card_h = col_w - 2 * margin, row_h - 2 * margin
+        s.canvas.rectangle([card_x, card_y, card_x + card_w, card_y + card_h], fill=s.color(el.get('fill', 'white')),
+                         outline=s.color(el.get('outline', 'accent')), width=el.get('width', 5))
+        r = icon['radius']
+        cx, cy = card_x + card_w // 2, card_y + icon['dy']
+        s.canvas.ellipse([cx - r, cy - r, cx + r, cy + r], fill=s.color(icon.get('color', 'dark')))
+        s.draw_lines([name], title_font, s.color(title.get('color', 'dark')), card_x, card_w, cy + title['dy'], 'center')
+        pad = desc.get('padding', 20)
+        s.draw_lines(s.wrap(text, desc_font, card_w - 2 * pad), desc_font, s.color(desc.get('color', 'text')),
+                     card_x + pad, card_w - 2 * pad, cy + desc['dy'], 'center', desc.get('line_spacing', 1.2))
+    s.y = start + -(-len(el['items']) // cols) * row_h
+
+def draw_values(s, el):
+    top = s.y
+    s.canvas.rectangle([0, top, s.W, top + el['height']], fill=s.color(el.get('fill', 'accent_light')))
+    title = el['title']
+    y = top + title['dy']
+    s.centered_text(title['text'], s.font(title['font']), y, s.color(title.get('color', 'dark')))
+
+    font = s.font(el['font'])
+    color = s.color(el.get('color', 'dark'))
+    items = el['items']
+    if el.get('layout', 'grid') == 'strip':
+        # One row, a dot above each value
+        spacing = s.W // len(items)
+        y = top + el['dy']
+        dot = el['dot']
+        r = dot['radius']
+        for i, value in enumerate(items):
+            cx = i * spacing + spacing // 2
+            dy = y + dot['dy']
+            s.canvas.ellipse([cx - r, dy - r, cx + r, dy + r], fill=s.color(dot.get('color', 'dark')))
+            w = s.text_size(value, font)[0]
+            s.canvas.text((cx - w // 2, y), value, font=font, fill=color)
+    else:
+        # Columns of check-marked values (right to left for RTL)
+        cols = el.get('columns', 2)
+        col_w = s.W // cols
+        y += title['advance']
+        check = el['check']
+        check_font = s.font(check['font'])
+        for i, value in enumerate(items):
+            row, col = divmod(i, cols)
+            if s.rtl:
+                col = cols - 1 - col
+            cx, cy = col * col_w + col_w // 2, y + row * el['row_height']
+            if s.rtl:
+                shown = s.shape(value, font)
+                w_v = s.text_size(shown, font)[0]
+                w_c = s.text_size("✓", check_font)[0]
+                gap = check.get('gap', 40)
+                x = cx - (w_v + gap + w_c) // 2
+                s.canvas.text((x + w_v + gap, cy), "✓", font=check_font, fill=color)
+                s.canvas.text((x, cy), shown, font=font, fill=color)
+            else:
+                s.canvas.text((cx - check['dx'], cy), "✓", font=check_font, fill=color)
+                s.canvas.text((cx - el['text_dx'], cy), value, font=font, fill=color)
+    s.y = top + el['height']
+
+def draw_footer(s, el):
+    fill = s.color(el.get('fill', 'dark'))
+    qr = el['qr']
+    url = qr.get('data', s.spec.get('url', "https://tadweer-tech-sy.org"))
+
+    if el.get('layout', 'center') == 'side':
+        # Band to the bottom edge: QR on the left, text lines to its right
+        top = s.length(el.get('top', 'y'))
+        s.canvas.rectangle([0, top, s.W, s.H], fill=fill)
+        tile = qr_tile(url, s.length(qr['size'], fh=s.H - top), qr['pad'])
+        qr_x = s.length(qr['x'])
+        qr_y = top + (s.H - top - tile.height) // 2
+        s.canvas.paste(tile, (qr_x, qr_y), tile)
+        x = qr_x + tile.width + el['text_gap']
+        for line in el['lines']:
+            font = s.font(line['font'])
+            y = s.length(line['y'], top=top, qr_y=qr_y, qr_h=tile.height)
+            s.canvas.text((x, y), s.shape(line['text'], font), font=font, fill=s.color(line['color']))
+        s.y = s.H
+        return
+
+    # Curved band above the bottom safety margin: QR and lines centered
+    top = s.H - s.length(el['height'])
+    if s.y > top:
+        print(f"Warning: content pushed into the footer (content y {s.y}, footer y {top}); moving the footer down")
+        top = s.y + 50
+    curve = el['curve']
+    s.canvas.rectangle([0, top + curve, s.W, s.H], fill=fill)
+    k = el.get('overhang', 0.1)
+    s.canvas.ellipse([-s.W * k, top, s.W * (1 + k), top + curve * 2], fill=fill)
+    tile = qr_tile(url, qr['size'], qr['pad'])
+    y = top + qr['top']
+    s.canvas.paste(tile, ((s.W - tile.width) // 2, y), tile)
+    y += tile.height
+    for line in el['lines']:
+        y += line['gap']
+        s.centered_text(line['text'], s.font(line['font']), y, s.color(line['color']))
+    s.y = s.H
+
+SECTIONS = {
+    'header': draw_header,
+    'text': draw_text,
+    'paragraph': draw_paragraph,
+    'hero': draw_hero,
+    'background': draw_background,
+    'pattern': draw_pattern,
+    'bullets': draw_bullets,
+    'points': draw_points,
+    'cards': draw_cards,
+    'values': draw_values,
+    'footer': draw_footer,
+}
+
+# --- Rendering ---
+def load_catalog(path=CATALOG_PATH):
+    """Loads a catalog (JSON) and returns (themes, list of specs)."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('themes', {}), data['stands']
+
+def record(spec, themes, dpi=None):
+    """Runs the sections of spec; returns its DisplayList (output at dpi, default: the spec's)."""
+    s = Stand(spec, themes, dpi)
+    for el in spec['sections']:
+        SECTIONS[el['type']](s, el)
+        s.y += s.length(el.get('after', 0))
+    return s.canvas
+
+def compose(spec, themes, dpi=None):
+    """The stand as one image (at dpi, default: the spec's)."""
+    return record(spec, themes, dpi).render()
+
+def render_stand(spec, themes, out_dir=images_dir, band_rows=BAND_ROWS):
+    """
+    Renders one spec; returns the path written. The PNG is streamed band_rows
+    rows at a time (0 renders the full canvas and lets Pillow encode it).
+    """
+    dpi = spec.get('dpi', 150)
+    print(f"Creating stand design {spec['name']}: "
+          f"{' x '.join(str(cm(v, dpi)) for v in spec['size_cm'])} pixels...")
+    canvas = record(spec, themes)
+    path = os.path.join(out_dir, spec['output'])
+    if band_rows:
+        with PngWriter(path, canvas.size, dpi=dpi) as png:
+            for band in canvas.bands(band_rows):
+                png.write(band)
+    else:
+        canvas.render().save(path, 'PNG', dpi=(dpi, dpi))
+    return path
+
+def preview_stand(spec, themes, out_dir=previews_dir, dpi=PREVIEW_DPI):
+    """Renders the same layout as a small proxy at dpi; returns the path written."""
+    img = compose(spec, themes, dpi)
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, spec['output'])
+    img.save(path, 'PNG', dpi=(dpi, dpi))
+    return path
+
+def select(specs, keys):
+    """Specs whose name or one of whose tags is in keys (all specs if keys is empty)."""
+    if not keys:
+        return list(specs)
+    keys = set(keys)
+    return [s for s in specs if s['name'] in keys or keys & set(s.get('tags', []))]
+
+def render_catalog(keys=(), out_dir=images_dir, catalog=CATALOG_PATH, band_rows=BAND_ROWS, preview_dpi=None):
+    """Renders the selected stands (as proxies at preview_dpi if given); returns the paths written."""
+    themes, specs = load_catalog(catalog)
+    written = []
+    for spec in select(specs, keys):
+        if preview_dpi:
+            path = preview_stand(spec, themes, out_dir, preview_dpi)
+            print(f"Stand preview saved to: {path}")
+        else:
+            path = render_stand(spec, themes, out_dir, band_rows)
+            print(f"Stand design saved to: {path}")
+        written.append(path)
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description="Render roll-up stands from the declarative catalog.")
+    parser.add_argument('keys', nargs='*', help="stand names or tags (default: all)")
+    parser.add_argument('--catalog', default=CATALOG_PATH)
+    parser.add_argument('--out-dir', default=None, help="default: images/ (previews: previews/)")
+    parser.add_argument('--list', action='store_true', help="list stands and exit")
+    parser.add_argument('--band-rows', type=int, default=BAND_ROWS,
+                        help=f"rows rendered and encoded at a time (default {BAND_ROWS}; 0 = full canvas)")
+    parser.add_argument('--preview', nargs='?', type=float, const=PREVIEW_DPI, default=None, metavar='DPI',
+                        help=f"render a low-resolution proxy of the same layout (default {PREVIEW_DPI} DPI)")
+    args = parser.parse_args()
+
+    if args.list:
+        for spec in select(load_catalog(args.catalog)[1], args.keys):
+            print(f"{spec['name']:14s} {spec['output']:36s} {' '.join(spec.get('tags', []))}")
+        return
+    out_dir = args.out_dir or (previews_dir if args.preview else images_dir)
+    render_catalog(args.keys, out_dir, args.catalog, args.band_rows, args.preview)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+"""
+Declarative sticker engine.
+
+Every sticker is a spec (see sticker_catalog.json) instead of a script:
+shape, physical size, DPI, colors and a list of elements drawn in order.
+All lengths in a spec are in millimetres and converted to pixels at the
+spec's DPI, so the same spec renders at 300 DPI for print or any other
+resolution. Fonts and decoded assets are shared between stickers, so a
+whole catalog renders in one process.
+
+Elements:
+  circle    margin, fill, outline, width
+  rect      inset | box [x0, y0, x1, y1], fill, outline, width, radius
+  arc_text  text, font, radius, angle, bottom, color, rtl, engine, fit {max_angle}
+  path_text text, font, color, path, position, offset, reverse
+  text      text, font, color, x, y, dy, rtl
+  image     src, max | width [+ height], x, y, dy
+  qr        data [+ ec] | src, size, x, y, dy, background {shape, padding, radius, color}
+  stack     y, dy, items (image / text / qr / gap {size}) centered horizontally
+x is "center" or mm from the left edge, y is "center" or mm from the top edge.
+Fonts are {"family": "arial", "bold": true, "size_pt": 8.4}; families are
+resolved by fonts.py ("arial" for Latin text, "arabic" for Arabic).
+A path_text runs along a path: {"shape": "rounded_rect", "inset", "radius"}
+(clockwise from the middle of the top edge), {"shape": "ellipse", "rx", "ry",
+"start", "end"} around the center, or {"shape": "bezier", "points"} (mm from
+the top-left corner). position is the fraction of the path the text is
+centered on; reverse walks the path the other way (readable text along the
+bottom of a border), offset moves the baseline in mm.
+An arc_text with "fit" sizes its font to the largest size whose text spans
+at most max_angle degrees (the font size in the spec is only the starting
+point), so a longer text or translation never runs around the sticker.
+QR codes with "data" are encoded natively (pixel-exact modules, vector in
+SVG); "src" pastes a prebuilt QR raster from images/ instead.
+
+Usage: python tools/sticker_engine.py [name|tag ...] [--list] [--out-dir DIR]
+       python tools/sticker_engine.py render-all [name|tag ...] [--jobs N]
+       python tools/sticker_engine.py [name|tag ...] --preview [DPI]
+render-all renders the selected stickers (default: the whole catalog) in
+parallel, one process per core. --preview renders the same specs as PNG
+proxies at a low DPI (default 72) into previews/ (with render-all, in
+parallel too).
+"""
+from PIL import Image, ImageDraw
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import json
+import os
+import sys
+
+# Add current directory to path to import sticker_utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from sticker_utils import (draw_text_on_arc, draw_text_on_path, ellipse_path, bezier_path, rounded_rect_path,
+                           reverse_path, shape_rtl, SUPERSAMPLE, finish_supersampled)
+from sticker_vector import SvgDocument
+from qr_encoder import encode, render_matrix, qr_box
+import assets
+import fonts
+
+# Paths
+tools_dir = os.path.dirname(os.path.abspath(__file__))
+root = os.path.dirname(tools_dir)
+images_dir = os.path.join(root, 'images')
+previews_dir = os.path.join(root, 'previews')
+CATALOG_PATH = os.path.join(tools_dir, 'sticker_catalog.json')
+
+# Proxy preview resolution (a 6 cm sticker -> 170 px)
+PREVIEW_DPI = 72
+
+def px(mm, dpi):
+    """Millimetres to pixels at dpi."""
+    return int(round(mm * dpi / 25.4))
+
+def parse_color(color):
+    """'#rrggbb' / '#rrggbbaa' or [r, g, b(, a)] -> tuple (None stays None)."""
+    if color is None:
+        return None
+    if isinstance(color, str):
+        color = color.lstrip('#')
+        return tuple(int(color[i:i + 2], 16) for i in range(0, len(color), 2))
+    return tuple(color)
+
+def get_font(font_spec, dpi):
+    """Font for a spec's {"family", "bold", "size_pt"} at dpi (cached by the font registry)."""
+    size = int(round(font_spec['size_pt'] * dpi / 72))
+    return fonts.get_font(size, font_spec.get('bold', False), font_spec.get('family', 'arial'))
+
+def asset_path(name):
+    return os.path.join(images_dir, name)
+
+def load_asset(name):
+    """Decodes an image from images/ once per process (RGBA)."""
+    return assets.load(asset_path(name))
+
+def display_text(text, font, rtl):
+    """Straight text as it should be drawn (RTL text is shaped and reordered)."""
+    return ''.join(shape_rtl(text, font)) if rtl else text
+
+class Canvas:
+    """
+    Raster canvas (and optional SVG twin) a spec is drawn on.
+    blank_qr: draw QR pads but leave the modules out (variable-data backgrounds);
+    every QR element's (x, y, size, element) is recorded in qr_boxes either way.
+    """
+    def __init__(self, size, dpi, vector=False, blank_qr=False):
+        self.size = size
+        self.dpi = dpi
+        self.img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        self.draw = ImageDraw.Draw(self.img)
+        self.svg = SvgDocument(size, size, dpi=dpi) if vector else None
+        self.blank_qr = blank_qr
+        self.qr_boxes = []
+
+    def px(self, mm):
+        return px(mm, self.dpi)
+
+    def position(self, el, w, h):
+        """Top-left corner of a w x h block from the element's x / y / dy."""
+        x = el.get('x', 'center')
+        y = el.get('y', 'center')
+        x = (self.size - w) // 2 if x == 'center' else self.px(x)
+        y = (self.size - h) // 2 if y == 'center' else self.px(y)
+        return x, y + self.px(el.get('dy', 0))
+
+# --- Elements ---
+def draw_circle(c, el):
+    margin = c.px(el.get('margin', 0))
+    radius = (c.size // 2) - margin
+    center = (c.size // 2, c.size // 2)
+    box = [(center[0] - radius, center[1] - radius), (center[0] + radius, center[1] + radius)]
+    fill = parse_color(el.get('fill'))
+    outline = parse_color(el.get('outline'))
+    width = c.px(el.get('width', 0))
+    c.draw.ellipse(box, fill=fill, outline=outline, width=width)
+    if c.svg:
+        c.svg.ellipse(box, fill=fill, outline=outline, width=width)
+
+def draw_rect(c, el):
+    if 'box' in el:
+        box = [c.px(v) for v in el['box']]
+    else:
+        inset = c.px(el.get('inset', 0))
+        box = [inset, inset, c.size - 1 - inset, c.size - 1 - inset]
+    fill = parse_color(el.get('fill'))
+    outline = parse_color(el.get('outline'))
+    width = c.px(el.get('width', 0))
+    radius = c.px(el.get('radius', 0))
+    if radius:
+        c.draw.rounded_rectangle(box, radius=radius, fill=fill, outline=outline, width=width)
+    else:
+        c.draw.rectangle(box, fill=fill, outline=outline, width=width)
+    if c.svg:
+        c.svg.rectangle(box, fill=fill, outline=outline, width=width, radius=radius)
+
+def draw_arc_text(c, el):
+    font = get_font(el['font'], c.dpi)
+    center = (c.size // 2, c.size // 2)
+    radius = c.px(el['radius'])
+    color = parse_color(el['color'])
+    bottom = el.get('bottom', False)
+    rtl = el.get('rtl', False)
+    font = draw_text_on_arc(c.img, el['text'], font, center, radius, el['angle'], color, is_bottom=bottom,
+                            engine=el.get('engine', 'glyph'), max_angle=el.get('fit', {}).get('max_angle'), rtl=rtl)
+    if c.svg:
+        c.svg.text_on_arc(el['text'], font, center, radius, el['angle'], color, is_bottom=bottom, rtl=rtl)
+
+def text_path(c, spec):
+    """Path (see sticker_utils.path_table) of a path_text element's "path" spec, in canvas pixels."""
+    shape = spec['shape']
+    if shape == 'rounded_rect':
+        inset = c.px(spec.get('inset', 0))
+        return rounded_rect_path((inset, inset, c.size - 1 - inset, c.size - 1 - inset), c.px(spec.get('radius', 0)))
+    if shape == 'ellipse':
+        return ellipse_path((c.size // 2, c.size // 2), c.px(spec['rx']), c.px(spec['ry']),
+                            spec.get('start', 0), spec.get('end', 360))
+    if shape == 'bezier':
+        return bezier_path([(c.px(x), c.px(y)) for x, y in spec['points']])
+    raise ValueError(f"Unknown text path shape: {shape!r} (expected 'rounded_rect', 'ellipse' or 'bezier')")
+
+def draw_path_text(c, el):
+    font = get_font(el['font'], c.dpi)
+    path = text_path(c, el['path'])
+    if el.get('reverse', False):
+        path = reverse_path(path)
+    color = parse_color(el['color'])
+    position = el.get('position', 0.5)
+    offset = c.px(el.get('offset', 0))
+    draw_text_on_path(c.img, el['text'], font, path, color, position, offset)
+    if c.svg:
+        c.svg.text_on_path(el['text'], font, path, color, position, offset)
+
+# Blocks: measured first (so stacks can center them), then placed at (x, y)
+def measure_block(c, el):
+    kind = el['type']
+    if kind == 'gap':
+        return 0, c.px(el['size']), None
+    if kind == 'text':
+        font = get_font(el['font'], c.dpi)
+        text = display_text(el['text'], font, el.get('rtl', False))
+        bbox = c.draw.textbbox((0, 0), text, font=font)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1], (font, text)
+    if kind == 'image':
+        src = load_asset(el['src'])
+        if 'max' in el:
+            # Fit into a max x max square, aspect ratio preserved
+            max_size = c.px(el['max'])
+            aspect_ratio = src.width / src.height
+            if src.width > src.height:
+                w, h = max_size, int(max_size / aspect_ratio)
+            else:
+                w, h = int(max_size * aspect_ratio), max_size
+        else:
+            w = c.px(el['width'])
+            h = c.px(el['height']) if 'height' in el else int(w * src.height / src.width)
+        return w, h, src
+    if kind == 'qr':
+        size = c.px(el['size'])
+        padding = c.px(el['background'].get('padding', 0)) if el.get('background') else 0
+        return size + padding * 2, size + padding * 2, (size, padding)
+    raise ValueError(f"Unknown block element: {kind!r}")
+
+def place_block(c, el, x, y, w, h, prepared):
+    kind = el['type']
+    if kind == 'text':
+        font, text = prepared
+        color = parse_color(el['color'])
+        c.draw.text((x, y), text, fill=color, font=font)
+        if c.svg:
+            c.svg.text((x, y), text, font, color)
+    elif kind == 'image':
+        src = prepared
+        img = assets.resized(asset_path(el['src']), (w, h))
+        c.img.paste(img, (x, y), img)
+        if c.svg:
+            c.svg.image(src, (x, y, x + w, y + h))
+    elif kind == 'qr':
+        size, padding = prepared
+        bg = el.get('background')
+        if bg and bg.get('color') is not None:
+            box = [(x, y), (x + w, y + h)]
+            color = parse_color(bg['color'])
+            shape = bg.get('shape', 'square')
+            radius = c.px(bg.get('radius', 0))
+            if shape == 'circle':
+                c.draw.ellipse(box, fill=color)
+            else:
+                c.draw.rounded_rectangle(box, radius=radius, fill=color)
+            if c.svg:
+                if shape == 'circle':
+                    c.svg.ellipse(box, fill=color)
+                else:
+                    c.svg.rounded_rectangle(box, radius=radius, fill=color)
+        qx, qy = x + padding, y + padding
+        c.qr_boxes.append((qx, qy, size, el))
+        if c.blank_qr:
+            return
+        if 'data' in el:
+            matrix = encode(el['data'], el.get('ec', 'L'))
+            qr = render_matrix(matrix, size)
+        else:
+            qr = assets.resized(asset_path(el['src']), (size, size))
+        c.img.paste(qr, (qx, qy), qr)
+        if c.svg:
+            if 'data' in el:
+                offset, module = qr_box(len(matrix), size)
+                end = offset + module * len(matrix)
+                c.svg.rectangle((qx, qy, qx + size, qy + size), fill=(255, 255, 255))
+                c.svg.qr(matrix, (qx + offset, qy + offset, qx + end, qy + end))
+            else:
+                c.svg.qr_from_image(load_asset(el['src']), (qx, qy, qx + size, qy + size))
+
+def draw_block(c, el):
+    w, h, prepared = measure_block(c, el)
+    x, y = c.position(el, w, h)
+    place_block(c, el, x, y, w, h, prepared)
+
+def draw_stack(c, el):
+    """Vertical stack of blocks, each centered horizontally."""
+    blocks = [(item, measure_block(c, item)) for item in el['items']]
+    total_height = sum(h for _, (_, h, _) in blocks)
+    _, y = c.position(el, 0, total_height)
+    for item, (w, h, prepared) in blocks:
+        if item['type'] != 'gap':
+            place_block(c, item, (c.size - w) // 2, y, w, h, prepared)
+        y += h
+
+ELEMENTS = {
+    'circle': draw_circle,
+    'rect': draw_rect,
+    'arc_text': draw_arc_text,
+    'path_text': draw_path_text,
+    'text': draw_block,
+    'image': draw_block,
+    'qr': draw_block,
+    'stack': draw_stack,
+}
+
+# --- Rendering ---
+def load_catalog(path=CATALOG_PATH):
+    """Loads a catalog (JSON, or YAML if PyYAML is installed) and returns its list of specs."""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            import yaml
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    return data['stickers']
+
+def compose(spec, supersample=SUPERSAMPLE, vector=False, blank_qr=False):
+    """Draws a spec on a Canvas at supersample x its dpi."""
+    dpi = spec.get('dpi', 300) * supersample
+    c = Canvas(px(spec['size'], dpi), dpi, vector=vector, blank_qr=blank_qr)
+    if spec.get('canvas') is not None:
+        draw_rect(c, {'fill': spec['canvas']})
+    for el in spec['elements']:
+        ELEMENTS[el['type']](c, el)
+    return c
+
+def render_sticker(spec, out_dir=images_dir, supersample=SUPERSAMPLE, formats=None):
+    """
+    Renders one spec. Returns the list of files written.
+    formats: output formats, defaults to the spec's "formats" (["png"] if absent).
+    """
+    formats = formats or spec.get('formats', ['png'])
+    dpi = spec.get('dpi', 300)
+    size = px(spec['size'], dpi)
+
+    # Supersampling: compose at supersample x dpi, downsample once when saving
+    c = compose(spec, supersample, vector='svg' in formats)
+
+    written = []
+    base = os.path.join(out_dir, os.path.splitext(spec['output'])[0])
+    if 'png' in formats:
+        img = finish_supersampled(c.img, (size, size))
+        img.save(base + '.png', 'PNG', dpi=(dpi, dpi))
+        written.append(base + '.png')
+    if 'svg' in formats:
+        c.svg.save(base + '.svg')
+        written.append(base + '.svg')
+    return written
+
+def select(specs, keys):
+    """Specs whose name or one of whose tags is in keys (all specs if keys is empty)."""
+    if not keys:
+        return list(specs)
+    keys = set(keys)
+    return [s for s in specs if s['name'] in keys or keys & set(s.get('tags', []))]
+
+def render_catalog(keys=(), out_dir=images_dir, catalog=CATALOG_PATH, preview_dpi=None):
+    """Renders the selected stickers (PNG proxies at preview_dpi if given); returns the paths written."""
+    written = []
+    if preview_dpi:
+        os.makedirs(out_dir, exist_ok=True)
+    for spec in select(load_catalog(catalog), keys):
+        paths = (render_sticker(dict(spec, dpi=preview_dpi), out_dir, formats=['png']) if preview_dpi
+                 else render_sticker(spec, out_dir))
+        for path in paths:
+            print(f"Generated {path}")
+            written.append(path)
+    info = assets.cache_info()
+    print(f"Assets: {info['decodes']} decoded, {info['resizes']} resized, "
+          f"{info['hits']} reused, {info['disk_hits']} from disk cache")
+    return written
+
+# --- Parallel rendering ---
+def iter_elements(elements):
+    for el in elements:
+        yield el
+        yield from iter_elements(el.get('items', []))
+
+def preload(specs, supersample=SUPERSAMPLE):
+    """Decodes every asset and loads every font the specs use."""
+    for spec in specs:
+        dpi = spec.get('dpi', 300) * supersample
+        for el in iter_elements(spec['elements']):
+            if 'src' in el:
+                load_asset(el['src'])
+            if el['type'] == 'qr' and 'data' in el:
+                encode(el['data'], el.get('ec', 'L'))
+            if 'font' in el:
+                get_font(el['font'], dpi)
+
+def _init_worker(specs):
+    preload(specs)
+
+def _render_worker(spec, out_dir, formats=None):
+    return render_sticker(spec, out_dir, formats=formats)
+
+def render_all(keys=(), out_dir=images_dir, catalog=CATALOG_PATH, jobs=None, preview_dpi=None):
+    """
+    Renders the selected specs over a process pool (jobs defaults to the CPU count),
+    as PNG proxies at preview_dpi if given. Each worker preloads logo / QR / fonts
+    once; the biggest stickers are submitted first so the run takes about as long
+    as the slowest single sticker.
+    """
+    specs = select(load_catalog(catalog), keys)
+    formats = None
+    if preview_dpi:
+        specs = [dict(spec, dpi=preview_dpi) for spec in specs]
+        formats = ['png']
+        os.makedirs(out_dir, exist_ok=True)
+    specs.sort(key=lambda s: s['size'] * s.get('dpi', 300), reverse=True)
+    jobs = min(jobs or os.cpu_count() or 1, len(specs)) or 1
+    written = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(specs,)) as pool:
+        futures = [pool.submit(_render_worker, spec, out_dir, formats) for spec in specs]
+        for future in as_completed(futures):
+            for path in future.result():
+                print(f"Generated {path}")
+                written.append(path)
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description="Render stickers from the declarative catalog.")
+    parser.add_argument('keys', nargs='*', help="sticker names or tags (default: all); "
+                                                "start with render-all to render in parallel")
+    parser.add_argument('--catalog', default=CATALOG_PATH)
+    parser.add_argument('--out-dir', default=None, help="default: images/ (previews: previews/)")
+    parser.add_argument('--list', action='store_true', help="list stickers and exit")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="render-all worker processes (default: CPU count)")
+    parser.add_argument('--preview', nargs='?', type=float, const=PREVIEW_DPI, default=None, metavar='DPI',
+                        help=f"render PNG proxies of the same layout at a low DPI (default {PREVIEW_DPI})")
+    args = parser.parse_args()
+    out_dir = args.out_dir or (previews_dir if args.preview else images_dir)
+
+    parallel = args.keys[:1] == ['render-all']
+    if parallel:
+        args.keys = args.keys[1:]
+
+    if args.list:
+        for spec in select(load_catalog(args.catalog), args.keys):
+            print(f"{spec['name']:30s} {spec['output']:32s} {' '.join(spec.get('tags', []))}")
+        return
+    if parallel:
+        render_all(args.keys, out_dir, args.catalog, args.jobs, args.preview)
+    else:
+        render_catalog(args.keys, out_dir, args.catalog, args.preview)
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,157 @@
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, features
+from collections import OrderedDict
 import math
+import os
+import unicodedata
+import numpy as np
 
-def draw_text_on_arc(img, text, font, center, radius, start_angle, text_color, is_bottom=False):
+try:
+    # Only needed for RTL arc text (rtl=True)
+    import arabic_reshaper
+    from bidi.algorithm import get_display
+except ImportError:
+    arabic_reshaper = None
+    get_display = None
+
+# --- Supersampling ---
+# Stickers are composed on a SUPERSAMPLE x larger canvas and downsampled once
+# when saving, which gives crisp edges for one resample instead of dozens.
+# Set STICKER_SUPERSAMPLE=2 (or 4) in the environment to enable it.
+SUPERSAMPLE = max(1, int(os.environ.get('STICKER_SUPERSAMPLE', '1')))
+
+def finish_supersampled(img, size):
+    """Downsamples a sticker composed on a supersampled canvas to its final size with a single LANCZOS pass."""
+    if img.size == tuple(size):
+        return img
+    return img.resize(size, Image.LANCZOS)
+
+# --- Glyph sprite cache ---
+# Every sticker draws the same slogans at the same radii, so the same
+# (char, angle, color) sprites come up again and again. Rotated sprites are
+# kept in an LRU cache bounded by both entry count and total pixel bytes.
+GLYPH_CACHE_MAX_ENTRIES = 4096
+GLYPH_CACHE_MAX_BYTES = 64 * 1024 * 1024 # 64 MB of RGBA sprites
+GLYPH_ROTATION_STEP = 0.1 # Rotations are quantized to this many degrees
+
+_glyph_cache = OrderedDict()
+_glyph_cache_stats = {'hits': 0, 'misses': 0, 'bytes': 0}
+
+def _font_key(font):
     """
-    Draws text along an arc.
-    start_angle: Angle in degrees where the text should be centered (e.g. 270 for top, 90 for bottom).
-    is_bottom: If True, text is drawn for the bottom of the circle (readable, smile curve).
+    Identifies a font by file and size.
+    Fonts loaded from memory (e.g. load_default) have no file path, so fall back to the object id.
+    """
+    path = getattr(font, 'path', None)
+    if not isinstance(path, str):
+        path = id(font)
+    return (path, getattr(font, 'index', 0), getattr(font, 'size', None), getattr(font, 'layout_engine', None))
+
+def _render_glyph(font, char, fill, rotation):
+    # Create char image
+    # Make it large enough
+    char_img_size = int(font.size * 3) # Increased buffer
+    char_img = Image.new('RGBA', (char_img_size, char_img_size), (0,0,0,0))
+    char_draw = ImageDraw.Draw(char_img)
+    
+    # Draw char centered using anchor 'ms' (Middle Baseline)
+    # This ensures all characters share the same baseline, preventing vertical jitter.
+    # We place the baseline at the exact center of the image.
+    char_draw.text((char_img_size/2, char_img_size/2), char, font=font, fill=fill, anchor='ms')
+    
+    # Rotate
+    return char_img.rotate(rotation, resample=Image.BICUBIC, expand=True)
+
+def get_glyph(font, char, fill, rotation):
+    """
+    Returns the rotated RGBA sprite for a character, with its baseline center at the sprite center.
+    Sprites are shared through the LRU glyph cache; treat the result as read-only.
+    """
+    if GLYPH_ROTATION_STEP:
+        rotation = round(rotation / GLYPH_ROTATION_STEP) * GLYPH_ROTATION_STEP
+    rotation = round(rotation, 6) # Avoid float noise splitting cache keys
+    if isinstance(fill, list):
+        fill = tuple(fill)
+    key = (_font_key(font), char, fill, rotation)
+    
+    glyph = _glyph_cache.get(key)
+    if glyph is not None:
+        _glyph_cache.move_to_end(key)
+        _glyph_cache_stats['hits'] += 1
+        return glyph
+    
+    _glyph_cache_stats['misses'] += 1
+    glyph = _render_glyph(font, char, fill, rotation)
+    _glyph_cache[key] = glyph
+    _glyph_cache_stats['bytes'] += glyph.width * glyph.height * 4
+    
+    # Evict least recently used sprites until we are back under both limits
+    while (len(_glyph_cache) > GLYPH_CACHE_MAX_ENTRIES or
+           _glyph_cache_stats['bytes'] > GLYPH_CACHE_MAX_BYTES) and len(_glyph_cache) > 1:
+        _, old = _glyph_cache.popitem(last=False)
+        _glyph_cache_stats['bytes'] -= old.width * old.height * 4
+    
+    return glyph
+
+def glyph_cache_info():
+    """Returns hit/miss counters and current size of the glyph cache."""
+    return {
+        'hits': _glyph_cache_stats['hits'],
+        'misses': _glyph_cache_stats['misses'],
+        'entries': len(_glyph_cache),
+        'bytes': _glyph_cache_stats['bytes'],
+        'max_entries': GLYPH_CACHE_MAX_ENTRIES,
+        'max_bytes': GLYPH_CACHE_MAX_BYTES,
+    }
+
+def clear_glyph_cache():
+    """Drops all cached sprites and resets the counters."""
+    _glyph_cache.clear()
+    _glyph_cache_stats.update(hits=0, misses=0, bytes=0)
+
+# --- Arc layout (measure only) ---
+_advance_cache = {}
+
+def char_advances(font, text):
+    """
+    Returns a NumPy array with the advance width of every character in text
+    (a string, or a sequence of clusters such as the output of shape_rtl).
+    Single-character advances are memoized per font, and the string is measured
+    once with font.getlength so any kerning (e.g. with the RAQM layout engine) is
+    kept in the total: the difference is spread evenly over the gaps between characters.
+    """
+    table = _advance_cache.setdefault(_font_key(font), {})
+    for char in set(text):
+        if char not in table:
+            table[char] = font.getlength(char)
+    widths = np.array([table[char] for char in text], dtype=float)
+    
+    if len(text) > 1:
+        kerning = font.getlength(''.join(text)) - widths.sum()
+        # Ignore sub-pixel rounding noise between the two measurements
+        if abs(kerning) >= 1:
+            widths[:-1] += kerning / (len(text) - 1)
+    return widths
+
+def measure_text_on_arc(text, font, radius):
+    """Returns the angle in degrees that text covers on a circle of the given radius."""
+    if not len(text):
+        return 0.0
+    return float(char_advances(font, text).sum() / (2 * math.pi * radius) * 360)
+
+def layout_text_on_arc(text, font, center, radius, start_angle, is_bottom=False):
+    """
+    Pure layout step of draw_text_on_arc: computes where every character goes, without drawing.
+    Returns a dict of NumPy arrays with one entry per character:
+    'angle' (degrees of the character center), 'x', 'y' (baseline center on the circle),
+    'rotation' (degrees, PIL counter-clockwise) and 'width', plus the scalars
+    'total_width' and 'total_angle'.
     """
-    draw = ImageDraw.Draw(img)
+    widths = char_advances(font, text)
     
-    # Calculate total width of text
-    total_width = 0
-    char_widths = []
-    for char in text:
-        w = font.getlength(char)
-        char_widths.append(w)
-        total_width += w
+    # Offset of each character center along the baseline
+    ends = np.cumsum(widths)
+    mids = ends - widths / 2
+    total_width = float(ends[-1]) if len(widths) else 0.0
     
     # Circumference at this radius
     circumference = 2 * math.pi * radius
@@ -37,101 +173,92 @@ def draw_text_on_arc(img, text, font, center, radius, start_angle, text_color, i
     # So we start at start_angle + total_angle/2 and decrement.
     
     if is_bottom:
-        current_angle = start_angle + (total_angle / 2)
+        angle = start_angle + (total_angle / 2) - (mids / circumference) * 360
     else:
-        current_angle = start_angle - (total_angle / 2)
-        
-    for i, char in enumerate(text):
-        w = char_widths[i]
-        char_angle_span = (w / circumference) * 360
-        
-        if is_bottom:
-            # For bottom, we go backwards in angle
-            # Center of char
-            mid_angle = current_angle - (char_angle_span / 2)
-            current_angle -= char_angle_span
-        else:
-            # For top, we go forwards
-            mid_angle = current_angle + (char_angle_span / 2)
-            current_angle += char_angle_span
-            
-        # Position
-        # 0 deg = Right, 90 = Down, 270 = Up
-        rad = math.radians(mid_angle)
-        x = center[0] + radius * math.cos(rad)
-        y = center[1] + radius * math.sin(rad)
-        
-        # Rotation
-        # We want the character to be upright relative to the circle center.
-        # Top: At 270, char is upright (0 rot). 
-        # Tangent is horizontal. Normal is vertical.
-        # PIL rotate: Counter-Clockwise.
-        # If we draw char upright, we need to rotate it.
-        # At 270: Rotation should be 0 (if we account for the +90 offset).
-        # Let's say we want the "up" vector of the char to point to center (or away?).
-        # Top text: "Up" points away from center.
-        # Bottom text: "Up" points to center.
-        
-        if is_bottom:
-            # Bottom text (smile). Up points to center.
-            # At 90 deg (bottom), char should be upright (0 rot).
-            # At 180 deg (left), char should be rotated -90 (or 270).
-            # Formula: rotation = mid_angle - 90?
-            # Test: 90 -> 0. 180 -> 90. 0 -> -90.
-            # Wait, PIL rotate is CCW.
-            # If I want to rotate 90 deg CCW (to left), I pass 90.
-            # At 180 (left side of circle), bottom text "A" should be tilted right?
-            # Imagine "Made In". "M" is at left. Top of M points to center.
-            # So M is rotated 90 deg CW? (-90).
-            # Formula: mid_angle + 90?
-            # Test: 90 -> 180 (Upside down). No.
-            # Test: 90 -> 0.
-            # We need rotation such that at 90, it is 0.
-            # rotation = -mid_angle + 90?
-            # At 90: -90 + 90 = 0.
-            # At 180: -180 + 90 = -90 (CW rotation). Correct.
-            rotation = -mid_angle + 90
-        else:
-            # Top text (rainbow). Up points away from center.
-            # At 270 (top), char is upright (0 rot).
-            # At 180 (left), char is rotated -90 (CW).
-            # Formula: rotation = -mid_angle + 270?
-            # Test: 270 -> 0.
-            # Test: 180 -> 90 (CCW).
-            # Wait, at 180 (left), top text "W" should be tilted left (CCW)?
-            # Imagine "We". "W" is at left. Top of W points away.
-            # So W is rotated -90 (CW).
-            # So at 180, we want -90.
-            # -180 + 270 = 90. Incorrect.
-            # -mid_angle - 90?
-            # At 270: -270 - 90 = -360 = 0.
-            # At 180: -180 - 90 = -270 = 90 (CCW).
-            # Let's visualize.
-            # Circle. Top (270). Text "ABC".
-            # B at 270. Upright.
-            # A at 260. Tilted slightly left (CCW).
-            # C at 280. Tilted slightly right (CW).
-            # So as angle increases (260->280), rotation decreases (positive -> negative).
-            # So rotation is proportional to -angle.
-            # At 270, rot = 0.
-            # rot = 270 - angle.
-            # Test: 260 -> 10 (CCW). Correct.
-            # Test: 280 -> -10 (CW). Correct.
-            rotation = 270 - mid_angle
-
-        # Create char image
-        # Make it large enough
-        char_img_size = int(font.size * 3) # Increased buffer
-        char_img = Image.new('RGBA', (char_img_size, char_img_size), (0,0,0,0))
-        char_draw = ImageDraw.Draw(char_img)
-        
-        # Draw char centered using anchor 'ms' (Middle Baseline)
-        # This ensures all characters share the same baseline, preventing vertical jitter.
-        # We place the baseline at the exact center of the image.
-        char_draw.text((char_img_size/2, char_img_size/2), char, font=font, fill=text_color, anchor='ms')
-        
-        # Rotate
-        rotated_char = char_img.rotate(rotation, resample=Image.BICUBIC, expand=True)
+        angle = start_angle - (total_angle / 2) + (mids / circumference) * 360
+    
+    # Position
+    # 0 deg = Right, 90 = Down, 270 = Up
+    rad = np.radians(angle)
+    x = center[0] + radius * np.cos(rad)
+    y = center[1] + radius * np.sin(rad)
+    
+    # Rotation
+    # We want the character to be upright relative to the circle center.
+    # Top: At 270, char is upright (0 rot). 
+    # Tangent is horizontal. Normal is vertical.
+    # PIL rotate: Counter-Clockwise.
+    # If we draw char upright, we need to rotate it.
+    # At 270: Rotation should be 0 (if we account for the +90 offset).
+    # Let's say we want the "up" vector of the char to point to center (or away?).
+    # Top text: "Up" points away from center.
+    # Bottom text: "Up" points to center.
+    
+    if is_bottom:
+        # Bottom text (smile). Up points to center.
+        # At 90 deg (bottom), char should be upright (0 rot).
+        # At 180 deg (left), char should be rotated -90 (or 270).
+        # Formula: rotation = mid_angle - 90?
+        # Test: 90 -> 0. 180 -> 90. 0 -> -90.
+        # Wait, PIL rotate is CCW.
+        # If I want to rotate 90 deg CCW (to left), I pass 90.
+        # At 180 (left side of circle), bottom text "A" should be tilted right?
+        # Imagine "Made In". "M" is at left. Top of M points to center.
+        # So M is rotated 90 deg CW? (-90).
+        # Formula: mid_angle + 90?
+        # Test: 90 -> 180 (Upside down). No.
+        # Test: 90 -> 0.
+        # We need rotation such that at 90, it is 0.
+        # rotation = -mid_angle + 90?
+        # At 90: -90 + 90 = 0.
+        # At 180: -180 + 90 = -90 (CW rotation). Correct.
+        rotation = -angle + 90
+    else:
+        # Top text (rainbow). Up points away from center.
+        # At 270 (top), char is upright (0 rot).
+        # At 180 (left), char is rotated -90 (CW).
+        # Formula: rotation = -mid_angle + 270?
+        # Test: 270 -> 0.
+        # Test: 180 -> 90 (CCW).
+        # Wait, at 180 (left), top text "W" should be tilted left (CCW)?
+        # Imagine "We". "W" is at left. Top of W points away.
+        # So W is rotated -90 (CW).
+        # So at 180, we want -90.
+        # -180 + 270 = 90. Incorrect.
+        # -mid_angle - 90?
+        # At 270: -270 - 90 = -360 = 0.
+        # At 180: -180 - 90 = -270 = 90 (CCW).
+        # Let's visualize.
+        # Circle. Top (270). Text "ABC".
+        # B at 270. Upright.
+        # A at 260. Tilted slightly left (CCW).
+        # C at 280. Tilted slightly right (CW).
+        # So as angle increases (260->280), rotation decreases (positive -> negative).
+        # So rotation is proportional to -angle.
+        # At 270, rot = 0.
+        # rot = 270 - angle.
+        # Test: 260 -> 10 (CCW). Correct.
+        # Test: 280 -> -10 (CW). Correct.
+        rotation = 270 - angle
+    
+    return {
+        'angle': angle,
+        'x': x,
+        'y': y,
+        'rotation': rotation,
+        'width': widths,
+        'total_width': total_width,
+        'total_angle': total_angle,
+    }
+
+def render_arc_layout(img, text, font, layout, text_color):
+    """
+    Raster step of draw_text_on_arc: pastes one rotated glyph sprite per character of a layout.
+    Works for any layout with 'x', 'y' and 'rotation' arrays (see layout_text_on_path).
+    """
+    for char, x, y, rotation in zip(text, layout['x'], layout['y'], layout['rotation']):
+        # Rotated glyph sprite (cached across calls)
+        rotated_char = get_glyph(font, char, text_color, float(rotation))
         
         # Paste
         # (x,y) is the position on the circle.
@@ -144,3 +271,318 @@ def draw_text_on_arc(img, text, font, center, radius, start_angle, text_color, i
         
         img.paste(rotated_char, (px, py), rotated_char)
 
+_font_variants = {}
+
+def font_at_size(font, size):
+    """Returns font at another size, reusing variants that were already loaded."""
+    if size == font.size:
+        return font
+    key = (_font_key(font), size)
+    variant = _font_variants.get(key)
+    if variant is None:
+        variant = font.font_variant(size=size)
+        _font_variants[key] = variant
+    return variant
+
+def fit_font_to_arc(text, font, radius, max_angle, min_size=6, max_size=None, measure=measure_text_on_arc):
+    """
+    Binary-searches the largest font size (in pixels) at which text covers at most
+    max_angle degrees of a circle with the given radius.
+    Only measures text, nothing is rasterized. Returns a font derived from font.
+    Never goes below min_size, even if the text still does not fit there.
+    measure: measure(text, font, radius) -> degrees, measure_text_on_arc by default.
+    """
+    if max_size is None:
+        max_size = max(font.size * 4, min_size)
+    lo, hi = min_size, max_size
+    best = min_size
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if measure(text, font_at_size(font, mid), radius) <= max_angle:
+            best = mid
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return font_at_size(font, best)
+
+def draw_text_on_arc(img, text, font, center, radius, start_angle, text_color, is_bottom=False, engine='glyph', max_angle=None, rtl=False):
+    """
+    Draws text along an arc.
+    start_angle: Angle in degrees where the text should be centered (e.g. 270 for top, 90 for bottom).
+    is_bottom: If True, text is drawn for the bottom of the circle (readable, smile curve).
+    engine: 'glyph' rotates and pastes every character, 'warp' bends one pre-rendered strip (see draw_text_on_arc_warp).
+    max_angle: If set, the font is resized to the largest size whose text spans at most this many degrees.
+    rtl: Text is logical-order Arabic (not pre-reshaped); it is shaped once with shape_rtl.
+    Returns the font that was used.
+    """
+    if engine not in ('glyph', 'warp'):
+        raise ValueError(f"Unknown arc text engine: {engine!r} (expected 'glyph' or 'warp')")
+    
+    glyphs = text
+    if rtl:
+        if arabic_reshaper is None and _raqm_font(font):
+            # No reshaper, but RAQM can shape the whole strip in one go
+            engine = 'warp'
+        else:
+            glyphs = shape_rtl(text, font)
+    
+    if max_angle is not None:
+        if engine == 'warp':
+            # Measure the strip the warp engine draws (RAQM or shape_rtl shaping)
+            measure = lambda t, f, r: measure_text_on_arc_warp(t, f, r, rtl)
+            font = fit_font_to_arc(text, font, radius, max_angle, measure=measure)
+        else:
+            font = fit_font_to_arc(glyphs, font, radius, max_angle)
+    
+    if engine == 'warp':
+        draw_text_on_arc_warp(img, text, font, center, radius, start_angle, text_color, is_bottom, rtl)
+    else:
+        layout = layout_text_on_arc(glyphs, font, center, radius, start_angle, is_bottom)
+        render_arc_layout(img, glyphs, font, layout, text_color)
+    return font
+
+# --- RTL (Arabic) shaping ---
+# Arabic letters change shape depending on their neighbours, so the string has to
+# be shaped as a whole before it can be split into glyphs for the arc.
+SHAPED_RUN_CACHE_SIZE = 256
+
+_shaped_runs = OrderedDict()
+
+def _raqm_font(font):
+    """True if Pillow can shape this font itself (libraqm available and selected)."""
+    return features.check('raqm') and getattr(font, 'layout_engine', None) == ImageFont.Layout.RAQM
+
+def shape_rtl(text, font):
+    """
+    Shapes logical-order RTL text once and returns its clusters in visual (left to right) order.
+    Letters become their joined presentation forms (arabic_reshaper), runs are reordered
+    with python-bidi, and combining marks stay attached to their base letter.
+    Runs are cached per (text, font).
+    """
+    key = (text, _font_key(font))
+    run = _shaped_runs.get(key)
+    if run is not None:
+        _shaped_runs.move_to_end(key)
+        return run
+    
+    if arabic_reshaper is None:
+        raise ImportError("RTL arc text needs arabic_reshaper and python-bidi (pip install arabic-reshaper python-bidi)")
+    
+    clusters = []
+    for char in get_display(arabic_reshaper.reshape(text)):
+        if clusters and unicodedata.combining(char):
+            clusters[-1] += char
+        else:
+            clusters.append(char)
+    run = tuple(clusters)
+    
+    _shaped_runs[key] = run
+    if len(_shaped_runs) > SHAPED_RUN_CACHE_SIZE:
+        _shaped_runs.popitem(last=False)
+    return run
+
+# --- Text on arbitrary paths ---
+# A path is a polyline (N x 2 array of points) plus its cumulative arc length,
+# so placing a glyph at distance s along the path is one binary search.
+
+def path_table(points, closed=False):
+    """
+    Precomputes the arc-length lookup table for a polyline.
+    Returns a dict with 'points' (N x 2), 'length' (cumulative length at every point)
+    and 'closed' (text wraps around instead of running off the end).
+    """
+    points = np.asarray(points, dtype=float)
+    if closed and not np.allclose(points[0], points[-1]):
+        points = np.vstack([points, points[:1]])
+    seg = np.hypot(*np.diff(points, axis=0).T)
+    return {'points': points, 'length': np.concatenate([[0.0], np.cumsum(seg)]), 'closed': closed}
+
+def ellipse_path(center, rx, ry, start_angle=0, end_angle=360, n=720):
+    """
+    Elliptical arc from start_angle to end_angle (degrees, 0 = Right, 90 = Down, same as draw_text_on_arc).
+    Increasing angles run clockwise on screen. A full turn gives a closed path.
+    """
+    t = np.radians(np.linspace(start_angle, end_angle, n))
+    points = np.column_stack([center[0] + rx * np.cos(t), center[1] + ry * np.sin(t)])
+    return path_table(points, closed=abs(end_angle - start_angle) >= 360)
+
+def bezier_path(control_points, n=256):
+    """Bezier curve of any degree (3 points = quadratic, 4 points = cubic)."""
+    cp = np.asarray(control_points, dtype=float)
+    degree = len(cp) - 1
+    t = np.linspace(0, 1, n)[:, None]
+    basis = [math.comb(degree, k) * t ** k * (1 - t) ** (degree - k) for k in range(degree + 1)]
+    return path_table(sum(b * p for b, p in zip(basis, cp)))
+
+def rounded_rect_path(box, radius, n_corner=32):
+    """
+    Border of a rounded rectangle box = (x0, y0, x1, y1), clockwise,
+    starting at the middle of the top edge (so position=0 centers text on top).
+    """
+    x0, y0, x1, y1 = box
+    r = min(radius, (x1 - x0) / 2, (y1 - y0) / 2)
+    a = np.radians(np.linspace(0, 90, n_corner))
+    
+    def corner(cx, cy, start):
+        return np.column_stack([cx + r * np.cos(a + math.radians(start)), cy + r * np.sin(a + math.radians(start))])
+    
+    points = np.vstack([
+        [((x0 + x1) / 2, y0)],
+        corner(x1 - r, y0 + r, 270), # Top right
+        corner(x1 - r, y1 - r, 0),   # Bottom right
+        corner(x0 + r, y1 - r, 90),  # Bottom left
+        corner(x0 + r, y0 + r, 180), # Top left
+    ])
+    return path_table(points, closed=True)
+
+def reverse_path(path):
+    """Same path walked the other way (e.g. readable text along the bottom of a clockwise border)."""
+    return path_table(path['points'][::-1], closed=path['closed'])
+
+def layout_text_on_path(text, font, path, position=0.5, offset=0):
+    """
+    Places text along a path (see path_table) so that its center sits at
+    position (fraction of the path length). Glyphs stand on the left side of the
+    direction of travel, i.e. on the outside of a clockwise path.
+    offset: moves the baseline away from the path, in the glyphs' "up" direction.
+    Returns the same dict of arrays as layout_text_on_arc.
+    """
+    widths = char_advances(font, text)
+    ends = np.cumsum(widths)
+    total_width = float(ends[-1]) if len(widths) else 0.0
+    
+    cum = path['length']
+    path_length = cum[-1]
+    s = position * path_length - total_width / 2 + (ends - widths / 2)
+    if path['closed']:
+        s = s % path_length
+    else:
+        s = np.clip(s, 0, path_length)
+    
+    # O(log n) lookup of the segment holding every glyph center
+    points = path['points']
+    idx = np.clip(np.searchsorted(cum, s, side='right') - 1, 0, len(cum) - 2)
+    seg_len = np.maximum(cum[idx + 1] - cum[idx], 1e-12)
+    t = ((s - cum[idx]) / seg_len)[:, None]
+    pos = points[idx] + (points[idx + 1] - points[idx]) * t
+    
+    tangent = (points[idx + 1] - points[idx]) / seg_len[:, None]
+    heading = np.degrees(np.arctan2(tangent[:, 1], tangent[:, 0]))
+    # "Up" is the tangent turned 90 degrees counter-clockwise on screen
+    normal = np.column_stack([tangent[:, 1], -tangent[:, 0]])
+    pos = pos + normal * offset
+    
+    return {
+        'angle': heading,
+        'x': pos[:, 0],
+        'y': pos[:, 1],
+        'rotation': -heading, # PIL rotates counter-clockwise
+        'width': widths,
+        'total_width': total_width,
+        'total_angle': None,
+    }
+
+def draw_text_on_path(img, text, font, path, text_color, position=0.5, offset=0):
+    """Draws text along any path built with ellipse_path, bezier_path, rounded_rect_path or path_table."""
+    layout = layout_text_on_path(text, font, path, position, offset)
+    render_arc_layout(img, text, font, layout, text_color)
+
+# --- Polar warp engine ---
+WARP_CELL_SIZE = 8 # Mesh cell size in pixels; smaller cells follow the curve more closely
+
+def warp_text(text, font, rtl=False):
+    """(text, ImageDraw text options) of the strip the warp engine renders for text."""
+    if not rtl:
+        return text, {}
+    if _raqm_font(font):
+        return text, {'direction': 'rtl'}
+    return ''.join(shape_rtl(text, font)), {}
+
+def measure_text_on_arc_warp(text, font, radius, rtl=False):
+    """Angle in degrees that the warp engine's strip for text covers on a circle of the given radius."""
+    text, text_options = warp_text(text, font, rtl)
+    return math.degrees(font.getlength(text, **text_options) / radius)
+
+def draw_text_on_arc_warp(img, text, font, center, radius, start_angle, text_color, is_bottom=False, rtl=False):
+    """
+    Draws text along an arc by rendering it once into a flat strip and bending
+    the strip onto the circle with a single Image.transform MESH remap.
+    Produces the same layout as the per-glyph engine, but the work no longer
+    depends on the number of characters, only on the area the arc covers.
+    rtl: Text is logical-order Arabic; shaped by RAQM if available, otherwise with shape_rtl.
+    """
+    text, text_options = warp_text(text, font, rtl)
+    
+    ascent, descent = font.getmetrics()
+    total_width = font.getlength(text, **text_options)
+    if total_width <= 0 or radius <= 0:
+        return
+    
+    # 1. Render the whole string into a horizontal strip
+    pad = 2
+    strip_w = int(math.ceil(total_width)) + pad * 2
+    strip_h = ascent + descent + pad * 2
+    baseline = pad + ascent
+    strip = Image.new('RGBA', (strip_w, strip_h), (0, 0, 0, 0))
+    ImageDraw.Draw(strip).text((pad, baseline), text, font=font, fill=text_color, anchor='ls', **text_options)
+    
+    # 2. Bounding box of the annulus sector the strip lands on
+    # Top text grows outwards (ascent away from center), bottom text grows inwards.
+    if is_bottom:
+        r_min, r_max = radius - ascent - pad, radius + descent + pad
+    else:
+        r_min, r_max = radius - descent - pad, radius + ascent + pad
+    r_min = max(r_min, 0)
+    half_span = (total_width / 2 + pad) / radius
+    theta_c = math.radians(start_angle)
+    
+    thetas = theta_c + np.linspace(-half_span, half_span, 64)
+    radii = np.array([r_min, r_max])
+    xs = center[0] + np.outer(radii, np.cos(thetas))
+    ys = center[1] + np.outer(radii, np.sin(thetas))
+    x0 = max(int(math.floor(xs.min())) - 1, 0)
+    y0 = max(int(math.floor(ys.min())) - 1, 0)
+    x1 = min(int(math.ceil(xs.max())) + 1, img.width)
+    y1 = min(int(math.ceil(ys.max())) + 1, img.height)
+    if x1 <= x0 or y1 <= y0:
+        return
+    
+    # 3. Polar remap of every mesh corner (destination -> strip coordinates)
+    cell = WARP_CELL_SIZE
+    gx = np.append(np.arange(x0, x1, cell), x1)
+    gy = np.append(np.arange(y0, y1, cell), y1)
+    px, py = np.meshgrid(gx, gy)
+    dx = px - center[0]
+    dy = py - center[1]
+    rho = np.hypot(dx, dy)
+    # Angle relative to the text center, wrapped into [-pi, pi)
+    d = (np.arctan2(dy, dx) - theta_c + math.pi) % (2 * math.pi) - math.pi
+    
+    if is_bottom:
+        # Smile: text runs counter-clockwise, "up" points to the center
+        sx = pad + total_width / 2 - d * radius
+        sy = baseline + (rho - radius)
+    else:
+        # Rainbow: text runs clockwise, "up" points away from the center
+        sx = pad + total_width / 2 + d * radius
+        sy = baseline - (rho - radius)
+    
+    # 4. Build the mesh, skipping cells that cannot touch the strip
+    def corners(a):
+        return np.stack([a[:-1, :-1], a[1:, :-1], a[1:, 1:], a[:-1, 1:]])  # ul, ll, lr, ur
+    csx, csy, cd = corners(sx), corners(sy), corners(d)
+    keep = ~((csx.max(0) < 0) | (csx.min(0) > strip_w) | (csy.max(0) < 0) | (csy.min(0) > strip_h))
+    # Cells straddling the far side of the circle would smear the whole strip
+    keep &= (cd.max(0) - cd.min(0)) < math.pi / 2
+    
+    mesh = []
+    for j, i in zip(*np.nonzero(keep)):
+        box = (int(gx[i]) - x0, int(gy[j]) - y0, int(gx[i + 1]) - x0, int(gy[j + 1]) - y0)
+        quad = (csx[0, j, i], csy[0, j, i], csx[1, j, i], csy[1, j, i],
+                csx[2, j, i], csy[2, j, i], csx[3, j, i], csy[3, j, i])
+        mesh.append((box, tuple(float(v) for v in quad)))
+    if not mesh:
+        return
+    
+    warped = strip.transform((x1 - x0, y1 - y0), Image.MESH, mesh, resample=Image.BICUBIC)
+    img.paste(warped, (x0, y0), warped)
@@ -0,0 +1,226 @@
+"""
+Vector (SVG / PDF) backend for the sticker generators.
+
+SvgDocument mirrors the ImageDraw calls the sticker scripts already make
+(ellipse, rectangle, rounded_rectangle, text) plus curved text, embedded
+images and QR codes, all in the same pixel coordinates as the raster canvas.
+The physical size is written into the SVG, so the output prints sharp at any
+size and exports in constant time.
+"""
+from PIL import Image
+from xml.sax.saxutils import escape
+import base64
+import io
+import os
+import sys
+
+# Add current directory to path to import sticker_utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from sticker_utils import layout_text_on_arc, layout_text_on_path, shape_rtl
+
+def _color(color):
+    if color is None:
+        return 'none'
+    if isinstance(color, str):
+        return color
+    return '#%02x%02x%02x' % tuple(color[:3])
+
+def _opacity(color):
+    if isinstance(color, (tuple, list)) and len(color) == 4 and color[3] != 255:
+        return f' fill-opacity="{color[3] / 255:.3f}"'
+    return ''
+
+def _num(v):
+    text = f'{v:.2f}'.rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+def _font_attrs(font):
+    """SVG font attributes matching a PIL font (family, weight, size in canvas pixels)."""
+    try:
+        family, style = font.getname()
+    except AttributeError:
+        family, style = 'sans-serif', 'Regular'
+    weight = ' font-weight="bold"' if 'Bold' in (style or '') else ''
+    return f'font-family="{escape(family)}, Arial, sans-serif"{weight} font-size="{_num(font.size)}"'
+
+def qr_matrix_from_image(img):
+    """
+    Recovers the module matrix (list of rows of bools, True = dark) from a QR code raster
+    such as images/qr_website.png. The module size is taken from the top-left finder
+    pattern, which is always 7 modules wide.
+    Returns (matrix, box) where box is the modules' area as fractions of the image size.
+    """
+    gray = img.convert('L')
+    w, h = gray.size
+    px = gray.load()
+
+    def dark(x, y):
+        return px[x, y] < 128
+
+    # Bounding box of the dark modules
+    bbox = gray.point(lambda v: 255 if v < 128 else 0).getbbox()
+    if bbox is None:
+        raise ValueError("No QR code found in image")
+    x0, y0, x1, y1 = bbox
+
+    run = 0
+    while x0 + run < x1 and dark(x0 + run, y0):
+        run += 1
+    module = run / 7
+    n = round((x1 - x0) / module)
+    if (n - 17) % 4 != 0:
+        raise ValueError(f"Unexpected QR size: {n} modules")
+
+    matrix = [[dark(int(x0 + (c + 0.5) * module), int(y0 + (r + 0.5) * module)) for c in range(n)]
+              for r in range(n)]
+    return matrix, (x0 / w, y0 / h, x1 / w, y1 / h)
+
+class SvgDocument:
+    """
+    Collects vector drawing commands in canvas pixel coordinates.
+    width, height: canvas size in pixels; dpi: resolution those pixels were designed for.
+    """
+    def __init__(self, width, height, dpi=300):
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.elements = []
+
+    # --- Shapes ---
+    def _stroke(self, outline, width):
+        if outline is None or not width:
+            return ''
+        return f' stroke="{_color(outline)}" stroke-width="{_num(width)}"'
+
+    def ellipse(self, box, fill=None, outline=None, width=1):
+        (x0, y0), (x1, y1) = box if len(box) == 2 else ((box[0], box[1]), (box[2], box[3]))
+        # PIL draws the outline inside the box, SVG centers it on the path
+        inset = width / 2 if outline is not None and width else 0
+        self.elements.append(
+            f'<ellipse cx="{_num((x0 + x1) / 2)}" cy="{_num((y0 + y1) / 2)}" '
+            f'rx="{_num((x1 - x0) / 2 - inset)}" ry="{_num((y1 - y0) / 2 - inset)}" '
+            f'fill="{_color(fill)}"{_opacity(fill)}{self._stroke(outline, width)}/>')
+
+    def rectangle(self, box, fill=None, outline=None, width=1, radius=0):
+        (x0, y0), (x1, y1) = box if len(box) == 2 else ((box[0], box[1]), (box[2], box[3]))
+        inset = width / 2 if outline is not None and width else 0
+        rounded = f' rx="{_num(radius)}"' if radius else ''
+        self.elements.append(
+            f'<rect x="{_num(x0 + inset)}" y="{_num(y0 + inset)}" '
+            f'width="{_num(x1 - x0 - 2 * inset)}" height="{_num(y1 - y0 - 2 * inset)}"{rounded} '
+            f'fill="{_color(fill)}"{_opacity(fill)}{self._stroke(outline, width)}/>')
+
+    def rounded_rectangle(self, box, radius=0, fill=None, outline=None, width=1):
+        self.rectangle(box, fill=fill, outline=outline, width=width, radius=radius)
+
+    # --- Text ---
+    def text(self, xy, text, font, fill, anchor='la'):
+        """Straight text; xy and anchor follow ImageDraw.text ('la' = left, ascender)."""
+        x, y = xy
+        ascent, descent = font.getmetrics()
+        h, v = anchor[0], anchor[1]
+        text_anchor = {'l': 'start', 'm': 'middle', 'r': 'end'}[h]
+        baseline = {'a': y + ascent, 's': y, 'd': y - descent, 'm': y + (ascent - descent) / 2}[v]
+        self.elements.append(
+            f'<text x="{_num(x)}" y="{_num(baseline)}" text-anchor="{text_anchor}" '
+            f'{_font_attrs(font)} fill="{_color(fill)}" xml:space="preserve">{escape(text)}</text>')
+
+    def text_on_arc(self, text, font, center, radius, start_angle, fill, is_bottom=False, rtl=False):
+        """Curved text with exactly the glyph positions draw_text_on_arc uses."""
+        glyphs = shape_rtl(text, font) if rtl else text
+        layout = layout_text_on_arc(glyphs, font, center, radius, start_angle, is_bottom)
+        parts = []
+        for glyph, x, y, rotation in zip(glyphs, layout['x'], layout['y'], layout['rotation']):
+            if not glyph.strip():
+                continue
+            parts.append(f'<text transform="translate({_num(x)} {_num(y)}) rotate({_num(-rotation)})">{escape(glyph)}</text>')
+        self.elements.append(
+            f'<g text-anchor="middle" {_font_attrs(font)} fill="{_color(fill)}">' + ''.join(parts) + '</g>')
+
+    def text_on_path(self, text, font, path, fill, position=0.5, offset=0):
+        """Text along a path with exactly the glyph positions draw_text_on_path uses."""
+        layout = layout_text_on_path(text, font, path, position, offset)
+        parts = []
+        for glyph, x, y, rotation in zip(text, layout['x'], layout['y'], layout['rotation']):
+            if not glyph.strip():
+                continue
+            parts.append(f'<text transform="translate({_num(x)} {_num(y)}) rotate({_num(-rotation)})">{escape(glyph)}</text>')
+        self.elements.append(
+            f'<g text-anchor="middle" {_font_attrs(font)} fill="{_color(fill)}">' + ''.join(parts) + '</g>')
+
+    # --- Images ---
+    def image(self, img, box, max_dpi=None):
+        """
+        Embeds a raster image (e.g. the logo) as PNG, scaled to box = (x0, y0, x1, y1).
+        The embedded pixels are capped at max_dpi (default: the document dpi) for the placed size.
+        """
+        x0, y0, x1, y1 = box
+        max_dpi = max_dpi or self.dpi
+        max_w = max(1, round((x1 - x0) / self.dpi * max_dpi))
+        max_h = max(1, round((y1 - y0) / self.dpi * max_dpi))
+        if img.width > max_w or img.height > max_h:
+            img = img.resize((max_w, max_h), Image.LANCZOS)
+        buf = io.BytesIO()
+        img.save(buf, 'PNG', optimize=True)
+        data = base64.b64encode(buf.getvalue()).decode('ascii')
+        self.elements.append(
+            f'<image x="{_num(x0)}" y="{_num(y0)}" width="{_num(x1 - x0)}" height="{_num(y1 - y0)}" '
+            f'preserveAspectRatio="none" href="data:image/png;base64,{data}"/>')
+
+    def qr(self, matrix, box, fill=(0, 0, 0)):
+        """QR code as one path of square modules, scaled to box = (x0, y0, x1, y1)."""
+        x0, y0, x1, y1 = box
+        n = len(matrix)
+        path = []
+        for r, row in enumerate(matrix):
+            c = 0
+            while c < n:
+                if row[c]:
+                    start = c
+                    while c < n and row[c]:
+                        c += 1
+                    path.append(f'M{start} {r}h{c - start}v1h{start - c}z')
+                else:
+                    c += 1
+        self.elements.append(
+            f'<path transform="translate({_num(x0)} {_num(y0)}) scale({_num((x1 - x0) / n)} {_num((y1 - y0) / n)})" '
+            f'fill="{_color(fill)}" shape-rendering="crispEdges" d="{"".join(path)}"/>')
+
+    def qr_from_image(self, img, box):
+        """
+        Vector replacement for pasting a QR raster (modules plus white quiet zone) into box.
+        """
+        x0, y0, x1, y1 = box
+        matrix, (fx0, fy0, fx1, fy1) = qr_matrix_from_image(img)
+        w, h = x1 - x0, y1 - y0
+        self.rectangle((x0, y0, x1, y1), fill=(255, 255, 255))
+        self.qr(matrix, (x0 + fx0 * w, y0 + fy0 * h, x0 + fx1 * w, y0 + fy1 * h))
+
+    def cut_contour(self, contours, name='CutContour', color=(255, 0, 255), width=1):
+        """Closed cut paths (N x 2 point arrays) as a group named like the cutter's spot color."""
+        d = ''.join('M' + 'L'.join(f'{_num(x)} {_num(y)}' for x, y in c) + 'Z' for c in contours)
+        self.elements.append(f'<g id="{name}"><path fill="none" stroke="{_color(color)}" '
+                             f'stroke-width="{_num(width)}" d="{d}"/></g>')
+
+    # --- Output ---
+    def to_string(self):
+        width_mm = self.width / self.dpi * 25.4
+        height_mm = self.height / self.dpi * 25.4
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{_num(width_mm)}mm" height="{_num(height_mm)}mm" '
+            f'viewBox="0 0 {self.width} {self.height}">\n' + '\n'.join(self.elements) + '\n</svg>\n')
+
+    def save(self, path):
+        """Writes the SVG, or a PDF if path ends in .pdf (needs cairosvg)."""
+        if path.lower().endswith('.pdf'):
+            return self.save_pdf(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_string())
+
+    def save_pdf(self, path):
+        try:
+            import cairosvg
+        except (ImportError, OSError): # OSError: cairosvg installed but libcairo missing
+            raise ImportError("PDF export needs cairosvg (pip install cairosvg); SVG export works without it")
+        cairosvg.svg2pdf(bytestring=self.to_string().encode('utf-8'), write_to=path)
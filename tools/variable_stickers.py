@@ -0,0 +1,206 @@
+"""
+Variable-data sticker runs: thousands of stickers, each with its own QR code
+(tracking URL) and serial number, so scans can be attributed per location.
+
+The static part of a catalog sticker (everything but the QR modules) is
+rendered once and pasted into an A4 template sheet once. Each item then only
+pastes its own QR code and draws its serial, and every sheet is saved as soon
+as it is full, so memory stays flat however long the run is. A manifest CSV
+(serial, url, sheet, position) is written alongside the sheets.
+
+Usage:
+  python tools/variable_stickers.py --count 1000 [--start 1]
+      [--url "https://tadweer-tech-sy.org/?s={serial}"] [--serial "TT-{n:06d}"]
+  python tools/variable_stickers.py --csv items.csv      (columns: serial, url)
+Options: --sticker NAME (catalog entry, default tadweer_sticker), --out-dir DIR,
+  --pdf (one streamed multi-page PDF instead of PNG sheets),
+  --serial-offset MM (gap between the QR pad and the serial, default 0.4)
+"""
+from PIL import Image, ImageDraw
+import argparse
+import csv
+import itertools
+import math
+import os
+import sys
+import time
+
+# Add current directory to path to import sticker_engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from sticker_engine import load_catalog, select, compose, display_text, get_font, parse_color, px
+from sticker_utils import SUPERSAMPLE, finish_supersampled
+from qr_encoder import encode, render_matrix, qr_box
+from pdf_writer import PdfWriter
+from generate_sticker_sheet import grid_positions, A4_WIDTH, A4_HEIGHT, BG_COLOR
+
+# Paths
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUT_DIR = os.path.join(root, 'vdp_output')
+
+DEFAULT_URL = "https://tadweer-tech-sy.org/?s={serial}"
+DEFAULT_SERIAL = "TT-{n:06d}"
+
+# --- Items ---
+def numbered_items(count, start=1, url=DEFAULT_URL, serial=DEFAULT_SERIAL):
+    """(serial, url) pairs: serial from the n format, url from the serial / n format."""
+    for n in range(start, start + count):
+        s = serial.format(n=n)
+        yield s, url.format(serial=s, n=n)
+
+def csv_items(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield row['serial'], row['url']
+
+class StickerTemplate:
+    """
+    Static sticker background (QR pad left empty) and where each item's QR and
+    serial go, in final pixels.
+    serial_offset: gap in mm between the QR pad and the serial; the serial is
+    moved up if needed to stay a descent clear of any bottom arc text.
+    """
+    def __init__(self, spec, serial_pt=5, serial_color='#1b5e20', serial_offset=0.4, ec='L', supersample=SUPERSAMPLE):
+        dpi = spec.get('dpi', 300)
+        self.size = px(spec['size'], dpi)
+        c = compose(spec, supersample, blank_qr=True)
+        if not c.qr_boxes:
+            raise ValueError(f"Sticker {spec['name']!r} has no QR element")
+        self.background = finish_supersampled(c.img, (self.size, self.size))
+
+        qx, qy, _, el = c.qr_boxes[0]
+        self.qr_size = px(el['size'], dpi)
+        self.qr_xy = (round(qx / supersample), round(qy / supersample))
+        padding = px(el['background'].get('padding', 0), dpi) if el.get('background') else 0
+        self.font = get_font({'family': 'arial', 'bold': True, 'size_pt': serial_pt}, dpi)
+        # Serial centered just below the QR pad, its baseline kept at least the
+        # arc font's descent above the ink of a bottom arc text (which grows
+        # inwards), measured where the arc is highest under the serial: at the
+        # edges of the QR, which the serial is never wider than
+        top = self.qr_xy[1] + self.qr_size + padding + px(serial_offset, dpi)
+        ascent = self.font.getmetrics()[0]
+        for el in spec['elements']:
+            if el['type'] == 'arc_text' and el.get('bottom', False):
+                font = get_font(el['font'], dpi)
+                ink = -font.getbbox(display_text(el['text'], font, el.get('rtl', False)), anchor='ls')[1]
+                inner = px(el['radius'], dpi) - ink
+                arc_top = self.size // 2 + math.sqrt(max(inner ** 2 - (self.qr_size / 2) ** 2, 0))
+                top = min(top, int(arc_top - font.getmetrics()[1] - ascent))
+        self.serial_xy = (self.qr_xy[0] + self.qr_size // 2, top)
+        self.color = parse_color(serial_color)
+        self.ec = ec
+
+    def stamp(self, sheet, draw, x, y, serial, url):
+        """Per-item part of the sticker whose background sits at (x, y) on sheet."""
+        qr = render_matrix(encode(url, self.ec), self.qr_size, fill=(0, 0, 0), background=(255, 255, 255))
+        sheet.paste(qr, (x + self.qr_xy[0], y + self.qr_xy[1]))
+        draw.text((x + self.serial_xy[0], y + self.serial_xy[1]), serial,
+                  font=self.font, fill=self.color, anchor='mt')
+
+    def stamp_pdf(self, pdf, page, x, y, serial, url):
+        """Same as stamp(), on a PDF page: QR as a 1-bit stencil, serial as a small masked image."""
+        matrix = encode(url, self.ec)
+        offset, module = qr_box(matrix.shape[0], self.qr_size)
+        qx, qy = x + self.qr_xy[0], y + self.qr_xy[1]
+        page.rect(qx, qy, self.qr_size, self.qr_size, (255, 255, 255))
+        side = module * matrix.shape[0]
+        page.stencil(pdf.stencil(matrix), qx + offset, qy + offset, side, side)
+
+        left, top, right, bottom = self.font.getbbox(serial, anchor='mt')
+        text = Image.new('RGBA', (right - left, bottom - top), self.color + (0,))
+        ImageDraw.Draw(text).text((-left, -top), serial, font=self.font, fill=self.color, anchor='mt')
+        page.draw(pdf.image(text), x + self.serial_xy[0] + left, y + self.serial_xy[1] + top,
+                  text.width, text.height)
+
+def chunked(iterable, n):
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, n))
+        if not chunk:
+            return
+        yield chunk
+
+def run(items, template, out_dir=DEFAULT_OUT_DIR, prefix='vdp_sheet', cols=None, rows=None, pdf=False):
+    """
+    Streams items onto A4 sheets (saved one by one as {prefix}_0001.png, ...) and
+    writes manifest.csv. Returns the number of stickers produced.
+    With pdf=True, all sheets go to one streamed {prefix}.pdf instead: the sticker
+    background is embedded once and each item adds only its QR and serial.
+    """
+    # Default grid: as many stickers as fit with ~10% gaps (3 x 4 for 6 cm stickers)
+    cols = cols or int(A4_WIDTH // (template.size * 1.1))
+    rows = rows or int(A4_HEIGHT // (template.size * 1.1))
+    positions = grid_positions(cols, rows, template.size)
+
+    # Static part of a full sheet, composited once
+    sheet_template = Image.new('RGB', (A4_WIDTH, A4_HEIGHT), BG_COLOR)
+    for x, y in positions:
+        sheet_template.paste(template.background, (x, y), template.background)
+
+    os.makedirs(out_dir, exist_ok=True)
+    if pdf:
+        return _run_pdf(items, template, out_dir, prefix, positions)
+    count = 0
+    with open(os.path.join(out_dir, 'manifest.csv'), 'w', newline='', encoding='utf-8') as f:
+        manifest = csv.writer(f)
+        manifest.writerow(['serial', 'url', 'sheet', 'position'])
+        for page, chunk in enumerate(chunked(items, len(positions)), 1):
+            if len(chunk) == len(positions):
+                sheet = sheet_template.copy()
+            else:
+                # Last, partial sheet: only the used cells get a background
+                sheet = Image.new('RGB', (A4_WIDTH, A4_HEIGHT), BG_COLOR)
+                for x, y in positions[:len(chunk)]:
+                    sheet.paste(template.background, (x, y), template.background)
+            draw = ImageDraw.Draw(sheet)
+            name = f'{prefix}_{page:04d}.png'
+            for i, ((serial, url), (x, y)) in enumerate(zip(chunk, positions)):
+                template.stamp(sheet, draw, x, y, serial, url)
+                manifest.writerow([serial, url, name, i + 1])
+            sheet.save(os.path.join(out_dir, name), 'PNG', dpi=(300, 300))
+            count += len(chunk)
+    return count
+
+def _run_pdf(items, template, out_dir, prefix, positions):
+    name = f'{prefix}.pdf'
+    count = 0
+    with open(os.path.join(out_dir, 'manifest.csv'), 'w', newline='', encoding='utf-8') as f, \
+            PdfWriter(os.path.join(out_dir, name), (A4_WIDTH, A4_HEIGHT), dpi=300) as pdf:
+        manifest = csv.writer(f)
+        manifest.writerow(['serial', 'url', 'sheet', 'position'])
+        background = pdf.image(template.background)
+        for page_no, chunk in enumerate(chunked(items, len(positions)), 1):
+            page = pdf.page()
+            for i, ((serial, url), (x, y)) in enumerate(zip(chunk, positions)):
+                page.draw(background, x, y, template.size, template.size)
+                template.stamp_pdf(pdf, page, x, y, serial, url)
+                manifest.writerow([serial, url, f'{name}#{page_no}', i + 1])
+            pdf.add_page(page)
+            count += len(chunk)
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="Variable-data sticker run (unique QR + serial per sticker).")
+    parser.add_argument('--sticker', default='tadweer_sticker', help="catalog sticker to use as background")
+    parser.add_argument('--count', type=int, default=100)
+    parser.add_argument('--start', type=int, default=1)
+    parser.add_argument('--url', default=DEFAULT_URL, help="URL format ({serial}, {n})")
+    parser.add_argument('--serial', default=DEFAULT_SERIAL, help="serial format ({n})")
+    parser.add_argument('--csv', help="CSV with serial,url columns (overrides --count/--url/--serial)")
+    parser.add_argument('--out-dir', default=DEFAULT_OUT_DIR)
+    parser.add_argument('--pdf', action='store_true', help="one multi-page PDF instead of PNG sheets")
+    parser.add_argument('--serial-offset', type=float, default=0.4, help="gap in mm between the QR pad and the serial")
+    args = parser.parse_args()
+
+    specs = select(load_catalog(), [args.sticker])
+    if not specs:
+        sys.exit(f"Unknown sticker: {args.sticker}")
+    template = StickerTemplate(specs[0], serial_offset=args.serial_offset)
+    items = csv_items(args.csv) if args.csv else numbered_items(args.count, args.start, args.url, args.serial)
+
+    start = time.perf_counter()
+    count = run(items, template, args.out_dir, prefix=f'{args.sticker}_vdp', pdf=args.pdf)
+    elapsed = time.perf_counter() - start
+    print(f"{count} stickers in {elapsed:.1f}s ({count / elapsed * 60:.0f}/min) -> {args.out_dir}")
+
+if __name__ == "__main__":
+    main()